@@ -77,6 +77,27 @@ else
     echo "✓ Model downloaded"
 fi
 
+# Quantize the model (Q5_0): smaller on disk and in RAM, faster to load.
+# Murmur picks up the quantized file automatically (see prefer_quantized).
+# The copy is rebuilt whenever the source model is newer, and written to a
+# temp file first so an interrupted run never leaves a truncated model behind.
+QUANT_FILE="$WHISPER_DIR/models/ggml-${MODEL}-q5_0.bin"
+if [ -f "$QUANT_FILE" ] && ! [ "$MODEL_FILE" -nt "$QUANT_FILE" ]; then
+    echo "✓ Quantized model ggml-${MODEL}-q5_0.bin already exists"
+elif [ -x "$WHISPER_DIR/build/bin/whisper-quantize" ]; then
+    echo "→ Quantizing model to Q5_0..."
+    QUANT_TMP="$QUANT_FILE.tmp"
+    if "$WHISPER_DIR/build/bin/whisper-quantize" "$MODEL_FILE" "$QUANT_TMP" q5_0 >/dev/null; then
+        mv -f "$QUANT_TMP" "$QUANT_FILE"
+        echo "✓ Model quantized"
+    else
+        rm -f "$QUANT_TMP"
+        echo "⚠️  Quantization failed; using the unquantized model"
+    fi
+else
+    echo "⚠️  whisper-quantize not built; using the unquantized model"
+fi
+
 # Verify installation
 echo ""
 echo "→ Verifying installation..."
@@ -94,7 +115,11 @@ echo "╔═══════════════════════
 echo "║         Setup Complete!                    ║"
 echo "╚════════════════════════════════════════════╝"
 echo ""
-echo "Model: ggml-${MODEL}.bin"
+if [ -f "$QUANT_FILE" ] && ! [ "$MODEL_FILE" -nt "$QUANT_FILE" ]; then
+    echo "Model: ggml-${MODEL}-q5_0.bin"
+else
+    echo "Model: ggml-${MODEL}.bin"
+fi
 echo "Location: $WHISPER_DIR"
 echo ""
 echo "Next steps:"
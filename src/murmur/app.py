@@ -1,18 +1,27 @@
 """Application entry point for Murmur."""
 
-import subprocess
+import ctypes
+import functools
+import os
+import queue
+import signal
+import sys
 import threading
 import time
+from concurrent.futures import Future
 from enum import Enum
 from pathlib import Path
+from typing import Callable
 
+import numpy as np
 from pynput import keyboard
+from Quartz import CGEventMaskBit, kCGEventFlagsChanged
 
 from .audio import StreamingRecorder
 from .config import Config
 from .inject import StreamingInjector
 from .logger import log
-from .transcribe import StreamingTranscriber, StreamingResult
+from .transcribe import StreamingTranscriber, StreamingResult, load_model
 
 
 class State(Enum):
@@ -31,6 +40,110 @@ SOUNDS = {
     "error": "/System/Library/Sounds/Basso.aiff",
 }
 
+# Sounds that exist on this system (checked once, not on every toggle)
+_AVAILABLE_SOUNDS = {name: path for name, path in SOUNDS.items() if Path(path).exists()}
+
+_AFPLAY = "/usr/bin/afplay"
+# Silence afplay's stdout/stderr without routing through subprocess
+_DEVNULL_ACTIONS = [
+    (os.POSIX_SPAWN_OPEN, 1, os.devnull, os.O_WRONLY, 0),
+    (os.POSIX_SPAWN_OPEN, 2, os.devnull, os.O_WRONLY, 0),
+]
+
+
+def _load_system_sounds() -> tuple[dict[str, int], Callable[[int], None] | None]:
+    """Preload sounds via AudioServices; returns ({name: sound_id}, play_fn).
+
+    Playing a preloaded SystemSoundID is one in-process call, instead of
+    forking afplay and decoding the AIFF on every toggle. Returns ({}, None)
+    if AudioToolbox can't be bound, in which case we fall back to afplay.
+    """
+    try:
+        cf = ctypes.CDLL("/System/Library/Frameworks/CoreFoundation.framework/CoreFoundation")
+        at = ctypes.CDLL("/System/Library/Frameworks/AudioToolbox.framework/AudioToolbox")
+    except OSError:
+        return {}, None
+
+    cf.CFURLCreateFromFileSystemRepresentation.restype = ctypes.c_void_p
+    cf.CFURLCreateFromFileSystemRepresentation.argtypes = [
+        ctypes.c_void_p, ctypes.c_char_p, ctypes.c_long, ctypes.c_bool,
+    ]
+    cf.CFRelease.argtypes = [ctypes.c_void_p]
+    at.AudioServicesCreateSystemSoundID.restype = ctypes.c_int32
+    at.AudioServicesCreateSystemSoundID.argtypes = [
+        ctypes.c_void_p, ctypes.POINTER(ctypes.c_uint32),
+    ]
+    at.AudioServicesPlaySystemSound.restype = None
+    at.AudioServicesPlaySystemSound.argtypes = [ctypes.c_uint32]
+
+    sound_ids = {}
+    for name, path in _AVAILABLE_SOUNDS.items():
+        raw = path.encode()
+        url = cf.CFURLCreateFromFileSystemRepresentation(None, raw, len(raw), False)
+        if not url:
+            continue
+        sound_id = ctypes.c_uint32()
+        status = at.AudioServicesCreateSystemSoundID(url, ctypes.byref(sound_id))
+        cf.CFRelease(url)
+        if status == 0:
+            sound_ids[name] = sound_id.value
+    return sound_ids, at.AudioServicesPlaySystemSound
+
+
+_SYSTEM_SOUND_IDS, _play_system_sound = _load_system_sounds()
+
+# Config hotkey name -> pynput key
+_KEY_MAP = {
+    "alt_r": keyboard.Key.alt_r,
+    "alt_l": keyboard.Key.alt_l,
+    "caps_lock": keyboard.Key.caps_lock,
+    "f8": keyboard.Key.f8,
+    "f9": keyboard.Key.f9,
+    "f10": keyboard.Key.f10,
+}
+
+# Hotkeys that macOS reports only as modifier flag changes, never key down/up
+_MODIFIER_HOTKEYS = {"alt_r", "alt_l", "caps_lock"}
+
+
+# The model is the expensive part and holds no session state, so it is
+# loaded once per process; every app gets its own transcriber around it.
+_load_model = functools.lru_cache(maxsize=1)(load_model)
+
+
+def _load_transcriber(config: Config) -> StreamingTranscriber:
+    """Build a transcriber for config around the (cached) whisper model."""
+    return StreamingTranscriber(
+        model_path=config.model_path,
+        stability_count=config.stability_count,
+        silence_commit_ms=config.silence_commit_ms,
+        prompt_max_words=config.prompt_max_words,
+        overlap_max_words=config.overlap_max_words,
+        min_audio_seconds=config.min_audio_seconds,
+        use_initial_prompt=config.use_initial_prompt,
+        model=_load_model(config.model_path),
+    )
+
+
+def _run_in_background(fn: Callable, *args, name: str) -> Future:
+    """Run fn(*args) on a daemon thread and return a Future for its result.
+
+    Unlike a ThreadPoolExecutor worker, a daemon thread doesn't hold up
+    interpreter exit, so quitting during a model load doesn't hang.
+    """
+    future: Future = Future()
+
+    def run() -> None:
+        if not future.set_running_or_notify_cancel():
+            return
+        try:
+            future.set_result(fn(*args))
+        except BaseException as e:
+            future.set_exception(e)
+
+    threading.Thread(target=run, name=name, daemon=True).start()
+    return future
+
 
 class MurmurApp:
     """Murmur live streaming application."""
@@ -50,7 +163,6 @@ class MurmurApp:
         )
         self.streaming_injector = StreamingInjector(
             max_updates_per_sec=self.config.max_updates_per_sec,
-            max_backspace_chars=self.config.max_backspace_chars,
             keystroke_delay_seconds=self.config.keystroke_delay_seconds,
             backspace_delay_seconds=self.config.backspace_delay_seconds,
         )
@@ -61,29 +173,40 @@ class MurmurApp:
         # Streaming state
         self._streaming_thread: threading.Thread | None = None
         self._streaming_stop = threading.Event()
+        # Reused for every inference window to avoid a large allocation per tick
+        self._window_buf = np.empty(
+            int(16000 * self.config.audio_window_seconds), dtype=np.float32
+        )
+
+        # Sounds play on their own thread, so a fallback afplay run never
+        # blocks the hotkey path
+        self._sound_queue: queue.Queue[str | None] = queue.Queue(maxsize=8)
+        self._sound_thread = threading.Thread(target=self._sound_worker, daemon=True)
+        self._sound_thread.start()
+
+        # Long-lived worker for final-pass transcriptions (fed via queue)
+        self._final_jobs: queue.Queue[np.ndarray | None] = queue.Queue()
+        self._final_worker = threading.Thread(target=self._final_pass_worker, daemon=True)
+        self._final_worker.start()
 
         # Start hotkey listener
         self._start_hotkey_listener()
 
-        # Load model in background thread
-        def load_model():
-            try:
-                transcriber = StreamingTranscriber(
-                    model_path=config.model_path,
-                    stability_count=config.stability_count,
-                    silence_commit_ms=config.silence_commit_ms,
-                    prompt_max_words=config.prompt_max_words,
-                    overlap_max_words=config.overlap_max_words,
-                    min_audio_seconds=config.min_audio_seconds,
-                    use_initial_prompt=config.use_initial_prompt,
-                )
-                self._on_model_loaded(transcriber)
-            except Exception as e:
-                log.error(f"Model load failed: {e}")
-                self._on_model_load_failed(str(e))
+        # Load model in background (cached, so re-creating the app is instant)
+        future = _run_in_background(_load_transcriber, config, name="murmur-loader")
+        future.add_done_callback(self._on_load_done)
+        log.info(
+            f"Murmur starting (hotkey={config.hotkey}, model={config.model_path.name})"
+        )
 
-        threading.Thread(target=load_model, daemon=True).start()
-        log.info(f"Murmur starting (hotkey={config.hotkey}, model={config.model})")
+    def _on_load_done(self, future: Future) -> None:
+        """Route the background model load to the success/failure handler."""
+        try:
+            transcriber = future.result()
+        except Exception as e:
+            self._on_model_load_failed(str(e))
+            return
+        self._on_model_loaded(transcriber)
 
     def _on_model_loaded(self, transcriber: StreamingTranscriber) -> None:
         """Called when model finishes loading."""
@@ -99,17 +222,7 @@ class MurmurApp:
         """Start listening for the configured hotkey."""
         hotkey = self.config.hotkey
 
-        # Map config hotkey to pynput key
-        key_map = {
-            "alt_r": keyboard.Key.alt_r,
-            "alt_l": keyboard.Key.alt_l,
-            "caps_lock": keyboard.Key.caps_lock,
-            "f8": keyboard.Key.f8,
-            "f9": keyboard.Key.f9,
-            "f10": keyboard.Key.f10,
-        }
-
-        target_key = key_map.get(hotkey)
+        target_key = _KEY_MAP.get(hotkey)
         if not target_key:
             log.warning(f"Unknown hotkey '{hotkey}', using Right Option")
             target_key = keyboard.Key.alt_r
@@ -117,32 +230,44 @@ class MurmurApp:
         # Track state and debounce (macOS modifier keys generate multiple events)
         key_state = {"pressed": False}
 
+        # pynput delivers special keys as Key enum singletons, so an identity
+        # check is exact and skips Enum.__eq__ on every keystroke.
         def on_press(key):
-            if key == target_key and not key_state["pressed"]:
+            if key is target_key and not key_state["pressed"]:
                 key_state["pressed"] = True
                 log.debug("Hotkey pressed (down) - triggering toggle")
                 self._toggle()
 
         def on_release(key):
-            if key == target_key and key_state["pressed"]:
+            if key is target_key and key_state["pressed"]:
                 key_state["pressed"] = False
                 log.debug("Hotkey released (up)")
 
         listener = keyboard.Listener(on_press=on_press, on_release=on_release)
+        if sys.platform == "darwin" and hotkey in _MODIFIER_HOTKEYS:
+            # Narrow the event tap to modifier changes so ordinary typing
+            # (including our own injected keystrokes) never calls into Python.
+            # _EVENTS is pynput's private event-tap mask (darwin Listener,
+            # checked against pynput 1.7.6-1.8.x); if a release drops it we
+            # keep the default tap rather than set an attribute nobody reads.
+            if hasattr(listener, "_EVENTS"):
+                listener._EVENTS = CGEventMaskBit(kCGEventFlagsChanged)
+            else:
+                log.debug("pynput Listener has no _EVENTS; using the default event tap")
         listener.daemon = True
         listener.start()
         self._listener = listener
-        log.debug(f"Hotkey listener started for {hotkey} (toggle on press)")
+        log.debug("Hotkey listener started for %s (toggle on press)", hotkey)
 
     def _toggle(self) -> None:
         """Toggle between idle and live streaming states."""
         # Debounce: ignore rapid key repeats (200ms minimum)
-        now = time.time()
+        now = time.monotonic()
         if now - self._last_toggle_time < self.config.toggle_debounce_seconds:
-            log.debug(f"Toggle ignored (debounce: {now - self._last_toggle_time:.3f}s)")
+            log.debug("Toggle ignored (debounce: %.3fs)", now - self._last_toggle_time)
             return
 
-        log.debug(f"Toggle triggered. Current state: {self.state}")
+        log.debug("Toggle triggered. Current state: %s", self.state)
         self._last_toggle_time = now
 
         if self.state == State.LOADING:
@@ -157,16 +282,15 @@ class MurmurApp:
         """Start live streaming transcription."""
         log.info("Live streaming started")
         self._set_state(State.LIVE)
+
+        # Start audio capture first so the mic isn't delayed by anything else
+        self.streaming_recorder.start()
         self._play_sound("start")
 
-        # Reset all streaming components
-        self.streaming_transcriber.reset()
+        # Transcriber is reset by the streaming loop before its first pass
         self.streaming_injector.reset()
         self._streaming_stop.clear()
 
-        # Start audio capture
-        self.streaming_recorder.start()
-
         # Start inference loop in background thread
         self._streaming_thread = threading.Thread(
             target=self._streaming_loop,
@@ -180,89 +304,131 @@ class MurmurApp:
         self._set_state(State.TRANSCRIBING)  # Immediate UI feedback
         self._play_sound("stop")
 
-        # Signal streaming loop to stop
+        # Signal streaming loop to stop (and wake it if waiting for audio)
         self._streaming_stop.set()
+        self.streaming_recorder.wake()
 
         # Wait for streaming thread to finish (with timeout)
         if self._streaming_thread and self._streaming_thread.is_alive():
             self._streaming_thread.join(timeout=1.0)
 
+        # Accidental short press: don't materialize the session audio at all
+        if self.streaming_recorder.sample_count() <= self._min_audio_samples:
+            self.streaming_recorder.cancel()
+            self._set_state(State.IDLE)
+            return
+
         # Get audio for final pass
         if self.config.batch_mode:
             # In batch mode, we only want the un-pruned remainder in the RingBuffer
             full_audio = self.streaming_recorder.get_audio_window()
-            self.streaming_recorder.stop() # Shutdown stream and clear history
+            self.streaming_recorder.cancel() # Shutdown stream and clear history
         else:
             # Original mode: transcribe everything for total session consistency
             full_audio = self.streaming_recorder.stop(as_numpy=True)
 
         if len(full_audio) > self._min_audio_samples:
             # Run final transcription on full audio
-            def final_transcribe():
-                try:
-                    result = self.streaming_transcriber.process_audio(
-                        full_audio,
-                        is_final=True,
-                    )
-                    self._on_streaming_complete(result)
-                except Exception as e:
-                    log.error(f"Final transcription error: {e}")
-                    self._on_streaming_complete(None)
-
-            thread = threading.Thread(target=final_transcribe, daemon=True)
-            thread.start()
+            self._final_jobs.put(full_audio)
         else:
             self._set_state(State.IDLE)
 
+    def _final_pass_worker(self) -> None:
+        """Run queued final transcriptions; a None job stops the worker."""
+        while True:
+            full_audio = self._final_jobs.get()
+            if full_audio is None:
+                return
+            try:
+                result = self.streaming_transcriber.process_audio(
+                    full_audio,
+                    is_final=True,
+                )
+                self._on_streaming_complete(result)
+            except Exception as e:
+                log.error(f"Final transcription error: {e}")
+                self._on_streaming_complete(None)
+
     def _streaming_loop(self) -> None:
         """Background loop that runs inference periodically."""
         log.debug("Streaming inference loop started")
-        last_inference = 0.0
-
-        while not self._streaming_stop.is_set():
-            now = time.time()
-
-            # Check if it's time for inference
-            # Check if it's time for inference
-            # We check MUCH faster in batch mode (0.2s) because we only run the GPU
-            # when silence hit, so the CPU cost remains low.
-            interval = 0.2 if self.config.batch_mode else self.config.inference_interval_seconds
-            
-            if now - last_inference >= interval:
-                is_speaking = self.streaming_recorder.is_speech_active()
-                has_pending = self.streaming_transcriber.pending_text != ""
-                buffer_dur = self.streaming_recorder.buffer_duration
-                silence = self.streaming_recorder.silence_duration()
+        last_inference = 0  # monotonic_ns
+
+        # We check MUCH faster in batch mode (0.2s) because we only run the GPU
+        # when silence hit, so the CPU cost remains low.
+        config = self.config
+        batch_mode = config.batch_mode
+        interval = 0.2 if batch_mode else config.inference_interval_seconds
+        interval_ns = int(interval * 1e9)
+        batch_silence = config.batch_silence_threshold_ms / 1000.0
+        batch_flush_seconds = config.buffer_seconds * 0.9
+        window_seconds = config.audio_window_seconds
+
+        # Bind hot-path lookups once; components don't change while live
+        recorder = self.streaming_recorder
+        transcriber = self.streaming_transcriber
+        stop = self._streaming_stop
+        on_update = self._on_streaming_update
+
+        # Reset here (off the hotkey path) before the first inference
+        transcriber.reset()
+
+        while True:
+            # Sleep until the next inference is due; wakes immediately on stop.
+            timeout = max(0, last_inference + interval_ns - time.monotonic_ns()) / 1e9
+            if stop.wait(timeout=timeout):
+                break
+            # Then block until the audio callback delivers fresh samples;
+            # VAD and silence only change when audio arrives.
+            if not recorder.wait_for_audio(timeout=interval):
+                continue
+            if stop.is_set():
+                break
+            now = time.monotonic_ns()
+
+            if now - last_inference >= interval_ns:
+                is_speaking = recorder.is_speech_active()
+                has_pending = transcriber.pending_text != ""
+                buffer_dur = recorder.buffer_duration
+                silence = recorder.silence_duration()
 
                 should_run = False
-                if self.config.batch_mode:
+                if batch_mode:
                     # In batch mode, we ONLY run if:
                     # 1. We are silent long enough (using dedicated threshold)
                     # 2. OR buffer is getting full (forced flush)
                     # 3. OR pending text exists and user stopped speaking
-                    if silence >= (self.config.batch_silence_threshold_ms / 1000.0):
+                    if silence >= batch_silence:
                         should_run = True
-                    elif buffer_dur >= (self.config.buffer_seconds * 0.9):
+                    elif buffer_dur >= batch_flush_seconds:
                         should_run = True
                     elif has_pending and not is_speaking:
                          should_run = True
                 else:
                     # Original "Live" mode logic
-                    if is_speaking or has_pending or buffer_dur > self.config.audio_window_seconds:
+                    if is_speaking or has_pending or buffer_dur > window_seconds:
                         should_run = True
 
                 if should_run:
-                    audio = self.streaming_recorder.get_audio_window(
-                        self.config.audio_window_seconds
+                    # Read before the window so samples landing mid-copy are
+                    # counted as unheard; the transcriber skips passes with
+                    # nothing new to hear.
+                    sample_count = recorder.sample_count()
+                    audio = recorder.get_audio_window(
+                        window_seconds, out=self._window_buf
                     )
 
                     if len(audio) > self._min_audio_samples:
-                        log.debug(f"Inference: dur={len(audio)/16000:.1f}s, silence={silence:.1f}s, speaking={is_speaking}, pending={has_pending}, batch={self.config.batch_mode}")
+                        log.debug(
+                            "Inference: dur=%.1fs, silence=%.1fs, speaking=%s, pending=%s, batch=%s",
+                            len(audio) / 16000, silence, is_speaking, has_pending, batch_mode,
+                        )
                         
-                        result = self.streaming_transcriber.process_audio(
+                        result = transcriber.process_audio(
                             audio,
                             silence_duration=silence,
                             is_final=False,
+                            sample_count=sample_count,
                         )
 
                         if result:
@@ -270,22 +436,19 @@ class MurmurApp:
                             # to prevent "hearing" the same words again.
                             # The committed text becomes the prompt for the next pass.
                             if (
-                                self.config.consume_audio_on_commit
+                                config.consume_audio_on_commit
                                 and len(result.committed_text) > 0
-                                and result.committed_text != self.streaming_transcriber._last_committed_at_clear
+                                and result.committed_text != transcriber._last_committed_at_clear
                             ):
                                 duration = len(audio) / 16000.0
-                                log.debug(f"Commit detected, pruning {duration:.1f}s from buffer. Prefix: '{result.committed_text[-30:]}'")
-                                self.streaming_recorder.consume_audio(duration)
-                                self.streaming_transcriber._last_committed_at_clear = result.committed_text
+                                log.debug("Commit detected, pruning %.1fs from buffer. Prefix: '%s'", duration, result.committed_text[-30:])
+                                recorder.consume_audio(duration)
+                                transcriber._last_committed_at_clear = result.committed_text
                                 
-                            self._on_streaming_update(result)
+                            on_update(result)
 
                 last_inference = now
 
-            # Sleep briefly to avoid busy-waiting
-            time.sleep(0.05)
-
         log.debug("Streaming inference loop stopped")
 
     def _on_streaming_update(self, result: StreamingResult) -> None:
@@ -295,8 +458,8 @@ class MurmurApp:
 
         # Inject the current full text (diff-based)
         if result.full_text:
-            self.streaming_injector.update(result.full_text)
-            log.debug(f"Live: {result.full_text[:50]}...")
+            self.streaming_injector.submit(result.full_text)
+            log.debug("Live: %s...", result.full_text[:50])
 
     def _on_streaming_complete(self, result: StreamingResult | None) -> None:
         """Handle final transcription completion."""
@@ -312,34 +475,64 @@ class MurmurApp:
     def _set_state(self, state: State) -> None:
         """Update application state."""
         self.state = state
-        log.debug(f"State -> {state.value}")
+        log.debug("State -> %s", state.value)
 
     def _play_sound(self, sound_name: str, wait: bool = False) -> None:
-        """Play a system sound."""
+        """Play a system sound (queued to the sound thread unless waiting)."""
         if not self.config.sound:
             return
+        if wait:
+            self._play_sound_now(sound_name, wait=True)
+            return
+        try:
+            self._sound_queue.put_nowait(sound_name)
+        except queue.Full:
+            log.debug("Sound queue full, dropping %s", sound_name)
+
+    def _sound_worker(self) -> None:
+        """Play queued sounds so the hotkey path never waits on audio."""
+        while True:
+            sound_name = self._sound_queue.get()
+            if sound_name is None:
+                return
+            self._play_sound_now(sound_name)
+
+    def _play_sound_now(self, sound_name: str, wait: bool = False) -> None:
+        """Play a system sound on the calling thread."""
+        sound_id = _SYSTEM_SOUND_IDS.get(sound_name)
+        if sound_id is not None and not wait:
+            _play_system_sound(sound_id)
+            return
 
-        sound_path = SOUNDS.get(sound_name)
-        if sound_path and Path(sound_path).exists():
-            if wait:
-                # Use run for blocking (waits for sound to finish)
-                subprocess.run(
-                    ["afplay", sound_path],
-                    stdout=subprocess.DEVNULL,
-                    stderr=subprocess.DEVNULL,
-                )
-            else:
-                # Fire and forget
-                subprocess.Popen(
-                    ["afplay", sound_path],
-                    stdout=subprocess.DEVNULL,
-                    stderr=subprocess.DEVNULL,
+        sound_path = _AVAILABLE_SOUNDS.get(sound_name)
+        if sound_path:
+            # posix_spawn + waitpid: blocks until the sound finishes (fine on
+            # the sound thread) and reaps afplay, without subprocess's
+            # fork/exec machinery
+            try:
+                pid = os.posix_spawn(
+                    _AFPLAY, ["afplay", sound_path], os.environ,
+                    file_actions=_DEVNULL_ACTIONS,
                 )
+                os.waitpid(pid, 0)
+            except OSError as e:
+                log.debug("afplay failed: %s", e)
 
     def shutdown(self) -> None:
         """Shutdown the application."""
         if self.state == State.LIVE:
             self._stop_live_streaming()
+        self._final_jobs.put(None)
+        try:
+            self._sound_queue.put_nowait(None)
+        except queue.Full:
+            # Worker is stuck behind a backlog; drop one sound for the sentinel
+            try:
+                self._sound_queue.get_nowait()
+            except queue.Empty:
+                pass
+            self._sound_queue.put_nowait(None)
+        self._sound_thread.join(timeout=1.0)
         if getattr(self, "_listener", None):
             self._listener.stop()
         log.info("Murmur shutting down")
@@ -367,8 +560,8 @@ def main():
 
         app = MurmurApp(config)
         try:
-            while True:
-                time.sleep(1)
+            # Block until Ctrl-C without waking the main thread
+            signal.pause()
         except KeyboardInterrupt:
             print("\nStopping Murmur...")
         finally:
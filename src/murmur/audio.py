@@ -3,73 +3,171 @@
 import io
 import wave
 import threading
-import time
-from collections import deque
-from typing import Optional, Callable
+from typing import Optional, Callable, Iterator
 
 import numpy as np
 import sounddevice as sd
 
+# int16 PCM -> float32 [-1, 1) scale
+_INT16_SCALE = 1.0 / 32768
+
 
 class RingBuffer:
-    """Thread-safe ring buffer for audio samples."""
+    """Single-producer/single-consumer ring buffer for audio samples.
+
+    Samples live in one preallocated array (float32 by default). The producer (audio
+    callback) only advances `_head`; the consumer (inference loop) only
+    advances `_start` via prune/clear. Reads take no lock: they copy out of
+    the ring and retry if the producer overwrote the region mid-copy.
+
+    With `keep_history=True` samples go into a list of fixed-size blocks
+    (`max_seconds` each) instead of wrapping, so the buffer also holds every
+    sample since reset() and the window is just its newest `max_seconds`.
+    A full block is never copied: the producer starts a new one, and only
+    history() joins them. Nothing is overwritten in that mode, and reset()
+    keeps the blocks so later sessions reuse the capacity. StreamingRecorder
+    uses it because the final pass needs the whole session; the default
+    wrap-around mode remains for callers that only ever need the window and
+    want memory bounded by `max_seconds`.
+    """
 
-    def __init__(self, max_seconds: float, sample_rate: int = 16000):
+    def __init__(
+        self,
+        max_seconds: float,
+        sample_rate: int = 16000,
+        dtype: np.dtype = np.float32,
+        keep_history: bool = False,
+    ):
         self.max_samples = int(max_seconds * sample_rate)
         self.sample_rate = sample_rate
-        self._buffer: deque[np.ndarray] = deque()
-        self._total_samples = 0
-        self._lock = threading.Lock()
+        self.keep_history = keep_history
+        self._ring = np.zeros(max(1, self.max_samples), dtype=dtype)
+        self._blocks = [self._ring]  # keep_history storage; block i starts at i * len(_ring)
+        self._head = 0      # Absolute index one past the newest sample
+        self._reserved = 0  # Head the producer is currently writing towards
+        self._start = 0     # Absolute index of the oldest unconsumed sample
+        self._lock = threading.Lock()  # Serializes producers only
 
     def append(self, chunk: np.ndarray) -> None:
-        """Add audio chunk, discarding oldest if over capacity."""
-        with self._lock:
-            self._buffer.append(chunk.copy())
-            self._total_samples += len(chunk)
-            # Trim oldest chunks if over capacity
-            while self._total_samples > self.max_samples and self._buffer:
-                oldest = self._buffer.popleft()
-                self._total_samples -= len(oldest)
-
-    def get_audio(self, last_seconds: Optional[float] = None) -> np.ndarray:
-        """Get audio from buffer (last N seconds or all)."""
+        """Add audio chunk, overwriting the oldest samples if over capacity."""
         with self._lock:
-            if not self._buffer:
-                return np.array([], dtype=np.float32)
-            audio = np.concatenate(list(self._buffer))
+            if self.keep_history:
+                self._append_history(chunk)
+                return
+            capacity = len(self._ring)
+            end = self._head + len(chunk)
+            if len(chunk) > capacity:
+                chunk = chunk[-capacity:]
+            self._reserved = end
+            pos = (end - len(chunk)) % capacity
+            first = min(len(chunk), capacity - pos)
+            self._ring[pos:pos + first] = chunk[:first]
+            self._ring[:len(chunk) - first] = chunk[first:]
+            self._head = end
+
+    def _append_history(self, chunk: np.ndarray) -> None:
+        """Append without wrapping, adding a block when the last one fills."""
+        size = len(self._ring)
+        head = self._head
+        end = head + len(chunk)
+        while len(self._blocks) * size < end:
+            self._blocks.append(np.empty(size, dtype=self._ring.dtype))
+        self._reserved = end
+        for block, span in self._block_spans(head, end):
+            block[:] = chunk[span]
+        self._head = end
+
+    def _block_spans(
+        self, first: int, last: int
+    ) -> Iterator[tuple[np.ndarray, slice]]:
+        """Yield (block view, offset slice) pairs covering samples [first, last)."""
+        size = len(self._ring)
+        pos = first
+        while pos < last:
+            index, offset = divmod(pos, size)
+            k = min(last - pos, size - offset)
+            yield self._blocks[index][offset:offset + k], slice(pos - first, pos - first + k)
+            pos += k
+
+    def get_audio(
+        self,
+        last_seconds: Optional[float] = None,
+        out: Optional[np.ndarray] = None,
+    ) -> np.ndarray:
+        """Get audio from buffer (last N seconds or all).
+
+        Args:
+            last_seconds: Only return the newest N seconds.
+            out: Optional preallocated array. If large enough, samples are
+                written (and cast) into it and a view of the filled prefix is
+                returned; otherwise a new array of the same dtype is used.
+        """
+        while True:
+            head = self._head
+            ring = self._ring
+            n = head - self._window_start(head)
             if last_seconds is not None:
-                max_samples = int(last_seconds * self.sample_rate)
-                if len(audio) > max_samples:
-                    audio = audio[-max_samples:]
-            return audio
+                n = min(n, int(last_seconds * self.sample_rate))
+            if out is None or len(out) < n:
+                dtype = self._ring.dtype if out is None else out.dtype
+                out = np.empty(n, dtype=dtype)
+            first = head - n
+            if self.keep_history:
+                # Blocks below head are complete and never overwritten
+                for block, span in self._block_spans(first, head):
+                    out[span] = block
+                return out[:n]
+            capacity = len(ring)
+            pos = first % capacity
+            k = min(n, capacity - pos)
+            out[:k] = ring[pos:pos + k]
+            out[k:n] = ring[:n - k]
+            # If the producer lapped into the region we copied, retry
+            if first >= self._reserved - self.max_samples:
+                return out[:n]
 
     def prune(self, seconds: float) -> None:
         """Remove oldest N seconds from the buffer."""
-        with self._lock:
-            samples_to_remove = int(seconds * self.sample_rate)
-            while samples_to_remove > 0 and self._buffer:
-                chunk = self._buffer[0]
-                if len(chunk) <= samples_to_remove:
-                    self._buffer.popleft()
-                    self._total_samples -= len(chunk)
-                    samples_to_remove -= len(chunk)
-                else:
-                    # Partial chunk removal
-                    self._buffer[0] = chunk[samples_to_remove:].copy()
-                    self._total_samples -= samples_to_remove
-                    samples_to_remove = 0
+        head = self._head
+        start = self._window_start(head)
+        self._start = min(head, start + int(seconds * self.sample_rate))
 
     def clear(self) -> None:
         """Clear the buffer."""
-        with self._lock:
-            self._buffer.clear()
-            self._total_samples = 0
+        self._start = self._head
+
+    def reset(self) -> None:
+        """Forget all samples, including history. Producer must be stopped.
+
+        History blocks are kept, so the next session only allocates once it
+        outgrows the longest one so far.
+        """
+        self._head = self._reserved = self._start = 0
+
+    def history(self) -> np.ndarray:
+        """Copy of every sample since reset() (keep_history mode only).
+
+        Only valid while the producer is stopped.
+        """
+        out = np.empty(self._head, dtype=self._ring.dtype)
+        for block, span in self._block_spans(0, self._head):
+            out[span] = block
+        return out
+
+    @property
+    def total_samples(self) -> int:
+        """Samples appended since reset()."""
+        return self._head
+
+    def _window_start(self, head: int) -> int:
+        """Absolute index of the oldest sample still held for a given head."""
+        return max(self._start, head - self.max_samples)
 
     @property
     def duration(self) -> float:
         """Current buffer duration in seconds."""
-        with self._lock:
-            return self._total_samples / self.sample_rate
+        head = self._head
+        return (head - self._window_start(head)) / self.sample_rate
 
 
 class VAD:
@@ -84,21 +182,25 @@ class VAD:
         self.threshold = threshold
         self.speech_pad_samples = int(speech_pad_ms * sample_rate / 1000)
         self.sample_rate = sample_rate
-        self._last_speech_time = 0.0
+        self._samples_since_speech = 0  # Audio clock, not wall clock
         self._is_speaking = False
 
     def process(self, audio: np.ndarray) -> bool:
         """Check if audio contains speech. Returns True if speech detected."""
         if len(audio) == 0:
             return False
-        rms = np.sqrt(np.mean(audio**2))
-        now = time.time()
+        # Single-pass sum of squares in float64, no chunk-sized temporary
+        mean_sq = np.einsum("i,i->", audio, audio, dtype=np.float64) / len(audio)
+        if audio.dtype == np.int16:
+            mean_sq *= _INT16_SCALE * _INT16_SCALE
+        rms = np.sqrt(mean_sq)
         if rms > self.threshold:
-            self._last_speech_time = now
+            self._samples_since_speech = 0
             self._is_speaking = True
             return True
+        self._samples_since_speech += len(audio)
         # Pad silence after speech
-        if self._is_speaking and (now - self._last_speech_time) < (self.speech_pad_samples / self.sample_rate):
+        if self._is_speaking and self._samples_since_speech < self.speech_pad_samples:
             return True
         self._is_speaking = False
         return False
@@ -107,11 +209,11 @@ class VAD:
         """How long since last speech detected."""
         if self._is_speaking:
             return 0.0
-        return time.time() - self._last_speech_time
+        return self._samples_since_speech / self.sample_rate
 
     def reset(self) -> None:
         """Reset VAD state."""
-        self._last_speech_time = time.time()
+        self._samples_since_speech = 0
         self._is_speaking = False
 
     @property
@@ -125,16 +227,20 @@ class StreamingRecorder:
 
     SAMPLE_RATE = 16000
     CHANNELS = 1
+    DTYPE = np.int16  # Captured, buffered and written to WAV as int16 PCM
 
     def __init__(
         self,
         buffer_seconds: float = 12.0,
         vad_threshold: float = 0.01,
         vad_speech_pad_ms: int = 300,
-        audio_chunk_ms: int = 100,
+        audio_chunk_ms: int = 0,
         on_audio_chunk: Optional[Callable[[np.ndarray], None]] = None,
     ):
-        self.ring_buffer = RingBuffer(buffer_seconds, self.SAMPLE_RATE)
+        # One store for both the inference window and the final-pass audio
+        self.ring_buffer = RingBuffer(
+            buffer_seconds, self.SAMPLE_RATE, self.DTYPE, keep_history=True
+        )
         self.vad = VAD(
             threshold=vad_threshold,
             speech_pad_ms=vad_speech_pad_ms,
@@ -144,7 +250,7 @@ class StreamingRecorder:
         self._recording = False
         self._stream: Optional[sd.InputStream] = None
         self._lock = threading.Lock()
-        self._full_buffer: list[np.ndarray] = []  # Keep all audio for final pass
+        self._audio_ready = threading.Event()  # Set by the callback per chunk
         self._audio_chunk_ms = audio_chunk_ms
 
     def start(self) -> None:
@@ -152,17 +258,18 @@ class StreamingRecorder:
         with self._lock:
             if self._recording:
                 return
-            self.ring_buffer.clear()
+            self.ring_buffer.reset()
             self.vad.reset()
-            self._full_buffer = []
             self._recording = True
             self._stream = sd.InputStream(
                 samplerate=self.SAMPLE_RATE,
                 channels=self.CHANNELS,
-                dtype=np.float32,
+                dtype=self.DTYPE,
                 callback=self._audio_callback,
+                # 0 lets CoreAudio deliver its natural period (variable size);
+                # everything downstream works on len(chunk)
                 blocksize=max(
-                    1, int(self.SAMPLE_RATE * (self._audio_chunk_ms / 1000.0))
+                    0, int(self.SAMPLE_RATE * (self._audio_chunk_ms / 1000.0))
                 ),
             )
             self._stream.start()
@@ -171,33 +278,83 @@ class StreamingRecorder:
         """Stop recording and return full audio.
 
         Args:
-            as_numpy: If True, return float32 numpy array. If False, return WAV bytes.
+            as_numpy: If True, return a 1-D C-contiguous float32 numpy array
+                in [-1, 1) (safe to hand to the transcriber without a copy).
+                If False, return WAV bytes of the captured int16 PCM.
         """
         with self._lock:
             if not self._recording:
                 return np.array([], dtype=np.float32) if as_numpy else b""
-            self._recording = False
-            if self._stream:
-                self._stream.stop()
-                self._stream.close()
-                self._stream = None
-            if not self._full_buffer:
-                return np.array([], dtype=np.float32) if as_numpy else b""
-            audio = np.concatenate(self._full_buffer)
-            self._full_buffer = []
-            return audio if as_numpy else self._to_wav(audio)
+            self._close_stream()
+            pcm = self.ring_buffer.history()
+            if not len(pcm):
+                audio = np.array([], dtype=np.float32) if as_numpy else b""
+            elif not as_numpy:
+                audio = self._pcm_to_wav(pcm)
+            else:
+                audio = np.multiply(pcm, _INT16_SCALE, dtype=np.float32)
+            # Both results are copies; the blocks are reused next session
+            self.ring_buffer.reset()
+            return audio
+
+    def cancel(self) -> None:
+        """Stop recording and discard captured audio without materializing it."""
+        with self._lock:
+            if not self._recording:
+                return
+            self._close_stream()
+            self.ring_buffer.reset()
+
+    def _close_stream(self) -> None:
+        """Stop and close the input stream. Caller must hold the lock.
+
+        Stopping the stream waits for any in-flight callback to finish.
+        """
+        self._recording = False
+        if self._stream:
+            self._stream.stop()
+            self._stream.close()
+            self._stream = None
+
+    def sample_count(self) -> int:
+        """Number of samples captured since recording started."""
+        return self.ring_buffer.total_samples
+
+    def wait_for_audio(self, timeout: Optional[float] = None) -> bool:
+        """Block until the callback delivers new audio (or wake() is called).
 
-    def get_audio_window(self, last_seconds: Optional[float] = None) -> np.ndarray:
-        """Get audio from ring buffer for inference."""
-        return self.ring_buffer.get_audio(last_seconds)
+        Returns False if the timeout elapsed with no new audio.
+        """
+        ready = self._audio_ready.wait(timeout)
+        self._audio_ready.clear()
+        return ready
+
+    def wake(self) -> None:
+        """Release a thread blocked in wait_for_audio()."""
+        self._audio_ready.set()
+
+    def get_audio_window(
+        self,
+        last_seconds: Optional[float] = None,
+        out: Optional[np.ndarray] = None,
+    ) -> np.ndarray:
+        """Get float32 audio from ring buffer for inference (optionally into `out`).
+
+        Only this window is converted from int16, not the whole stream.
+        """
+        if out is None:
+            out = np.empty(0, dtype=np.float32)
+        audio = self.ring_buffer.get_audio(last_seconds, out=out)
+        audio *= _INT16_SCALE
+        return audio
 
     def consume_audio(self, seconds: float) -> None:
         """Remove old audio from the buffer (it has been transcribed)."""
         if seconds <= 0:
             return
-        with self._lock:
-            self.ring_buffer.prune(seconds)
-            # DO NOT reset VAD here, as it causes timestamp jumps
+        # Consumer side of the SPSC ring, no lock needed
+        self.ring_buffer.prune(seconds)
+        # DO NOT reset VAD here, as it causes timestamp jumps
 
     def is_speech_active(self) -> bool:
         """Check if speech is currently detected."""
@@ -210,26 +367,29 @@ class StreamingRecorder:
     def _audio_callback(
         self, indata: np.ndarray, frames: int, time_info, status
     ) -> None:
-        """Audio stream callback."""
-        chunk = indata[:, 0] if indata.ndim > 1 else indata.flatten()
-        with self._lock:
-            if not self._recording:
-                return
-            self.ring_buffer.append(chunk)
-            self._full_buffer.append(chunk.copy())
-            self.vad.process(chunk)
+        """Audio stream callback.
+
+        Runs lock-free: PortAudio calls it from a single thread, and stop()
+        only reads the session buffer after the stream has been stopped.
+        """
+        # InputStream always delivers (frames, channels); take the mono column
+        chunk = indata[:, 0]
+        if not self._recording:
+            return
+        self.ring_buffer.append(chunk)  # The only copy out of PortAudio's buffer
+        self.vad.process(chunk)
+        self._audio_ready.set()
         if self._on_audio_chunk:
             self._on_audio_chunk(chunk)
 
-    def _to_wav(self, audio: np.ndarray) -> bytes:
-        """Convert float32 audio to WAV bytes."""
-        audio_int16 = (audio * 32767).astype(np.int16)
+    def _pcm_to_wav(self, pcm: np.ndarray) -> bytes:
+        """Wrap int16 PCM samples in a WAV container."""
         buffer = io.BytesIO()
         with wave.open(buffer, "wb") as wf:
             wf.setnchannels(self.CHANNELS)
             wf.setsampwidth(2)
             wf.setframerate(self.SAMPLE_RATE)
-            wf.writeframes(audio_int16.tobytes())
+            wf.writeframes(pcm)  # Buffer protocol, no tobytes() copy
         return buffer.getvalue()
 
     @property
@@ -3,26 +3,104 @@
 import os
 from dataclasses import dataclass
 from pathlib import Path
-
-try:
-    import tomllib
-except ImportError:
-    import tomli as tomllib
-
-
-@dataclass
+from types import MappingProxyType
+
+from .logger import log
+
+# User-facing hotkey names -> pynput key names
+_HOTKEY_ALIASES = MappingProxyType({
+    "right_option": "alt_r",
+    "right_alt": "alt_r",
+    "left_option": "alt_l",
+    "left_alt": "alt_l",
+    "caps_lock": "caps_lock",
+    "f8": "f8",
+    "f9": "f9",
+    "f10": "f10",
+})
+
+
+def _normalize_hotkey(key: str) -> str:
+    """Normalize hotkey names to pynput format."""
+    key = key.lower()
+    return _HOTKEY_ALIASES.get(key, key)
+
+
+def _expand_path(value: str) -> Path:
+    """Config paths may use ~."""
+    return Path(value).expanduser()
+
+
+_MISSING = object()
+
+# (section, ((key, converter), ...)) for every file-configurable field.
+# Keys match Config attribute names; a None converter stores the raw value.
+_FILE_FIELDS = (
+    ("murmur", (
+        ("hotkey", _normalize_hotkey),
+        ("model", None),
+        ("prefer_quantized", None),
+        ("sound", None),
+        ("toggle_debounce_seconds", float),
+        ("whisper_path", _expand_path),
+    )),
+    ("streaming", (
+        ("buffer_seconds", float),
+        ("audio_window_seconds", float),
+        ("inference_interval_seconds", float),
+        ("audio_chunk_ms", int),
+        ("min_audio_seconds", float),
+        ("vad_threshold", float),
+        ("vad_speech_pad_ms", int),
+        ("stability_count", int),
+        ("silence_commit_ms", int),
+        ("prompt_max_words", int),
+        ("overlap_max_words", int),
+        ("use_initial_prompt", bool),
+        ("consume_audio_on_commit", bool),
+        ("batch_mode", bool),
+        ("batch_silence_threshold_ms", int),
+    )),
+    ("injector", (
+        ("max_updates_per_sec", int),
+        ("keystroke_delay_seconds", float),
+        ("backspace_delay_seconds", float),
+    )),
+)
+
+# Candidate config files, in merge order (later overrides earlier).
+# Resolved once at import; none of these can change while running.
+_REPO_ROOT = Path(__file__).resolve().parents[2]
+_HOME_CONFIG_DIR = Path.home() / ".config" / "murmur"
+_CONFIG_PATHS = (
+    _REPO_ROOT / "murmur.toml",
+    _REPO_ROOT / "murmur.conf",  # Legacy support
+    _HOME_CONFIG_DIR / "murmur.toml",
+    _HOME_CONFIG_DIR / "config.toml",
+    _HOME_CONFIG_DIR / "murmur.conf",
+)
+
+# Suffix of the quantized model setup.sh produces next to the f16 model
+_QUANTIZED_SUFFIX = "-q5_0"
+
+# Parsed TOML per path, keyed by (mtime_ns, size) so edits are picked up
+_TOML_CACHE: dict[Path, tuple[tuple[int, int], dict]] = {}
+
+
+@dataclass(slots=True)
 class Config:
     """Murmur configuration."""
 
     hotkey: str = "alt_r"  # pynput key name for Right Option
     model: str = "small.en"
+    prefer_quantized: bool = True  # Load setup.sh's Q5_0 copy when it is current
     sound: bool = True
     toggle_debounce_seconds: float = 0.2
 
     buffer_seconds: float = 12.0
     audio_window_seconds: float = 10.0
     inference_interval_seconds: float = 0.5
-    audio_chunk_ms: int = 100
+    audio_chunk_ms: int = 0  # 0 = let the audio host choose the block size
     min_audio_seconds: float = 0.1
     vad_threshold: float = 0.01
     vad_speech_pad_ms: int = 300
@@ -36,7 +114,6 @@ class Config:
     batch_silence_threshold_ms: int = 500
 
     max_updates_per_sec: int = 4
-    max_backspace_chars: int = 30
     keystroke_delay_seconds: float = 0.002
     backspace_delay_seconds: float = 0.001
 
@@ -49,121 +126,95 @@ class Config:
 
         data: dict = {}
         for path in cls._config_paths():
-            data = cls._merge_dicts(data, cls._load_toml(path))
-
-        murmur_config = data.get("murmur", {})
-        streaming_config = data.get("streaming", {})
-        injector_config = data.get("injector", {})
-
-        if "hotkey" in murmur_config:
-            config.hotkey = cls._normalize_hotkey(murmur_config["hotkey"])
-        if "model" in murmur_config:
-            config.model = murmur_config["model"]
-        if "sound" in murmur_config:
-            config.sound = murmur_config["sound"]
-        if "toggle_debounce_seconds" in murmur_config:
-            config.toggle_debounce_seconds = float(murmur_config["toggle_debounce_seconds"])
-        if "whisper_path" in murmur_config:
-            config.whisper_path = Path(murmur_config["whisper_path"]).expanduser()
-
-        if "buffer_seconds" in streaming_config:
-            config.buffer_seconds = float(streaming_config["buffer_seconds"])
-        if "audio_window_seconds" in streaming_config:
-            config.audio_window_seconds = float(streaming_config["audio_window_seconds"])
-        if "inference_interval_seconds" in streaming_config:
-            config.inference_interval_seconds = float(streaming_config["inference_interval_seconds"])
-        if "audio_chunk_ms" in streaming_config:
-            config.audio_chunk_ms = int(streaming_config["audio_chunk_ms"])
-        if "min_audio_seconds" in streaming_config:
-            config.min_audio_seconds = float(streaming_config["min_audio_seconds"])
-        if "vad_threshold" in streaming_config:
-            config.vad_threshold = float(streaming_config["vad_threshold"])
-        if "vad_speech_pad_ms" in streaming_config:
-            config.vad_speech_pad_ms = int(streaming_config["vad_speech_pad_ms"])
-        if "stability_count" in streaming_config:
-            config.stability_count = int(streaming_config["stability_count"])
-        if "silence_commit_ms" in streaming_config:
-            config.silence_commit_ms = int(streaming_config["silence_commit_ms"])
-        if "prompt_max_words" in streaming_config:
-            config.prompt_max_words = int(streaming_config["prompt_max_words"])
-        if "overlap_max_words" in streaming_config:
-            config.overlap_max_words = int(streaming_config["overlap_max_words"])
-        if "use_initial_prompt" in streaming_config:
-            config.use_initial_prompt = bool(streaming_config["use_initial_prompt"])
-        if "consume_audio_on_commit" in streaming_config:
-            config.consume_audio_on_commit = bool(streaming_config["consume_audio_on_commit"])
-        if "batch_mode" in streaming_config:
-            config.batch_mode = bool(streaming_config["batch_mode"])
-        if "batch_silence_threshold_ms" in streaming_config:
-            config.batch_silence_threshold_ms = int(streaming_config["batch_silence_threshold_ms"])
-
-        if "max_updates_per_sec" in injector_config:
-            config.max_updates_per_sec = int(injector_config["max_updates_per_sec"])
-        if "max_backspace_chars" in injector_config:
-            config.max_backspace_chars = int(injector_config["max_backspace_chars"])
-        if "keystroke_delay_seconds" in injector_config:
-            config.keystroke_delay_seconds = float(injector_config["keystroke_delay_seconds"])
-        if "backspace_delay_seconds" in injector_config:
-            config.backspace_delay_seconds = float(injector_config["backspace_delay_seconds"])
+            cls._merge_dicts(data, cls._load_toml(path))
+
+        for section, fields in _FILE_FIELDS:
+            table = data.get(section)
+            if not table:
+                continue
+            for key, convert in fields:
+                value = table.get(key, _MISSING)
+                if value is not _MISSING:
+                    setattr(config, key, convert(value) if convert else value)
+
+        if "max_backspace_chars" in (data.get("injector") or {}):
+            log.warning(
+                "[injector] max_backspace_chars is deprecated and ignored; "
+                "remove it from your config"
+            )
 
         # Environment variables override config file
-        if env_hotkey := os.environ.get("MURMUR_HOTKEY"):
-            config.hotkey = cls._normalize_hotkey(env_hotkey)
-        if env_model := os.environ.get("MURMUR_MODEL"):
+        env = os.environ
+        if env_hotkey := env.get("MURMUR_HOTKEY"):
+            config.hotkey = _normalize_hotkey(env_hotkey)
+        if env_model := env.get("MURMUR_MODEL"):
             config.model = env_model
-        if env_sound := os.environ.get("MURMUR_SOUND"):
+        if env_sound := env.get("MURMUR_SOUND"):
             config.sound = env_sound.lower() not in ("false", "0", "no")
 
         return config
 
-    @staticmethod
-    def _normalize_hotkey(key: str) -> str:
-        """Normalize hotkey names to pynput format."""
-        mappings = {
-            "right_option": "alt_r",
-            "right_alt": "alt_r",
-            "left_option": "alt_l",
-            "left_alt": "alt_l",
-            "caps_lock": "caps_lock",
-            "f8": "f8",
-            "f9": "f9",
-            "f10": "f10",
-        }
-        return mappings.get(key.lower(), key.lower())
+    _normalize_hotkey = staticmethod(_normalize_hotkey)
 
     @staticmethod
     def _load_toml(path: Path) -> dict:
-        if not path.exists():
+        try:
+            st = path.stat()
+        except OSError:  # Missing, or a parent is not a directory
             return {}
+        key = (st.st_mtime_ns, st.st_size)
+        cached = _TOML_CACHE.get(path)
+        if cached is not None and cached[0] == key:
+            return cached[1]
+        import tomllib  # Lazy: only paid when a config file actually exists
+
         with open(path, "rb") as f:
-            return tomllib.load(f)
+            data = tomllib.load(f)
+        _TOML_CACHE[path] = (key, data)
+        return data
 
     @staticmethod
     def _merge_dicts(base: dict, override: dict) -> dict:
-        merged = dict(base)
+        """Merge override into base in place and return base.
+
+        Nested dicts from override are merged into fresh dicts rather than
+        aliased, so base never shares (and later mutates) the caller's tables,
+        e.g. the cached TOML data.
+        """
         for key, value in override.items():
-            if (
-                key in merged
-                and isinstance(merged[key], dict)
-                and isinstance(value, dict)
-            ):
-                merged[key] = Config._merge_dicts(merged[key], value)
+            if isinstance(value, dict):
+                target = base.get(key)
+                if not isinstance(target, dict):
+                    target = base[key] = {}
+                Config._merge_dicts(target, value)
             else:
-                merged[key] = value
-        return merged
+                base[key] = value
+        return base
 
     @staticmethod
-    def _config_paths() -> list[Path]:
-        repo_root = Path(__file__).resolve().parents[2]
-        return [
-            repo_root / "murmur.toml",
-            repo_root / "murmur.conf",  # Legacy support
-            Path.home() / ".config" / "murmur" / "murmur.toml",
-            Path.home() / ".config" / "murmur" / "config.toml",
-            Path.home() / ".config" / "murmur" / "murmur.conf",
-        ]
+    def _config_paths() -> tuple[Path, ...]:
+        return _CONFIG_PATHS
 
     @property
     def model_path(self) -> Path:
-        """Get full path to the model file."""
-        return self.whisper_path / "models" / f"ggml-{self.model}.bin"
+        """Get full path to the model file.
+
+        With prefer_quantized, returns the Q5_0 copy written by setup.sh if it
+        exists and is not older than ggml-<model>.bin (a stale copy of a
+        re-downloaded model is ignored).
+        """
+        models_dir = self.whisper_path / "models"
+        model = models_dir / f"ggml-{self.model}.bin"
+        if not self.prefer_quantized:
+            return model
+        quantized = models_dir / f"ggml-{self.model}{_QUANTIZED_SUFFIX}.bin"
+        try:
+            quantized_mtime = quantized.stat().st_mtime_ns
+        except OSError:
+            return model
+        try:
+            if model.stat().st_mtime_ns > quantized_mtime:
+                return model
+        except OSError:
+            pass  # Only the quantized copy is installed
+        return quantized
@@ -15,28 +15,98 @@ from Quartz import (
 from .logger import log
 
 
+# CGEventKeyboardSetUnicodeString carries at most 20 UTF-16 code units
+_MAX_EVENT_UNITS = 20
+
+_KEYCODE_BACKSPACE = 51  # Backspace on macOS
+
+
+def _utf16_chunks(text: str, max_units: int = _MAX_EVENT_UNITS):
+    """Split text into (chunk, utf16_length) pieces of at most max_units.
+
+    Splits only between code points, so surrogate pairs stay together.
+    """
+    if text.isascii():
+        # Common case (English models): one unit per char, slice directly
+        for start in range(0, len(text), max_units):
+            chunk = text[start:start + max_units]
+            yield chunk, len(chunk)
+        return
+    start = 0
+    units = 0
+    for i, char in enumerate(text):
+        width = 2 if ord(char) > 0xFFFF else 1
+        if units + width > max_units:
+            yield text[start:i], units
+            start, units = i, 0
+        units += width
+    if units:
+        yield text[start:], units
+
+
+def _common_prefix_len(a: str, b: str) -> int:
+    """Length of the shared prefix of a and b.
+
+    Binary search over str.startswith: O(log n) interpreter steps with the
+    character compares done in C (os.path.commonprefix loops in Python).
+    """
+    lo, hi = 0, min(len(a), len(b))
+    while lo < hi:
+        mid = (lo + hi + 1) // 2
+        if b.startswith(a[:mid]):
+            lo = mid
+        else:
+            hi = mid - 1
+    return lo
+
+
+def _pace(deadline: float, delay: float) -> float:
+    """Advance a keystroke schedule by delay, sleeping only if ahead of it.
+
+    Keeps an average rate over a burst instead of paying sleep granularity
+    and a scheduler round-trip on every event.
+    """
+    deadline += delay
+    remaining = deadline - time.perf_counter()
+    if remaining > 0:
+        time.sleep(remaining)
+    return deadline
+
+
 class StreamingInjector:
     """Diff-based text injector for live streaming transcription."""
 
     def __init__(
         self,
         max_updates_per_sec: int = 4,
-        max_backspace_chars: int = 30,
+        max_backspace_chars: int | None = None,
         keystroke_delay_seconds: float = 0.002,
         backspace_delay_seconds: float = 0.001,
     ):
+        if max_backspace_chars is not None:
+            # Corrections always retype the whole differing tail
+            log.warning("max_backspace_chars is deprecated and ignored")
         self._source = CGEventSourceCreate(kCGEventSourceStateHIDSystemState)
+        # Events are reused for every keystroke; only the text payload changes
+        self._bs_down = CGEventCreateKeyboardEvent(self._source, _KEYCODE_BACKSPACE, True)
+        self._bs_up = CGEventCreateKeyboardEvent(self._source, _KEYCODE_BACKSPACE, False)
+        self._text_down = CGEventCreateKeyboardEvent(self._source, 0, True)
+        self._text_up = CGEventCreateKeyboardEvent(self._source, 0, False)
         self._typed_text = ""
         self._last_update_time = 0.0
         self._lock = threading.Lock()
         self._max_updates_per_sec = max(1, max_updates_per_sec)
-        self._max_backspace_chars = max(0, max_backspace_chars)
+        self._min_interval = 1.0 / self._max_updates_per_sec
         self._keystroke_delay = keystroke_delay_seconds
         self._backspace_delay = backspace_delay_seconds
+        self._pending: str | None = None  # Latest text from submit()
+        self._wake = threading.Event()
+        self._worker: threading.Thread | None = None  # Started on first submit
 
     def reset(self) -> None:
         """Reset state for new session."""
         with self._lock:
+            self._pending = None
             self._typed_text = ""
             self._last_update_time = 0.0
 
@@ -55,89 +125,102 @@ class StreamingInjector:
             return False
 
         with self._lock:
-            # Throttle check
-            now = time.time()
-            if not force and (now - self._last_update_time) < (1.0 / self._max_updates_per_sec):
-                return False
-
-            # Compute diff
-            old_text = self._typed_text
-            if old_text == new_text:
-                return False
-
-            prefix_keep = ""
-            old_tail = old_text
-            new_tail = new_text
-            if self._max_backspace_chars is not None and len(old_text) > self._max_backspace_chars:
-                if not new_text.startswith(prefix_keep):
-                    # We are blocked from backspacing enough to matching prefix.
-                    # This creates a deadlock where no new text ever appears.
-                    # FIX: Instead of blocking, we must break the lock.
-                    # We assume the user prefers the old text (since it's committed),
-                    # so we try to find if the new text has MORE content appended.
-                    
-                    # Logic: 
-                    # 1. The visible text is 'prefix_keep' + 'old_tail'.
-                    # 2. The model wants 'new_text'. 
-                    # 3. We can't rewrite 'old_tail'. 
-                    # 4. We accept 'old_tail' is immutable. 
-                    # 5. We check if 'new_text' basically contains 'old_tail' plus new stuff.
-                    
-                    log.warning(f"Injector: clamped update. Visible='{old_tail}', New='{new_text}'")
-                    
-                    # Heuristic: If new_text is just longer, type the difference.
-                    # Reset our internal state to match the model's view so we don't loop forever.
-                    self._typed_text = new_text
-                    return True 
-                
-                old_tail = old_text[len(prefix_keep):]
-                new_tail = new_text[len(prefix_keep):]
-
-            # Find common prefix length in the editable tail
-            common_len = 0
-            for i, (c1, c2) in enumerate(zip(old_tail, new_tail)):
-                if c1 == c2:
-                    common_len = i + 1
-                else:
-                    break
-
-            # How many chars to delete from tail
-            delete_count = len(old_tail) - common_len
-            # What to type
-            suffix = new_tail[common_len:]
-
-            # Send backspaces
-            if delete_count > 0:
-                self._send_backspaces(delete_count)
-
-            # Type new suffix
-            if suffix:
-                self._type_text(suffix)
+            self._pending = None  # A direct update supersedes queued text
+            return self._update_locked(new_text, force)
+
+    def submit(self, new_text: str) -> None:
+        """Queue new_text for typing on the injector's worker thread.
+
+        Returns immediately. Submissions that arrive while the worker is
+        typing or rate-limited coalesce: only the latest text is typed.
+        """
+        if not new_text:
+            return
+        with self._lock:
+            self._pending = new_text
+            if self._worker is None:
+                self._worker = threading.Thread(
+                    target=self._run, name="murmur-inject", daemon=True
+                )
+                self._worker.start()
+        self._wake.set()
+
+    def _run(self) -> None:
+        """Worker loop: type the latest submitted text, honoring the rate limit."""
+        interval = self._min_interval
+        while True:
+            self._wake.wait()
+            self._wake.clear()
+            # Sleep off the rate limit here rather than dropping the update;
+            # anything submitted meanwhile replaces the pending text.
+            delay = self._last_update_time + interval - time.monotonic()
+            if delay > 0:
+                time.sleep(delay)
+            with self._lock:
+                text, self._pending = self._pending, None
+                if text:
+                    self._update_locked(text, force=True)
+
+    def _update_locked(self, new_text: str, force: bool) -> bool:
+        """Diff and type new_text. Caller must hold the lock."""
+        # Throttle check
+        now = time.monotonic()
+        if not force and (now - self._last_update_time) < self._min_interval:
+            return False
 
+        # Compute diff
+        old_text = self._typed_text
+        if old_text == new_text:
+            return False
+
+        # Fast path: most streaming updates only append to what's typed
+        if new_text.startswith(old_text):
+            self._type_text(new_text[len(old_text):])
             self._last_update_time = now
-            self._typed_text = prefix_keep + new_tail
+            self._typed_text = new_text
             return True
 
+        # Find common prefix length
+        common_len = _common_prefix_len(old_text, new_text)
+
+        # How many chars to delete
+        delete_count = len(old_text) - common_len
+        # What to type
+        suffix = new_text[common_len:]
+
+        # Send backspaces
+        if delete_count > 0:
+            self._send_backspaces(delete_count)
+
+        # Type new suffix
+        if suffix:
+            self._type_text(suffix)
+
+        self._last_update_time = now
+        self._typed_text = new_text
+        return True
+
     def _send_backspaces(self, count: int) -> None:
         """Send backspace key events."""
+        key_down, key_up = self._bs_down, self._bs_up
+        delay = self._backspace_delay
+        deadline = time.perf_counter()
         for _ in range(count):
-            # Keycode 51 = Backspace on macOS
-            key_down = CGEventCreateKeyboardEvent(self._source, 51, True)
-            key_up = CGEventCreateKeyboardEvent(self._source, 51, False)
             CGEventPost(kCGHIDEventTap, key_down)
             CGEventPost(kCGHIDEventTap, key_up)
-            time.sleep(self._backspace_delay)
+            deadline = _pace(deadline, delay)
 
     def _type_text(self, text: str) -> None:
-        """Type text characters."""
-        for char in text:
-            key_down = CGEventCreateKeyboardEvent(self._source, 0, True)
-            key_up = CGEventCreateKeyboardEvent(self._source, 0, False)
-            CGEventKeyboardSetUnicodeString(key_down, len(char), char)
-            CGEventKeyboardSetUnicodeString(key_up, len(char), char)
+        """Type text, one key event pair per chunk of up to 20 UTF-16 units."""
+        key_down, key_up = self._text_down, self._text_up
+        delay = self._keystroke_delay
+        deadline = time.perf_counter()
+        for chunk, units in _utf16_chunks(text):
+            CGEventKeyboardSetUnicodeString(key_down, units, chunk)
+            CGEventKeyboardSetUnicodeString(key_up, units, chunk)
             CGEventPost(kCGHIDEventTap, key_down)
             CGEventPost(kCGHIDEventTap, key_up)
-            time.sleep(self._keystroke_delay)
+            deadline = _pace(deadline, delay)
 
     @property
     def typed_text(self) -> str:
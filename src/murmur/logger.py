@@ -18,8 +18,8 @@ def setup_logger() -> logging.Logger:
 
     logger.setLevel(logging.DEBUG)
 
-    # File handler
-    fh = logging.FileHandler(log_file)
+    # File handler (file opened on the first record)
+    fh = logging.FileHandler(log_file, delay=True)
     fh.setLevel(logging.DEBUG)
     fh.setFormatter(
         logging.Formatter("%(asctime)s [%(levelname)s] %(message)s", "%H:%M:%S")
@@ -12,6 +12,48 @@ from pywhispercpp.model import Model
 
 from .logger import log
 
+# Whisper output artifacts removed by _clean_output: bracket tags like
+# [BLANK_AUDIO], ALL parenthetical content (sound descriptions like
+# "(footsteps)", "(music)"), and common hallucinations.
+_HALLUCINATIONS = ("Thank you.", "Thanks for watching!", "Subscribe")
+_CLEAN_RE = re.compile(
+    r"\[.*?\]|\(.*?\)|" + "|".join(re.escape(h) for h in _HALLUCINATIONS)
+)
+
+
+# A window whose last 300ms is below this RMS is treated as silent
+_SILENT_TAIL_SAMPLES = 4800
+_SILENT_TAIL_RMS = 1e-3
+
+
+def _metal_enabled() -> bool:
+    """Whether the linked whisper.cpp build reports the Metal backend.
+
+    Older builds print "METAL = 1", newer ones list a "Metal :" backend.
+    """
+    try:
+        info = str(Model.system_info()).upper()
+    except Exception:
+        return False
+    return "METAL = 1" in info or "METAL :" in info
+
+
+def load_model(model_path: Path) -> Model:
+    """Load a whisper model with Murmur's inference settings."""
+    log.info(f"Loading whisper model: {model_path}")
+    model = Model(
+        str(model_path),
+        print_realtime=False,
+        print_progress=False,
+        redirect_whispercpp_logs_to=os.devnull,
+        n_threads=4,
+    )
+    if _metal_enabled():
+        log.info("Whisper model loaded (Metal GPU)")
+    else:
+        log.warning("Whisper model loaded without Metal; inference runs on CPU")
+    return model
+
 
 @dataclass
 class StreamingResult:
@@ -35,6 +77,7 @@ class StreamingTranscriber:
         min_audio_seconds: float = 0.1,
         use_initial_prompt: bool = True,
         on_update: Optional[Callable[[StreamingResult], None]] = None,
+        model: Optional[Model] = None,
     ):
         self.model_path = model_path
         self._on_update = on_update
@@ -45,16 +88,8 @@ class StreamingTranscriber:
         self._min_audio_samples = max(1, int(16000 * min_audio_seconds))
         self._use_initial_prompt = use_initial_prompt
 
-        # Load model once, keep in memory
-        log.info(f"Loading whisper model: {model_path}")
-        self._model = Model(
-            str(model_path),
-            print_realtime=False,
-            print_progress=False,
-            redirect_whispercpp_logs_to=os.devnull,
-            n_threads=4,
-        )
-        log.info("Whisper model loaded (Metal GPU)")
+        # Load model once, keep in memory (unless the caller already has it)
+        self._model = model if model is not None else load_model(model_path)
 
         # State
         self._committed_text = ""
@@ -63,6 +98,10 @@ class StreamingTranscriber:
         self._last_committed_at_clear = ""
         self._stability_count = 0
         self._lock = threading.Lock()
+        self._prompt_cache: tuple[str, Optional[str]] = ("", None)
+
+        # Recorder sample count passed with the last inference
+        self._last_inference_samples: Optional[int] = None
 
     def reset(self) -> None:
         """Reset state for new session."""
@@ -71,23 +110,50 @@ class StreamingTranscriber:
             self._pending_text = ""
             self._last_full_text = ""
             self._stability_count = 0
+            self._last_inference_samples = None
 
     def process_audio(
         self,
         audio: np.ndarray,
         silence_duration: float = 0.0,
         is_final: bool = False,
+        sample_count: Optional[int] = None,
     ) -> Optional[StreamingResult]:
         """
         Process audio and return transcription result.
 
         Args:
-            audio: float32 numpy array (16kHz mono)
+            audio: float32 numpy array (16kHz mono). C-contiguous float32
+                input (what StreamingRecorder produces) is passed to the
+                model as-is, without a copy.
             silence_duration: Current silence duration in seconds
             is_final: True for final pass after recording stops
+            sample_count: Recorder sample count read before the window was
+                taken. Lets a pass with nothing new to hear skip inference;
+                without it the model always runs.
         """
         if audio is None or len(audio) < self._min_audio_samples:
             return None
+        # No-op for recorder output; only converts foreign input
+        audio = np.ascontiguousarray(audio, dtype=np.float32)
+
+        # Skip whisper on silence (a hallucination source), but only when
+        # nothing can have changed: every sample since the last inference is
+        # VAD silence, the tail is silent and no pending text awaits a commit.
+        # Nothing is returned, so a result that was not re-heard never
+        # reaches the commit / prune path.
+        if not is_final and sample_count is not None:
+            last = self._last_inference_samples
+            with self._lock:
+                pending = self._pending_text
+            if (
+                last is not None
+                and not pending
+                and silence_duration * 16000 >= sample_count - last
+                and self._tail_is_silent(audio)
+            ):
+                return None
+        self._last_inference_samples = sample_count
 
         # Run inference on the sliding window
         text = self._transcribe(audio)
@@ -97,37 +163,49 @@ class StreamingTranscriber:
         with self._lock:
             return self._update_stability(text, silence_duration, is_final)
 
+    @staticmethod
+    def _tail_is_silent(audio: np.ndarray) -> bool:
+        """True if the last 300ms of audio is below the silence RMS."""
+        tail = audio[-_SILENT_TAIL_SAMPLES:]
+        energy = np.einsum("i,i->", tail, tail, dtype=np.float64)
+        return energy < _SILENT_TAIL_RMS * _SILENT_TAIL_RMS * len(tail)
+
+    def _prompt_for(self, committed: str) -> Optional[str]:
+        """Prompt (last prompt_max_words words) for a committed-text snapshot.
+
+        Lock-free: callers pass a single read of _committed_text, which is
+        only ever replaced, never mutated. The last result is cached since
+        committed text changes far less often than inference runs.
+        """
+        cached = self._prompt_cache
+        if cached[0] is committed:
+            return cached[1]
+        prompt = None
+        if committed:
+            # rsplit with maxsplit only tokenizes the tail, not the
+            # whole (ever-growing) committed text
+            n = self._prompt_max_words
+            prompt = " ".join(committed.rsplit(None, n)[-n:])
+        self._prompt_cache = (committed, prompt)
+        return prompt
+
     def _transcribe(self, audio: np.ndarray) -> Optional[str]:
         """Run whisper inference on audio."""
         try:
             # Use committed text as prompt for continuity
-            prompt = None
-            with self._lock:
-                if self._committed_text:
-                    words = self._committed_text.split()[-self._prompt_max_words:]
-                    prompt = " ".join(words)
-
-            segments = []
-            def on_segment(seg):
-                segments.append(seg.text)
+            prompt = self._prompt_for(self._committed_text)
 
-            # Transcribe with prompt for context (if enabled)
+            # Collect segments from transcribe()'s return value rather than
+            # a per-segment callback crossing back into Python
             if prompt and self._use_initial_prompt:
-                self._model.transcribe(
-                    audio,
-                    new_segment_callback=on_segment,
-                    initial_prompt=prompt,
-                )
+                segments = self._model.transcribe(audio, initial_prompt=prompt)
             else:
-                self._model.transcribe(
-                    audio,
-                    new_segment_callback=on_segment,
-                )
+                segments = self._model.transcribe(audio)
 
             if not segments:
                 return None
 
-            text = " ".join(segments)
+            text = " ".join(seg.text for seg in segments)
             cleaned = self._clean_output(text)
             
             # Anti-loop safety: if the output starts with the prompt (or suffix of it),
@@ -142,8 +220,9 @@ class StreamingTranscriber:
                  max_check = min(len(prompt_words), len(output_words), 20)
                  
                  overlap_len = 0
+                 first = output_words[0] if output_words else None
                  for i in range(max_check, 0, -1):
-                     if output_words[:i] == prompt_words[-i:]:
+                     if prompt_words[-i] == first and output_words[:i] == prompt_words[-i:]:
                          overlap_len = i
                          break
                  
@@ -154,7 +233,7 @@ class StreamingTranscriber:
             return cleaned if cleaned else None
 
         except Exception as e:
-            log.debug(f"Transcription error: {e}")
+            log.debug("Transcription error: %s", e)
             return None
 
     def _update_stability(
@@ -196,14 +275,21 @@ class StreamingTranscriber:
         )
 
         if should_commit and merged_text:
-            log.debug(f"Commit: '{merged_text[-30:]}' (stability={self._stability_count}, silence={silence_duration:.1f}s)")
+            log.debug(
+                "Commit: '%s' (stability=%d, silence=%.1fs)",
+                merged_text[-30:], self._stability_count, silence_duration,
+            )
             self._committed_text = merged_text
             self._pending_text = ""
         else:
-            if merged_text.startswith(self._committed_text):
-                self._pending_text = merged_text[len(self._committed_text):].strip()
-            else:
+            committed = self._committed_text
+            # removeprefix checks and slices in one call; an unchanged length
+            # means merged_text did not start with the (non-empty) prefix
+            pending = merged_text.removeprefix(committed)
+            if committed and len(pending) == len(merged_text):
                 self._pending_text = merged_text
+            else:
+                self._pending_text = pending.strip()
 
         result = StreamingResult(
             committed_text=self._committed_text,
@@ -226,17 +312,20 @@ class StreamingTranscriber:
         if new_text.startswith(committed):
             return new_text
 
-        committed_words = committed.split()
+        # Only the last overlap_max_words committed words can overlap
+        n = self._overlap_max_words
+        committed_tail = committed.rsplit(None, n)[-n:] if n > 0 else []
         new_words = new_text.split()
-        max_overlap = min(self._overlap_max_words, len(committed_words), len(new_words))
+        max_overlap = min(n, len(committed_tail), len(new_words))
 
+        # Cheap first-word check filters candidates before the slice compare
+        first = new_words[0] if new_words else None
         for overlap in range(max_overlap, 0, -1):
-            if committed_words[-overlap:] == new_words[:overlap]:
-                merged_words = committed_words + new_words[overlap:]
-                log.debug(f"Merge: overlap of {overlap} words found")
-                return " ".join(merged_words)
+            if committed_tail[-overlap] == first and committed_tail[-overlap:] == new_words[:overlap]:
+                log.debug("Merge: overlap of %d words found", overlap)
+                return " ".join([committed, *new_words[overlap:]])
 
-        log.debug(f"Merge: no overlap found, forcing append")
+        log.debug("Merge: no overlap found, forcing append")
         return f"{committed} {new_text}".strip()
 
     def _clean_output(self, text: str) -> Optional[str]:
@@ -244,30 +333,20 @@ class StreamingTranscriber:
         if not text:
             return None
 
-        # Remove bracket artifacts
-        text = re.sub(r"\[.*?\]", "", text)
-
-        # Remove ALL parenthetical content (sound descriptions like "(footsteps)", "(music)", etc.)
-        text = re.sub(r"\(.*?\)", "", text)
-
-        # Remove common hallucinations
-        hallucinations = [
-            "Thank you.", "Thanks for watching!", "Subscribe",
-        ]
-        for h in hallucinations:
-            text = text.replace(h, "")
+        # Strip artifacts and hallucinations in one pass
+        text = _CLEAN_RE.sub("", text)
 
         text = " ".join(text.split())  # Normalize whitespace
         return text.strip() if text.strip() else None
 
+    # Lock-free reads: each is a single attribute load, and the strings are
+    # replaced rather than mutated, so readers never see a partial value.
     @property
     def committed_text(self) -> str:
         """Get current committed text."""
-        with self._lock:
-            return self._committed_text
+        return self._committed_text
 
     @property
     def pending_text(self) -> str:
         """Get current pending text."""
-        with self._lock:
-            return self._pending_text
+        return self._pending_text
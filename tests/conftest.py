@@ -3,13 +3,33 @@
 import os
 import sys
 import tempfile
+from contextlib import ExitStack
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
 import pytest
 import numpy as np
 
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+# Stand-ins for the macOS-only and native dependencies, installed once at
+# collection so every test module (and every murmur module) sees the same
+# objects. Test modules fetch them back from sys.modules.
+quartz_mock = MagicMock()
+sys.modules['Quartz'] = quartz_mock
+quartz_mock.CGEventCreateKeyboardEvent = MagicMock(return_value=MagicMock())
+quartz_mock.CGEventKeyboardSetUnicodeString = MagicMock()
+quartz_mock.CGEventPost = MagicMock()
+quartz_mock.CGEventSourceCreate = MagicMock(return_value=MagicMock())
+quartz_mock.kCGEventSourceStateHIDSystemState = 1
+quartz_mock.kCGHIDEventTap = 0
+
+pynput_mock = MagicMock()
+sys.modules['pynput'] = pynput_mock
+sys.modules['pynput.keyboard'] = pynput_mock.keyboard
+
+pywhispercpp_mock = MagicMock()
+sys.modules['pywhispercpp'] = pywhispercpp_mock
+sys.modules['pywhispercpp.model'] = pywhispercpp_mock.model
+pywhispercpp_mock.model.Model = MagicMock()
 
 
 @pytest.fixture
@@ -19,40 +39,75 @@ def temp_dir():
         yield Path(tmpdir)
 
 
-@pytest.fixture
-def sample_audio():
-    """Generate sample audio data for testing."""
-    sample_rate = 16000
-    duration = 1.0
-    t = np.linspace(0, duration, int(sample_rate * duration), dtype=np.float32)
-    audio = 0.5 * np.sin(2 * np.pi * 440 * t)
+@pytest.fixture(scope="class")
+def _class_patches():
+    """(ExitStack, {target: mock}) holding class_patch patches for one class."""
+    with ExitStack() as stack:
+        yield stack, {}
+
+
+def class_patch(target: str, autouse: bool = False, **configure):
+    """Fixture that patches `target` once per test class.
+
+    The mock is reset before each test (return values and side effects
+    included), then re-configured with `configure`. Assign the result as a
+    class attribute; the attribute name is the fixture name.
+    """
+    @pytest.fixture(autouse=autouse)
+    def fixture(self, _class_patches):
+        stack, mocks = _class_patches
+        mock = mocks.get(target)
+        if mock is None:
+            mock = mocks[target] = stack.enter_context(patch(target))
+        mock.reset_mock(return_value=True, side_effect=True)
+        mock.configure_mock(**configure)
+        return mock
+    return fixture
+
+
+def _frozen(audio: np.ndarray) -> np.ndarray:
+    """Mark a shared audio buffer read-only so a mutating test fails loudly."""
+    audio.flags.writeable = False
     return audio
 
 
-@pytest.fixture
+def _tone(freq: float = 440.0, n: int = 16000, sample_rate: int = 16000) -> np.ndarray:
+    """Half-amplitude float32 sine, built from the sample index in place."""
+    audio = np.arange(n, dtype=np.float32)
+    audio *= np.float32(2 * np.pi * freq / sample_rate)
+    np.sin(audio, out=audio)
+    audio *= np.float32(0.5)
+    return audio
+
+
+# One second of 16kHz audio, synthesized once and shared by every test
+_TONE_440HZ = _frozen(_tone())
+_SILENCE = _frozen(np.zeros(16000, dtype=np.float32))
+_QUIET = _frozen(np.full(16000, 0.001, dtype=np.float32))
+
+
+@pytest.fixture(scope="session")
+def sample_audio():
+    """Sample audio data for testing (read-only)."""
+    return _TONE_440HZ
+
+
+@pytest.fixture(scope="session")
 def silent_audio():
-    """Generate silent audio data for testing."""
-    sample_rate = 16000
-    duration = 1.0
-    return np.zeros(int(sample_rate * duration), dtype=np.float32)
+    """Silent audio data for testing (read-only)."""
+    return _SILENCE
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def loud_audio():
-    """Generate loud audio data for testing (above VAD threshold)."""
-    sample_rate = 16000
-    duration = 1.0
-    t = np.linspace(0, duration, int(sample_rate * duration), dtype=np.float32)
-    audio = 0.5 * np.sin(2 * np.pi * 440 * t)
-    return audio
+    """Loud audio data for testing, above VAD threshold (read-only)."""
+    return _TONE_440HZ
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def quiet_audio():
-    """Generate quiet audio data for testing (below VAD threshold)."""
-    sample_rate = 16000
-    duration = 1.0
-    return np.full(int(sample_rate * duration), 0.001, dtype=np.float32)
+    """Quiet audio data for testing, below VAD threshold (read-only)."""
+    return _QUIET
 
 
 @pytest.fixture
@@ -101,7 +156,6 @@ silence_commit_ms = 500
 
 [injector]
 max_updates_per_sec = 5
-max_backspace_chars = 25
 """
     config_file = temp_dir / "murmur.toml"
     config_file.write_text(config_content)
@@ -1,54 +1,70 @@
 """Tests for src/murmur/app.py"""
 
+import sys
 import threading
 import time
-from pathlib import Path
+from concurrent.futures import Future
 from unittest.mock import patch, MagicMock, PropertyMock
 from enum import Enum
 
 import pytest
 import numpy as np
 
-import sys
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
-
-# Mock dependencies before importing app
-quartz_mock = MagicMock()
-sys.modules['Quartz'] = quartz_mock
-quartz_mock.CGEventCreateKeyboardEvent = MagicMock(return_value=MagicMock())
-quartz_mock.CGEventKeyboardSetUnicodeString = MagicMock()
-quartz_mock.CGEventPost = MagicMock()
-quartz_mock.CGEventSourceCreate = MagicMock(return_value=MagicMock())
-quartz_mock.kCGEventSourceStateHIDSystemState = 1
-quartz_mock.kCGHIDEventTap = 0
-
-pynput_mock = MagicMock()
-sys.modules['pynput'] = pynput_mock
-sys.modules['pynput.keyboard'] = pynput_mock.keyboard
-
-pywhispercpp_mock = MagicMock()
-sys.modules['pywhispercpp'] = pywhispercpp_mock
-sys.modules['pywhispercpp.model'] = pywhispercpp_mock.model
-pywhispercpp_mock.model.Model = MagicMock()
-
-from murmur.app import State, SOUNDS, MurmurApp, main
+# Dependency mocks are installed in conftest.py
+quartz_mock = sys.modules['Quartz']
+pynput_mock = sys.modules['pynput']
+pywhispercpp_mock = sys.modules['pywhispercpp']
+
+from murmur.app import State, SOUNDS, MurmurApp, _load_model, _run_in_background, main
 from murmur.config import Config
+from tests.conftest import _frozen, class_patch
 
+# Shared stand-in for a short recording; read-only so no test can mutate it
+_EMPTY_AUDIO = _frozen(np.zeros(100, dtype=np.float32))
+
+
+# Reused by make_app across tests; reset before each use
+_NOOP_LISTENER = MagicMock()
+_NOOP_STREAM = MagicMock()
 
-class TestState:
-    """Test State enum."""
 
-    def test_state_loading_value(self):
-        assert State.LOADING.value == "loading"
+def _run_inline(fn, *args, name):
+    """_run_in_background stand-in that finishes the job before returning."""
+    future = Future()
+    try:
+        future.set_result(fn(*args))
+    except Exception as e:
+        future.set_exception(e)
+    return future
 
-    def test_state_idle_value(self):
-        assert State.IDLE.value == "idle"
 
-    def test_state_transcribing_value(self):
-        assert State.TRANSCRIBING.value == "transcribing"
+@pytest.fixture
+def make_app():
+    """Build MurmurApps with the hotkey listener and audio stream patched out.
 
-    def test_state_live_value(self):
-        assert State.LIVE.value == "live"
+    The patches stay active for the whole test, so calls made after
+    construction run against the same mocks. The model load finishes inside
+    the constructor, so it can't overwrite a test's own setup later.
+    """
+    for mock in (_NOOP_LISTENER, _NOOP_STREAM):
+        mock.reset_mock(return_value=True, side_effect=True)
+    with patch.object(MurmurApp, '_start_hotkey_listener', new=_NOOP_LISTENER):
+        with patch('sounddevice.InputStream', new=_NOOP_STREAM):
+            with patch('murmur.app._run_in_background', new=_run_inline):
+                yield lambda config=None: MurmurApp(config or Config())
+
+
+class TestState:
+    """Test State enum."""
+
+    @pytest.mark.parametrize("member,value", [
+        (State.LOADING, "loading"),
+        (State.IDLE, "idle"),
+        (State.TRANSCRIBING, "transcribing"),
+        (State.LIVE, "live"),
+    ])
+    def test_state_value(self, member, value):
+        assert member.value == value
 
     def test_state_is_enum(self):
         assert isinstance(State.LOADING, Enum)
@@ -57,14 +73,9 @@ class TestState:
 class TestSounds:
     """Test SOUNDS dictionary."""
 
-    def test_sounds_has_start(self):
-        assert "start" in SOUNDS
-
-    def test_sounds_has_stop(self):
-        assert "stop" in SOUNDS
-
-    def test_sounds_has_error(self):
-        assert "error" in SOUNDS
+    @pytest.mark.parametrize("name", ["start", "stop", "error"])
+    def test_sounds_has_name(self, name):
+        assert name in SOUNDS
 
     def test_sounds_are_aiff_paths(self):
         for name, path in SOUNDS.items():
@@ -78,394 +89,557 @@ class TestSounds:
 class TestMurmurAppInit:
     """Test MurmurApp initialization."""
 
-    def test_init_stores_config(self):
+    def test_init_invariants(self, make_app):
         config = Config()
-        with patch.object(MurmurApp, '_start_hotkey_listener'):
-            with patch('sounddevice.InputStream'):
-                app = MurmurApp(config)
-                assert app.config is config
+        # Hold off the background model load so the initial state is observable
+        with patch.object(MurmurApp, '_on_model_loaded'):
+            app = make_app(config)
+        assert app.config is config
+        assert app.state == State.LOADING
+        assert app.streaming_recorder is not None
+        assert app.streaming_injector is not None
+        assert app.streaming_transcriber is None
+        _NOOP_LISTENER.assert_called_once()
+
+    def test_apps_share_model_not_transcriber(self, make_app):
+        _load_model.cache_clear()
+        first = make_app()
+        second = make_app()
+        assert first.streaming_transcriber is not second.streaming_transcriber
+        assert first.streaming_transcriber._model is second.streaming_transcriber._model
+        assert _load_model.cache_info().misses == 1
 
-    def test_init_state_is_loading(self):
-        config = Config()
-        with patch.object(MurmurApp, '_start_hotkey_listener'):
-            with patch('sounddevice.InputStream'):
-                app = MurmurApp(config)
-                assert app.state == State.LOADING
 
-    def test_init_creates_streaming_recorder(self):
-        config = Config()
-        with patch.object(MurmurApp, '_start_hotkey_listener'):
-            with patch('sounddevice.InputStream'):
-                app = MurmurApp(config)
-                assert app.streaming_recorder is not None
+class TestMurmurAppOnModelLoaded:
+    """Test _on_model_loaded method."""
 
-    def test_init_creates_streaming_injector(self):
-        config = Config()
-        with patch.object(MurmurApp, '_start_hotkey_listener'):
-            with patch('sounddevice.InputStream'):
-                app = MurmurApp(config)
-                assert app.streaming_injector is not None
+    def test_on_model_loaded_sets_transcriber(self, make_app):
+        app = make_app()
+        mock_transcriber = MagicMock()
+        app._on_model_loaded(mock_transcriber)
+        assert app.streaming_transcriber is mock_transcriber
 
-    def test_init_transcriber_is_none(self):
-        config = Config()
-        with patch.object(MurmurApp, '_start_hotkey_listener'):
-            with patch('sounddevice.InputStream'):
-                app = MurmurApp(config)
-                assert app.streaming_transcriber is None
+    def test_on_model_loaded_sets_state_idle(self, make_app):
+        app = make_app()
+        mock_transcriber = MagicMock()
+        app._on_model_loaded(mock_transcriber)
+        assert app.state == State.IDLE
 
-    def test_init_starts_hotkey_listener(self):
-        config = Config()
-        with patch.object(MurmurApp, '_start_hotkey_listener') as mock_listener:
-            with patch('sounddevice.InputStream'):
-                app = MurmurApp(config)
-                mock_listener.assert_called_once()
 
+class TestMurmurAppOnLoadDone:
+    """Test _on_load_done method."""
 
-class TestMurmurAppOnModelLoaded:
-    """Test _on_model_loaded method."""
+    def test_on_load_done_success_calls_loaded(self, make_app):
+        app = make_app()
+        future = MagicMock()
+        with patch.object(app, '_on_model_loaded') as mock_loaded:
+            app._on_load_done(future)
+            mock_loaded.assert_called_once_with(future.result.return_value)
 
-    def test_on_model_loaded_sets_transcriber(self):
-        config = Config()
-        with patch.object(MurmurApp, '_start_hotkey_listener'):
-            with patch('sounddevice.InputStream'):
-                app = MurmurApp(config)
-                mock_transcriber = MagicMock()
-                app._on_model_loaded(mock_transcriber)
-                assert app.streaming_transcriber is mock_transcriber
+    def test_on_load_done_failure_calls_failed(self, make_app):
+        app = make_app()
+        future = MagicMock()
+        future.result.side_effect = FileNotFoundError("missing model")
+        with patch.object(app, '_on_model_load_failed') as mock_failed:
+            with patch.object(app, '_on_model_loaded') as mock_loaded:
+                app._on_load_done(future)
+                mock_failed.assert_called_once_with("missing model")
+                mock_loaded.assert_not_called()
 
-    def test_on_model_loaded_sets_state_idle(self):
-        config = Config()
-        with patch.object(MurmurApp, '_start_hotkey_listener'):
-            with patch('sounddevice.InputStream'):
-                app = MurmurApp(config)
-                mock_transcriber = MagicMock()
-                app._on_model_loaded(mock_transcriber)
-                assert app.state == State.IDLE
+
+class TestRunInBackground:
+    """Test _run_in_background helper."""
+
+    def test_runs_on_daemon_thread(self):
+        future = _run_in_background(threading.current_thread, name="murmur-test")
+        thread = future.result(timeout=1.0)
+        assert thread.daemon
+        assert thread.name == "murmur-test"
+
+    def test_exception_reaches_future(self):
+        future = _run_in_background(int, "not a number", name="murmur-test")
+        with pytest.raises(ValueError):
+            future.result(timeout=1.0)
 
 
 class TestMurmurAppSetState:
     """Test _set_state method."""
 
-    def test_set_state_updates_state(self):
+    def test_set_state_updates_state(self, make_app):
+        app = make_app()
+        app._set_state(State.IDLE)
+        assert app.state == State.IDLE
+
+    def test_set_state_to_live(self, make_app):
+        app = make_app()
+        app._set_state(State.LIVE)
+        assert app.state == State.LIVE
+
+
+class TestMurmurAppHotkeyListener:
+    """Test _start_hotkey_listener method."""
+
+    def test_modifier_hotkey_narrows_event_tap(self):
+        import murmur.app as app_module
+        config = Config()
+        config.hotkey = "alt_r"
+        with patch('sounddevice.InputStream'), patch.object(sys, 'platform', 'darwin'):
+            app = MurmurApp(config)
+            assert app._listener._EVENTS is app_module.CGEventMaskBit.return_value
+
+    def test_function_key_hotkey_keeps_default_events(self):
         config = Config()
-        with patch.object(MurmurApp, '_start_hotkey_listener'):
-            with patch('sounddevice.InputStream'):
+        config.hotkey = "f8"
+        with patch('sounddevice.InputStream'), patch.object(sys, 'platform', 'darwin'):
+            with patch.object(pynput_mock.keyboard, 'Listener') as mock_listener_cls:
+                mock_listener_cls.return_value = MagicMock(spec=['start', 'stop', 'daemon'])
                 app = MurmurApp(config)
-                app._set_state(State.IDLE)
-                assert app.state == State.IDLE
+                assert not hasattr(app._listener, '_EVENTS')
 
-    def test_set_state_to_live(self):
+    def test_modifier_hotkey_skips_narrowing_without_events_attr(self):
         config = Config()
-        with patch.object(MurmurApp, '_start_hotkey_listener'):
-            with patch('sounddevice.InputStream'):
+        config.hotkey = "alt_r"
+        with patch('sounddevice.InputStream'), patch.object(sys, 'platform', 'darwin'):
+            with patch.object(pynput_mock.keyboard, 'Listener') as mock_listener_cls:
+                mock_listener_cls.return_value = MagicMock(spec=['start', 'stop', 'daemon'])
                 app = MurmurApp(config)
-                app._set_state(State.LIVE)
-                assert app.state == State.LIVE
+                assert not hasattr(app._listener, '_EVENTS')
+                app._listener.start.assert_called_once()
+
+    def test_on_press_toggles_only_for_target_key(self):
+        config = Config()
+        config.hotkey = "f8"
+        with patch('sounddevice.InputStream'), patch.object(MurmurApp, '_on_model_loaded'):
+            with patch.object(pynput_mock.keyboard, 'Listener') as mock_listener_cls:
+                app = MurmurApp(config)
+                import murmur.app as app_module
+                on_press = mock_listener_cls.call_args.kwargs["on_press"]
+                with patch.object(app, '_toggle') as mock_toggle:
+                    on_press(object())
+                    mock_toggle.assert_not_called()
+                    on_press(app_module._KEY_MAP["f8"])
+                    mock_toggle.assert_called_once()
+
+
+_FROZEN_NOW = 1_000_000.0
 
 
 class TestMurmurAppToggle:
     """Test _toggle method."""
 
-    def test_toggle_debounce(self):
+    @pytest.fixture(autouse=True)
+    def frozen_clock(self):
+        # Pin the app's monotonic clock so debounce checks are deterministic
+        with patch('murmur.app.time') as mock_time:
+            mock_time.monotonic.return_value = _FROZEN_NOW
+            yield
+
+    def test_toggle_debounce(self, make_app):
         config = Config()
         config.toggle_debounce_seconds = 0.5
-        with patch.object(MurmurApp, '_start_hotkey_listener'):
-            with patch('sounddevice.InputStream'):
-                app = MurmurApp(config)
-                app.state = State.IDLE
-                app._last_toggle_time = time.time()
+        app = make_app(config)
+        app.state = State.IDLE
+        app._last_toggle_time = _FROZEN_NOW
 
-                with patch.object(app, '_start_live_streaming') as mock_start:
-                    app._toggle()
-                    mock_start.assert_not_called()
+        with patch.object(app, '_start_live_streaming') as mock_start:
+            app._toggle()
+            mock_start.assert_not_called()
 
-    def test_toggle_from_idle_starts_streaming(self):
+    def test_toggle_after_debounce_window(self, make_app):
+        config = Config()
+        config.toggle_debounce_seconds = 0.5
+        app = make_app(config)
+        app.state = State.IDLE
+        app._last_toggle_time = _FROZEN_NOW - 0.6
+
+        with patch.object(app, '_start_live_streaming') as mock_start:
+            app._toggle()
+            mock_start.assert_called_once()
+            assert app._last_toggle_time == _FROZEN_NOW
+
+    def test_toggle_from_idle_starts_streaming(self, make_app):
         config = Config()
         config.toggle_debounce_seconds = 0.0
-        with patch.object(MurmurApp, '_start_hotkey_listener'):
-            with patch('sounddevice.InputStream'):
-                app = MurmurApp(config)
-                app.state = State.IDLE
-                app._last_toggle_time = 0
+        app = make_app(config)
+        app.state = State.IDLE
+        app._last_toggle_time = 0
 
-                with patch.object(app, '_start_live_streaming') as mock_start:
-                    app._toggle()
-                    mock_start.assert_called_once()
+        with patch.object(app, '_start_live_streaming') as mock_start:
+            app._toggle()
+            mock_start.assert_called_once()
 
-    def test_toggle_from_live_stops_streaming(self):
+    def test_toggle_from_live_stops_streaming(self, make_app):
         config = Config()
         config.toggle_debounce_seconds = 0.0
-        with patch.object(MurmurApp, '_start_hotkey_listener'):
-            with patch('sounddevice.InputStream'):
-                app = MurmurApp(config)
-                app.state = State.LIVE
-                app._last_toggle_time = 0
-                app.streaming_transcriber = MagicMock()
+        app = make_app(config)
+        app.state = State.LIVE
+        app._last_toggle_time = 0
+        app.streaming_transcriber = MagicMock()
 
-                with patch.object(app, '_stop_live_streaming') as mock_stop:
-                    app._toggle()
-                    mock_stop.assert_called_once()
+        with patch.object(app, '_stop_live_streaming') as mock_stop:
+            app._toggle()
+            mock_stop.assert_called_once()
 
-    def test_toggle_from_loading_ignored(self):
+    def test_toggle_from_loading_ignored(self, make_app):
         config = Config()
         config.toggle_debounce_seconds = 0.0
-        with patch.object(MurmurApp, '_start_hotkey_listener'):
-            with patch('sounddevice.InputStream'):
-                app = MurmurApp(config)
-                app.state = State.LOADING
-                app._last_toggle_time = 0
+        app = make_app(config)
+        app.state = State.LOADING
+        app._last_toggle_time = 0
 
-                with patch.object(app, '_start_live_streaming') as mock_start:
-                    app._toggle()
-                    mock_start.assert_not_called()
+        with patch.object(app, '_start_live_streaming') as mock_start:
+            app._toggle()
+            mock_start.assert_not_called()
 
 
 class TestMurmurAppPlaySound:
     """Test _play_sound method."""
 
-    def test_play_sound_disabled(self):
+    mock_spawn = class_patch('os.posix_spawn', autouse=True, return_value=1234)
+    mock_waitpid = class_patch('os.waitpid', autouse=True)
+
+    def test_play_sound_disabled(self, make_app, mock_spawn):
         config = Config()
         config.sound = False
-        with patch.object(MurmurApp, '_start_hotkey_listener'):
-            with patch('sounddevice.InputStream'):
-                with patch('subprocess.Popen') as mock_popen:
-                    app = MurmurApp(config)
-                    app._play_sound("start")
-                    mock_popen.assert_not_called()
-
-    def test_play_sound_unknown_sound(self):
+        app = make_app(config)
+        app._play_sound("start")
+        mock_spawn.assert_not_called()
+
+    def test_play_sound_unknown_sound(self, make_app, mock_spawn):
+        config = Config()
+        config.sound = True
+        app = make_app(config)
+        app._play_sound("nonexistent")
+        mock_spawn.assert_not_called()
+
+    def test_play_sound_falls_back_to_afplay(self, make_app, mock_spawn, mock_waitpid):
+        config = Config()
+        config.sound = True
+        with patch.dict('murmur.app._AVAILABLE_SOUNDS', SOUNDS), \
+                patch.dict('murmur.app._SYSTEM_SOUND_IDS', clear=True):
+            app = make_app(config)
+            app._play_sound_now("start")
+            mock_spawn.assert_called_once()
+            assert mock_spawn.call_args.args[1] == ["afplay", SOUNDS["start"]]
+            mock_waitpid.assert_called_once_with(1234, 0)  # Reaped, no zombie
+
+    def test_play_sound_uses_preloaded_system_sound(self, make_app, mock_spawn):
         config = Config()
         config.sound = True
-        with patch.object(MurmurApp, '_start_hotkey_listener'):
-            with patch('sounddevice.InputStream'):
-                with patch('subprocess.Popen') as mock_popen:
-                    app = MurmurApp(config)
-                    app._play_sound("nonexistent")
-                    mock_popen.assert_not_called()
-
-    def test_play_sound_valid_sound(self):
+        with patch.dict('murmur.app._SYSTEM_SOUND_IDS', {"start": 7}), \
+                patch('murmur.app._play_system_sound') as mock_play:
+            app = make_app(config)
+            app._play_sound_now("start")
+            mock_play.assert_called_once_with(7)
+            mock_spawn.assert_not_called()
+
+    def test_play_sound_queues_to_sound_thread(self, make_app):
         config = Config()
         config.sound = True
-        with patch.object(MurmurApp, '_start_hotkey_listener'):
-            with patch('sounddevice.InputStream'):
-                with patch('subprocess.Popen') as mock_popen:
-                    with patch.object(Path, 'exists', return_value=True):
-                        app = MurmurApp(config)
-                        app._play_sound("start")
-                        mock_popen.assert_called_once()
-
-    def test_play_sound_wait_uses_run(self):
+        app = make_app(config)
+        app._sound_queue = MagicMock()
+        with patch.object(app, '_play_sound_now') as mock_play:
+            app._play_sound("start")
+            app._sound_queue.put_nowait.assert_called_once_with("start")
+            mock_play.assert_not_called()
+
+    def test_sound_worker_plays_queued_sound(self, make_app):
         config = Config()
         config.sound = True
-        with patch.object(MurmurApp, '_start_hotkey_listener'):
-            with patch('sounddevice.InputStream'):
-                with patch('subprocess.run') as mock_run:
-                    with patch.object(Path, 'exists', return_value=True):
-                        app = MurmurApp(config)
-                        app._play_sound("start", wait=True)
-                        mock_run.assert_called_once()
+        app = make_app(config)
+        played = threading.Event()
+        with patch.object(app, '_play_sound_now', side_effect=lambda name: played.set()):
+            app._play_sound("start")
+            assert played.wait(timeout=1.0)
+
+    def test_play_sound_wait_spawns_and_waits(self, make_app):
+        config = Config()
+        config.sound = True
+        with patch('os.posix_spawn', return_value=1234) as mock_spawn, \
+                patch('os.waitpid') as mock_waitpid:
+            with patch.dict('murmur.app._AVAILABLE_SOUNDS', SOUNDS):
+                app = make_app(config)
+                app._play_sound("start", wait=True)
+                mock_spawn.assert_called_once()
+                assert mock_spawn.call_args.args[1] == ["afplay", SOUNDS["start"]]
+                mock_waitpid.assert_called_once_with(1234, 0)
+
+    def test_play_sound_wait_ignores_spawn_failure(self, make_app):
+        config = Config()
+        config.sound = True
+        with patch('os.posix_spawn', side_effect=FileNotFoundError):
+            with patch.dict('murmur.app._AVAILABLE_SOUNDS', SOUNDS):
+                app = make_app(config)
+                app._play_sound("start", wait=True)  # Should not raise
 
 
 class TestMurmurAppStartLiveStreaming:
     """Test _start_live_streaming method."""
 
-    def test_start_live_streaming_sets_state(self):
-        config = Config()
-        with patch.object(MurmurApp, '_start_hotkey_listener'):
-            with patch('sounddevice.InputStream'):
-                app = MurmurApp(config)
-                app.streaming_transcriber = MagicMock()
-                with patch.object(app, '_play_sound'):
-                    with patch.object(app.streaming_recorder, 'start'):
-                        app._start_live_streaming()
-                        assert app.state == State.LIVE
+    def test_start_live_streaming_sets_state(self, make_app):
+        app = make_app()
+        app.streaming_transcriber = MagicMock()
+        with patch.object(app, '_play_sound'):
+            with patch.object(app.streaming_recorder, 'start'):
+                app._start_live_streaming()
+                assert app.state == State.LIVE
 
-    def test_start_live_streaming_resets_components(self):
-        config = Config()
-        with patch.object(MurmurApp, '_start_hotkey_listener'):
-            with patch('sounddevice.InputStream'):
-                app = MurmurApp(config)
-                mock_transcriber = MagicMock()
-                mock_injector = MagicMock()
-                app.streaming_transcriber = mock_transcriber
-                app.streaming_injector = mock_injector
-                with patch.object(app, '_play_sound'):
-                    with patch.object(app.streaming_recorder, 'start'):
-                        app._start_live_streaming()
-                        mock_transcriber.reset.assert_called_once()
-                        mock_injector.reset.assert_called_once()
-
-    def test_start_live_streaming_starts_recorder(self):
-        config = Config()
-        with patch.object(MurmurApp, '_start_hotkey_listener'):
-            with patch('sounddevice.InputStream'):
-                app = MurmurApp(config)
-                app.streaming_transcriber = MagicMock()
-                with patch.object(app, '_play_sound'):
-                    with patch.object(app.streaming_recorder, 'start') as mock_start:
-                        app._start_live_streaming()
-                        mock_start.assert_called_once()
+    def test_start_live_streaming_resets_components(self, make_app):
+        with patch.object(MurmurApp, '_on_model_loaded'):
+            app = make_app()
+            mock_transcriber = MagicMock()
+            mock_injector = MagicMock()
+            app.streaming_transcriber = mock_transcriber
+            app.streaming_injector = mock_injector
+            with patch.object(app, '_play_sound'):
+                with patch.object(app.streaming_recorder, 'start'):
+                    app._start_live_streaming()
+                    app._streaming_stop.set()
+                    app._streaming_thread.join(timeout=1.0)
+                    mock_transcriber.reset.assert_called_once()
+                    mock_injector.reset.assert_called_once()
+
+    def test_start_live_streaming_starts_recorder_before_sound(self, make_app):
+        app = make_app()
+        app.streaming_transcriber = MagicMock()
+        order = []
+        with patch.object(app, '_play_sound', side_effect=lambda *a: order.append("sound")):
+            with patch.object(app.streaming_recorder, 'start', side_effect=lambda: order.append("mic")):
+                app._start_live_streaming()
+                app._streaming_stop.set()
+                assert order == ["mic", "sound"]
+
+    def test_start_live_streaming_starts_recorder(self, make_app):
+        app = make_app()
+        app.streaming_transcriber = MagicMock()
+        with patch.object(app, '_play_sound'):
+            with patch.object(app.streaming_recorder, 'start') as mock_start:
+                app._start_live_streaming()
+                mock_start.assert_called_once()
 
 
 class TestMurmurAppStopLiveStreaming:
     """Test _stop_live_streaming method."""
 
-    def test_stop_live_streaming_sets_transcribing_state(self):
+    def test_stop_live_streaming_sets_transcribing_state(self, make_app):
+        app = make_app()
+        app.streaming_transcriber = MagicMock()
+        app._streaming_thread = None
+        with patch.object(app, '_play_sound'):
+            with patch.object(app.streaming_recorder, 'stop', return_value=_EMPTY_AUDIO):
+                app._stop_live_streaming()
+                assert app.state in [State.TRANSCRIBING, State.IDLE]
+
+    def test_stop_live_streaming_signals_stop(self, make_app):
+        app = make_app()
+        app.streaming_transcriber = MagicMock()
+        app._streaming_thread = None
+        with patch.object(app, '_play_sound'):
+            with patch.object(app.streaming_recorder, 'stop', return_value=_EMPTY_AUDIO):
+                app._stop_live_streaming()
+                assert app._streaming_stop.is_set()
+
+
+class TestMurmurAppStreamingLoop:
+    """Test _streaming_loop method."""
+
+    def test_streaming_loop_passes_sample_count(self, make_app):
         config = Config()
-        with patch.object(MurmurApp, '_start_hotkey_listener'):
-            with patch('sounddevice.InputStream'):
-                app = MurmurApp(config)
-                app.streaming_transcriber = MagicMock()
-                app._streaming_stop = threading.Event()
-                app._streaming_thread = None
-                with patch.object(app, '_play_sound'):
-                    with patch.object(app.streaming_recorder, 'stop', return_value=np.zeros(100)):
-                        app._stop_live_streaming()
-                        assert app.state in [State.TRANSCRIBING, State.IDLE]
-
-    def test_stop_live_streaming_signals_stop(self):
+        config.inference_interval_seconds = 0.01
+        with patch.object(MurmurApp, '_on_model_loaded'):
+            app = make_app(config)
+            app.streaming_recorder = MagicMock()
+            app.streaming_recorder.is_speech_active.return_value = True
+            app.streaming_recorder.silence_duration.return_value = 0.0
+            app.streaming_recorder.buffer_duration = 1.0
+            app.streaming_recorder.sample_count.return_value = 16000
+            app.streaming_recorder.get_audio_window.return_value = np.zeros(16000, dtype=np.float32)
+            app.streaming_transcriber = MagicMock()
+            app.streaming_transcriber.pending_text = ""
+            app.streaming_transcriber.process_audio.return_value = None
+
+            thread = threading.Thread(target=app._streaming_loop)
+            thread.start()
+            time.sleep(0.1)
+            app._streaming_stop.set()
+            thread.join(timeout=1.0)
+
+            call = app.streaming_transcriber.process_audio.call_args
+            assert call.kwargs["sample_count"] == 16000
+
+
+    def test_streaming_loop_waits_for_audio(self, make_app):
         config = Config()
-        with patch.object(MurmurApp, '_start_hotkey_listener'):
-            with patch('sounddevice.InputStream'):
-                app = MurmurApp(config)
-                app.streaming_transcriber = MagicMock()
-                app._streaming_stop = threading.Event()
-                app._streaming_thread = None
-                with patch.object(app, '_play_sound'):
-                    with patch.object(app.streaming_recorder, 'stop', return_value=np.zeros(100)):
-                        app._stop_live_streaming()
-                        assert app._streaming_stop.is_set()
+        config.inference_interval_seconds = 0.01
+        with patch.object(MurmurApp, '_on_model_loaded'):
+            app = make_app(config)
+            app.streaming_recorder = MagicMock()
+            app.streaming_recorder.wait_for_audio.return_value = False
+            app.streaming_recorder.is_speech_active.return_value = True
+            app.streaming_transcriber = MagicMock()
+
+            thread = threading.Thread(target=app._streaming_loop)
+            thread.start()
+            time.sleep(0.1)
+            app._streaming_stop.set()
+            thread.join(timeout=1.0)
+
+            assert app.streaming_recorder.wait_for_audio.called
+            app.streaming_transcriber.process_audio.assert_not_called()
+
+
+class TestMurmurAppFinalPassWorker:
+    """Test the persistent final-pass worker."""
+
+    def test_stop_live_streaming_queues_final_job(self, make_app):
+        app = make_app()
+        app._final_jobs = MagicMock()
+        app.streaming_transcriber = MagicMock()
+        app._streaming_thread = None
+        audio = np.zeros(16000, dtype=np.float32)
+        with patch.object(app, '_play_sound'), \
+                patch.object(app.streaming_recorder, 'sample_count', return_value=len(audio)):
+            with patch.object(app.streaming_recorder, 'stop', return_value=audio):
+                app._stop_live_streaming()
+                app._final_jobs.put.assert_called_once_with(audio)
+
+    def test_stop_live_streaming_short_press_skips_audio(self, make_app):
+        app = make_app()
+        app._final_jobs = MagicMock()
+        app._streaming_thread = None
+        with patch.object(app, '_play_sound'), \
+                patch.object(app.streaming_recorder, 'sample_count', return_value=100):
+            with patch.object(app.streaming_recorder, 'stop') as mock_stop:
+                app._stop_live_streaming()
+                mock_stop.assert_not_called()
+                app._final_jobs.put.assert_not_called()
+                assert app.state == State.IDLE
+
+    def test_worker_runs_final_pass(self, make_app):
+        with patch.object(MurmurApp, '_on_model_loaded'):
+            app = make_app()
+            app.streaming_transcriber = MagicMock()
+            done = threading.Event()
+            with patch.object(app, '_on_streaming_complete', side_effect=lambda r: done.set()):
+                app._final_jobs.put(np.zeros(16000, dtype=np.float32))
+                assert done.wait(timeout=2.0)
+            app.streaming_transcriber.process_audio.assert_called_once()
+            assert app.streaming_transcriber.process_audio.call_args.kwargs["is_final"] is True
+
+    def test_shutdown_stops_worker(self, make_app):
+        app = make_app()
+        app.state = State.IDLE
+        app.shutdown()
+        app._final_worker.join(timeout=2.0)
+        assert not app._final_worker.is_alive()
 
 
 class TestMurmurAppShutdown:
     """Test shutdown method."""
 
-    def test_shutdown_stops_live_streaming(self):
-        config = Config()
-        with patch.object(MurmurApp, '_start_hotkey_listener'):
-            with patch('sounddevice.InputStream'):
-                app = MurmurApp(config)
-                app.state = State.LIVE
-                app.streaming_transcriber = MagicMock()
-                app._streaming_stop = threading.Event()
-                app._streaming_thread = None
-                app._listener = MagicMock()
-
-                with patch.object(app, '_stop_live_streaming') as mock_stop:
-                    with patch.object(app, '_play_sound'):
-                        with patch.object(app.streaming_recorder, 'stop', return_value=np.zeros(100)):
-                            app.shutdown()
-                            mock_stop.assert_called_once()
-
-    def test_shutdown_stops_listener(self):
-        config = Config()
-        with patch.object(MurmurApp, '_start_hotkey_listener'):
-            with patch('sounddevice.InputStream'):
-                app = MurmurApp(config)
-                app.state = State.IDLE
-                mock_listener = MagicMock()
-                app._listener = mock_listener
-                app.shutdown()
-                mock_listener.stop.assert_called_once()
+    def test_shutdown_stops_live_streaming(self, make_app):
+        app = make_app()
+        app.state = State.LIVE
+        app.streaming_transcriber = MagicMock()
+        app._streaming_thread = None
+        app._listener = MagicMock()
+
+        with patch.object(app, '_stop_live_streaming') as mock_stop:
+            with patch.object(app, '_play_sound'):
+                with patch.object(app.streaming_recorder, 'stop', return_value=_EMPTY_AUDIO):
+                    app.shutdown()
+                    mock_stop.assert_called_once()
+
+    def test_shutdown_stops_listener(self, make_app):
+        app = make_app()
+        app.state = State.IDLE
+        mock_listener = MagicMock()
+        app._listener = mock_listener
+        app.shutdown()
+        mock_listener.stop.assert_called_once()
+
+    def test_shutdown_with_full_sound_queue_does_not_block(self, make_app):
+        app = make_app()
+        app.state = State.IDLE
+        app._listener = None
+        app._sound_queue.put(None)  # Stop the worker so the queue stays full
+        app._sound_thread.join(timeout=1.0)
+        while not app._sound_queue.full():
+            app._sound_queue.put_nowait("Tink")
+        app.shutdown()
+        assert app._sound_queue.get_nowait() == "Tink"
+        assert list(app._sound_queue.queue)[-1] is None
 
 
 class TestMurmurAppOnStreamingUpdate:
     """Test _on_streaming_update method."""
 
-    def test_on_streaming_update_ignores_non_live(self):
-        config = Config()
-        with patch.object(MurmurApp, '_start_hotkey_listener'):
-            with patch('sounddevice.InputStream'):
-                app = MurmurApp(config)
-                app.state = State.IDLE
+    def test_on_streaming_update_ignores_non_live(self, make_app):
+        app = make_app()
+        app.state = State.IDLE
 
-                mock_result = MagicMock()
-                mock_result.full_text = "test"
-                with patch.object(app.streaming_injector, 'update') as mock_update:
-                    app._on_streaming_update(mock_result)
-                    mock_update.assert_not_called()
+        mock_result = MagicMock()
+        mock_result.full_text = "test"
+        with patch.object(app.streaming_injector, 'submit') as mock_submit:
+            app._on_streaming_update(mock_result)
+            mock_submit.assert_not_called()
 
-    def test_on_streaming_update_injects_text(self):
-        config = Config()
-        with patch.object(MurmurApp, '_start_hotkey_listener'):
-            with patch('sounddevice.InputStream'):
-                app = MurmurApp(config)
-                app.state = State.LIVE
+    def test_on_streaming_update_injects_text(self, make_app):
+        app = make_app()
+        app.state = State.LIVE
 
-                mock_result = MagicMock()
-                mock_result.full_text = "hello world"
-                with patch.object(app.streaming_injector, 'update') as mock_update:
-                    app._on_streaming_update(mock_result)
-                    mock_update.assert_called_once_with("hello world")
+        mock_result = MagicMock()
+        mock_result.full_text = "hello world"
+        with patch.object(app.streaming_injector, 'submit') as mock_submit:
+            app._on_streaming_update(mock_result)
+            mock_submit.assert_called_once_with("hello world")
 
 
 class TestMurmurAppOnStreamingComplete:
     """Test _on_streaming_complete method."""
 
-    def test_on_streaming_complete_injects_final(self):
-        config = Config()
-        with patch.object(MurmurApp, '_start_hotkey_listener'):
-            with patch('sounddevice.InputStream'):
-                app = MurmurApp(config)
+    def test_on_streaming_complete_injects_final(self, make_app):
+        app = make_app()
 
-                mock_result = MagicMock()
-                mock_result.full_text = "final text"
-                with patch.object(app.streaming_injector, 'update') as mock_update:
-                    app._on_streaming_complete(mock_result)
-                    mock_update.assert_called_once_with("final text", force=True)
+        mock_result = MagicMock()
+        mock_result.full_text = "final text"
+        with patch.object(app.streaming_injector, 'update') as mock_update:
+            app._on_streaming_complete(mock_result)
+            mock_update.assert_called_once_with("final text", force=True)
 
-    def test_on_streaming_complete_sets_idle(self):
-        config = Config()
-        with patch.object(MurmurApp, '_start_hotkey_listener'):
-            with patch('sounddevice.InputStream'):
-                app = MurmurApp(config)
+    def test_on_streaming_complete_sets_idle(self, make_app):
+        app = make_app()
 
-                mock_result = MagicMock()
-                mock_result.full_text = "test"
-                app._on_streaming_complete(mock_result)
-                assert app.state == State.IDLE
+        mock_result = MagicMock()
+        mock_result.full_text = "test"
+        app._on_streaming_complete(mock_result)
+        assert app.state == State.IDLE
 
-    def test_on_streaming_complete_none_result(self):
-        config = Config()
-        with patch.object(MurmurApp, '_start_hotkey_listener'):
-            with patch('sounddevice.InputStream'):
-                app = MurmurApp(config)
+    def test_on_streaming_complete_none_result(self, make_app):
+        app = make_app()
 
-                app._on_streaming_complete(None)
-                assert app.state == State.IDLE
+        app._on_streaming_complete(None)
+        assert app.state == State.IDLE
 
 
 class TestMain:
     """Test main function."""
 
-    def test_main_creates_app(self):
-        with patch.object(MurmurApp, '_start_hotkey_listener'):
-            with patch('sounddevice.InputStream'):
-                with patch.object(Config, 'load', return_value=Config()):
-                    with patch('builtins.print'):
-                        with patch('time.sleep', side_effect=KeyboardInterrupt):
-                            with pytest.raises(SystemExit):
-                                main()
-
-    def test_main_handles_keyboard_interrupt(self):
-        with patch.object(MurmurApp, '_start_hotkey_listener'):
-            with patch('sounddevice.InputStream'):
-                with patch.object(Config, 'load', return_value=Config()):
-                    with patch('builtins.print'):
-                        with patch('time.sleep', side_effect=KeyboardInterrupt):
-                            try:
-                                main()
-                            except SystemExit:
-                                pass
+    def test_main_creates_app_and_handles_keyboard_interrupt(self):
+        config = Config()
+        with patch.object(Config, 'load', return_value=config):
+            with patch('signal.pause', side_effect=KeyboardInterrupt):
+                with patch('murmur.app.MurmurApp') as mock_app_cls:
+                    main()  # Ctrl-C is a clean exit, not SystemExit
+                    mock_app_cls.assert_called_once_with(config)
+                    mock_app_cls.return_value.shutdown.assert_called_once()
 
     def test_main_handles_file_not_found(self):
         with patch.object(Config, 'load', side_effect=FileNotFoundError("test")):
-            with patch('builtins.print'):
-                with pytest.raises(SystemExit):
-                    main()
+            with pytest.raises(SystemExit):
+                main()
 
     def test_main_handles_generic_exception(self):
         with patch.object(Config, 'load', side_effect=Exception("test error")):
-            with patch('builtins.print'):
-                with pytest.raises(SystemExit):
-                    main()
+            with pytest.raises(SystemExit):
+                main()
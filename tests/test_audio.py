@@ -1,17 +1,23 @@
 """Tests for src/murmur/audio.py"""
 
 import threading
-import time
-from pathlib import Path
-from unittest.mock import patch, MagicMock
 
 import pytest
 import numpy as np
 
-import sys
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
-
 from murmur.audio import RingBuffer, VAD, StreamingRecorder
+from tests.conftest import _frozen, class_patch
+
+
+# Read-only input chunks shared across tests; append() and the callback copy
+_ONES_8K = _frozen(np.ones(8000, dtype=np.float32))
+_ONES_16K = _frozen(np.ones(16000, dtype=np.float32))
+_ONES_32K = _frozen(np.ones(32000, dtype=np.float32))
+_ZEROS_1600 = _frozen(np.zeros(1600, dtype=np.float32))
+_ZEROS_8K = _frozen(np.zeros(8000, dtype=np.float32))
+_ZEROS_16K = _frozen(np.zeros(16000, dtype=np.float32))
+_ONES_1600_MONO = _frozen(np.ones((1600, 1), dtype=np.float32))
+_ZEROS_16K_MONO = _frozen(np.zeros((16000, 1), dtype=np.float32))
 
 
 class TestRingBuffer:
@@ -35,24 +41,33 @@ class TestRingBuffer:
 
     def test_append_single_chunk(self):
         buffer = RingBuffer(max_seconds=5.0)
-        chunk = np.zeros(16000, dtype=np.float32)
+        chunk = _ZEROS_16K
         buffer.append(chunk)
         assert buffer.duration == 1.0
 
     def test_append_multiple_chunks(self):
         buffer = RingBuffer(max_seconds=5.0)
-        chunk = np.zeros(8000, dtype=np.float32)
+        chunk = _ZEROS_8K
         buffer.append(chunk)
         buffer.append(chunk)
         assert buffer.duration == 1.0
 
     def test_append_over_capacity_discards_oldest(self):
         buffer = RingBuffer(max_seconds=1.0)
-        chunk = np.zeros(16000, dtype=np.float32)
+        chunk = _ZEROS_16K
         buffer.append(chunk)
         buffer.append(chunk)
         assert buffer.duration <= 1.0
 
+    def test_append_wraps_around_keeping_newest(self):
+        buffer = RingBuffer(max_seconds=1.0)
+        buffer.append(np.ones(9600, dtype=np.float32))
+        buffer.append(np.ones(9600, dtype=np.float32) * 2.0)
+        audio = buffer.get_audio()
+        assert len(audio) == 16000
+        assert np.all(audio[:6400] == 1.0)
+        assert np.all(audio[6400:] == 2.0)
+
     def test_get_audio_empty_buffer(self):
         buffer = RingBuffer(max_seconds=5.0)
         audio = buffer.get_audio()
@@ -61,50 +76,103 @@ class TestRingBuffer:
 
     def test_get_audio_returns_all(self):
         buffer = RingBuffer(max_seconds=5.0)
-        chunk = np.ones(16000, dtype=np.float32)
+        chunk = _ONES_16K
         buffer.append(chunk)
         audio = buffer.get_audio()
         assert len(audio) == 16000
-        assert np.allclose(audio, chunk)
+        assert np.array_equal(audio, chunk)
 
     def test_get_audio_last_seconds(self):
         buffer = RingBuffer(max_seconds=5.0)
-        chunk1 = np.ones(16000, dtype=np.float32) * 1.0
-        chunk2 = np.ones(16000, dtype=np.float32) * 2.0
+        chunk1 = _ONES_16K
+        chunk2 = _ONES_16K * 2.0
         buffer.append(chunk1)
         buffer.append(chunk2)
         audio = buffer.get_audio(last_seconds=1.0)
         assert len(audio) == 16000
-        assert np.allclose(audio, chunk2)
+        assert np.array_equal(audio, chunk2)
 
     def test_get_audio_last_seconds_more_than_available(self):
         buffer = RingBuffer(max_seconds=5.0)
-        chunk = np.ones(8000, dtype=np.float32)
+        chunk = _ONES_8K
         buffer.append(chunk)
         audio = buffer.get_audio(last_seconds=1.0)
         assert len(audio) == 8000
 
+    def test_keep_history_grows_instead_of_wrapping(self):
+        buffer = RingBuffer(max_seconds=1.0, sample_rate=10, keep_history=True)
+        for i in range(3):
+            buffer.append(np.full(7, i, dtype=np.float32))
+        assert buffer.total_samples == 21
+        assert np.array_equal(buffer.get_audio(), [1] * 3 + [2] * 7)  # newest 1 s
+        history = buffer.history()
+        assert np.array_equal(history, np.repeat([0, 1, 2], 7))
+
+    def test_reset_forgets_history(self):
+        buffer = RingBuffer(max_seconds=1.0, sample_rate=10, keep_history=True)
+        buffer.append(np.ones(7, dtype=np.float32))
+        buffer.reset()
+        assert buffer.total_samples == 0
+        assert len(buffer.history()) == 0
+        assert buffer.duration == 0.0
+
+    def test_history_grows_without_copying_blocks(self):
+        buffer = RingBuffer(max_seconds=1.0, sample_rate=10, keep_history=True)
+        first = buffer._blocks[0]
+        buffer.append(np.ones(25, dtype=np.float32))
+        assert len(buffer._blocks) == 3
+        assert buffer._blocks[0] is first
+        assert all(len(block) == 10 for block in buffer._blocks)
+
+    def test_reset_keeps_history_capacity(self):
+        buffer = RingBuffer(max_seconds=1.0, sample_rate=10, keep_history=True)
+        buffer.append(np.ones(25, dtype=np.float32))
+        blocks = list(buffer._blocks)
+        buffer.reset()
+        buffer.append(np.full(25, 2, dtype=np.float32))
+        assert all(a is b for a, b in zip(buffer._blocks, blocks, strict=True))
+        assert np.array_equal(buffer.history(), np.full(25, 2))
+
+    def test_get_audio_into_out_buffer(self):
+        buffer = RingBuffer(max_seconds=5.0)
+        buffer.append(_ONES_8K)
+        buffer.append(_ONES_8K * 2.0)
+        out = np.zeros(32000, dtype=np.float32)
+        audio = buffer.get_audio(last_seconds=0.75, out=out)
+        assert len(audio) == 12000
+        assert np.shares_memory(audio, out)
+        assert np.all(audio[:4000] == 1.0)
+        assert np.all(audio[4000:] == 2.0)
+
+    def test_get_audio_out_buffer_too_small_allocates(self):
+        buffer = RingBuffer(max_seconds=5.0)
+        buffer.append(_ONES_16K)
+        out = np.zeros(100, dtype=np.float32)
+        audio = buffer.get_audio(out=out)
+        assert len(audio) == 16000
+        assert not np.shares_memory(audio, out)
+
     def test_clear(self):
         buffer = RingBuffer(max_seconds=5.0)
-        chunk = np.zeros(16000, dtype=np.float32)
+        chunk = _ZEROS_16K
         buffer.append(chunk)
         buffer.clear()
         assert buffer.duration == 0.0
 
     def test_prune_removes_oldest(self):
         buffer = RingBuffer(max_seconds=5.0)
-        chunk1 = np.ones(16000, dtype=np.float32) * 1.0
-        chunk2 = np.ones(16000, dtype=np.float32) * 2.0
+        chunk1 = _ONES_16K
+        chunk2 = _ONES_16K * 2.0
         buffer.append(chunk1)
         buffer.append(chunk2)
         buffer.prune(1.0)
         audio = buffer.get_audio()
         assert len(audio) == 16000
-        assert np.allclose(audio, chunk2)
+        assert np.array_equal(audio, chunk2)
 
     def test_prune_partial_chunk(self):
         buffer = RingBuffer(max_seconds=5.0)
-        chunk = np.ones(16000, dtype=np.float32)
+        chunk = _ONES_16K
         buffer.append(chunk)
         buffer.prune(0.5)
         audio = buffer.get_audio()
@@ -118,11 +186,12 @@ class TestRingBuffer:
     def test_thread_safety_append(self):
         buffer = RingBuffer(max_seconds=10.0)
         errors = []
+        # append copies, so one read-only chunk serves all threads
+        chunk = _frozen(np.zeros(160, dtype=np.float32))
 
         def append_chunks():
             try:
-                for _ in range(100):
-                    chunk = np.zeros(160, dtype=np.float32)
+                for _ in range(1000):
                     buffer.append(chunk)
             except Exception as e:
                 errors.append(e)
@@ -134,14 +203,40 @@ class TestRingBuffer:
             t.join()
 
         assert len(errors) == 0
+        assert buffer._head == 5 * 1000 * len(chunk)
+
+    def test_thread_safety_append_with_wraparound(self):
+        buffer = RingBuffer(max_seconds=0.05)  # 800 samples: wraps constantly
+        errors = []
+
+        def append_chunks(value):
+            chunk = np.full(160, value, dtype=np.float32)
+            try:
+                for _ in range(1000):
+                    buffer.append(chunk)
+            except Exception as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=append_chunks, args=(i,)) for i in range(5)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert len(errors) == 0
+        assert buffer.duration <= 0.05
+        # Appends are serialized, so every 160-sample slot holds one chunk
+        slots = buffer.get_audio().reshape(-1, 160)
+        assert len(slots) == 5
+        assert np.all(slots == slots[:, :1])
 
     def test_append_copies_data(self):
         buffer = RingBuffer(max_seconds=5.0)
-        chunk = np.ones(16000, dtype=np.float32)
+        chunk = _ONES_16K.copy()  # Mutated below
         buffer.append(chunk)
         chunk[:] = 2.0
         audio = buffer.get_audio()
-        assert np.allclose(audio, np.ones(16000))
+        assert np.array_equal(audio, _ONES_16K)
 
 
 class TestVAD:
@@ -165,61 +260,60 @@ class TestVAD:
         result = vad.process(np.array([], dtype=np.float32))
         assert result is False
 
-    def test_process_silent_audio(self):
+    def test_process_silent_audio(self, silent_audio):
         vad = VAD(threshold=0.01)
-        silent = np.zeros(16000, dtype=np.float32)
-        result = vad.process(silent)
+        result = vad.process(silent_audio)
         assert result is False
 
-    def test_process_loud_audio(self):
+    def test_process_loud_audio(self, loud_audio):
         vad = VAD(threshold=0.01)
-        t = np.linspace(0, 1, 16000, dtype=np.float32)
-        loud = 0.5 * np.sin(2 * np.pi * 440 * t)
-        result = vad.process(loud)
+        result = vad.process(loud_audio)
         assert result is True
 
-    def test_is_speaking_after_speech(self):
+    def test_is_speaking_after_speech(self, loud_audio):
         vad = VAD(threshold=0.01)
-        t = np.linspace(0, 1, 16000, dtype=np.float32)
-        loud = 0.5 * np.sin(2 * np.pi * 440 * t)
-        vad.process(loud)
+        vad.process(loud_audio)
         assert vad.is_speaking is True
 
-    def test_is_speaking_after_silence(self):
+    def test_is_speaking_after_silence(self, silent_audio):
         vad = VAD(threshold=0.01, speech_pad_ms=0)
-        silent = np.zeros(16000, dtype=np.float32)
-        vad.process(silent)
+        vad.process(silent_audio)
         assert vad.is_speaking is False
 
-    def test_speech_pad_extends_speaking(self):
+    def test_speech_pad_extends_speaking(self, loud_audio):
         vad = VAD(threshold=0.01, speech_pad_ms=500)
-        t = np.linspace(0, 1, 16000, dtype=np.float32)
-        loud = 0.5 * np.sin(2 * np.pi * 440 * t)
-        vad.process(loud)
+        vad.process(loud_audio)
 
-        silent = np.zeros(1600, dtype=np.float32)
+        silent = _ZEROS_1600
         result = vad.process(silent)
         assert result is True
 
-    def test_silence_duration_during_speech(self):
+    def test_silence_duration_during_speech(self, loud_audio):
         vad = VAD(threshold=0.01)
-        t = np.linspace(0, 1, 16000, dtype=np.float32)
-        loud = 0.5 * np.sin(2 * np.pi * 440 * t)
-        vad.process(loud)
+        vad.process(loud_audio)
         assert vad.silence_duration() == 0.0
 
-    def test_silence_duration_after_silence(self):
+    def test_silence_duration_after_silence(self, silent_audio):
         vad = VAD(threshold=0.01, speech_pad_ms=0)
-        silent = np.zeros(16000, dtype=np.float32)
-        vad.process(silent)
-        time.sleep(0.1)
-        assert vad.silence_duration() >= 0.1
+        vad.process(silent_audio)
+        assert vad.silence_duration() == 1.0
+
+    def test_speech_pad_expires_by_sample_count(self, loud_audio):
+        vad = VAD(threshold=0.01, speech_pad_ms=200)
+        vad.process(loud_audio)
+        silent = _ZEROS_1600
+        assert vad.process(silent) is True   # 100 ms of silence
+        assert vad.process(silent) is False  # 200 ms, pad elapsed
+        assert vad.silence_duration() == pytest.approx(0.2)
+
+    def test_process_int16_audio(self):
+        vad = VAD(threshold=0.01, speech_pad_ms=0)
+        assert vad.process(np.full(1600, 100, dtype=np.int16)) is False   # ~0.003
+        assert vad.process(np.full(1600, 1000, dtype=np.int16)) is True   # ~0.03
 
-    def test_reset(self):
+    def test_reset(self, loud_audio):
         vad = VAD()
-        t = np.linspace(0, 1, 16000, dtype=np.float32)
-        loud = 0.5 * np.sin(2 * np.pi * 440 * t)
-        vad.process(loud)
+        vad.process(loud_audio)
         vad.reset()
         assert vad.is_speaking is False
 
@@ -227,136 +321,200 @@ class TestVAD:
 class TestStreamingRecorder:
     """Test StreamingRecorder class."""
 
+    mock_stream_cls = class_patch('sounddevice.InputStream', autouse=True)
+
     def test_init_defaults(self):
-        with patch('sounddevice.InputStream'):
-            recorder = StreamingRecorder()
-            assert recorder.SAMPLE_RATE == 16000
-            assert recorder.CHANNELS == 1
-            assert recorder._recording is False
+        recorder = StreamingRecorder()
+        assert recorder.SAMPLE_RATE == 16000
+        assert recorder.CHANNELS == 1
+        assert recorder._recording is False
 
     def test_init_custom_buffer_seconds(self):
-        with patch('sounddevice.InputStream'):
-            recorder = StreamingRecorder(buffer_seconds=20.0)
-            assert recorder.ring_buffer.max_samples == 320000
+        recorder = StreamingRecorder(buffer_seconds=20.0)
+        assert recorder.ring_buffer.max_samples == 320000
 
     def test_init_custom_vad_threshold(self):
-        with patch('sounddevice.InputStream'):
-            recorder = StreamingRecorder(vad_threshold=0.02)
-            assert recorder.vad.threshold == 0.02
+        recorder = StreamingRecorder(vad_threshold=0.02)
+        assert recorder.vad.threshold == 0.02
 
     def test_is_recording_false_initially(self):
-        with patch('sounddevice.InputStream'):
-            recorder = StreamingRecorder()
-            assert recorder.is_recording is False
-
-    def test_start_sets_recording_true(self):
-        mock_stream = MagicMock()
-        with patch('sounddevice.InputStream', return_value=mock_stream):
-            recorder = StreamingRecorder()
-            recorder.start()
-            assert recorder.is_recording is True
-            mock_stream.start.assert_called_once()
+        recorder = StreamingRecorder()
+        assert recorder.is_recording is False
+
+    def test_start_sets_recording_true(self, mock_stream_cls):
+        mock_stream = mock_stream_cls.return_value
+        recorder = StreamingRecorder()
+        recorder.start()
+        assert recorder.is_recording is True
+        mock_stream.start.assert_called_once()
 
     def test_start_clears_buffers(self):
-        mock_stream = MagicMock()
-        with patch('sounddevice.InputStream', return_value=mock_stream):
-            recorder = StreamingRecorder()
-            recorder.ring_buffer.append(np.zeros(1600, dtype=np.float32))
-            recorder.start()
-            assert recorder.ring_buffer.duration == 0.0
-
-    def test_start_idempotent(self):
-        mock_stream = MagicMock()
-        with patch('sounddevice.InputStream', return_value=mock_stream):
-            recorder = StreamingRecorder()
-            recorder.start()
-            recorder.start()
-            assert mock_stream.start.call_count == 1
+        recorder = StreamingRecorder()
+        recorder.ring_buffer.append(_ZEROS_1600)
+        recorder.start()
+        assert recorder.ring_buffer.duration == 0.0
+
+    def test_start_idempotent(self, mock_stream_cls):
+        mock_stream = mock_stream_cls.return_value
+        recorder = StreamingRecorder()
+        recorder.start()
+        recorder.start()
+        assert mock_stream.start.call_count == 1
 
     def test_stop_returns_empty_if_not_recording(self):
-        with patch('sounddevice.InputStream'):
-            recorder = StreamingRecorder()
-            audio = recorder.stop()
-            assert len(audio) == 0
+        recorder = StreamingRecorder()
+        audio = recorder.stop()
+        assert len(audio) == 0
 
     def test_stop_sets_recording_false(self):
-        mock_stream = MagicMock()
-        with patch('sounddevice.InputStream', return_value=mock_stream):
-            recorder = StreamingRecorder()
-            recorder.start()
-            recorder.stop()
-            assert recorder.is_recording is False
-
-    def test_stop_closes_stream(self):
-        mock_stream = MagicMock()
-        with patch('sounddevice.InputStream', return_value=mock_stream):
-            recorder = StreamingRecorder()
-            recorder.start()
-            recorder.stop()
-            mock_stream.stop.assert_called_once()
-            mock_stream.close.assert_called_once()
+        recorder = StreamingRecorder()
+        recorder.start()
+        recorder.stop()
+        assert recorder.is_recording is False
+
+    def test_stop_closes_stream(self, mock_stream_cls):
+        mock_stream = mock_stream_cls.return_value
+        recorder = StreamingRecorder()
+        recorder.start()
+        recorder.stop()
+        mock_stream.stop.assert_called_once()
+        mock_stream.close.assert_called_once()
+
+    def test_cancel_discards_audio(self, mock_stream_cls):
+        mock_stream = mock_stream_cls.return_value
+        recorder = StreamingRecorder()
+        recorder.start()
+        recorder._audio_callback(_ZEROS_16K_MONO, 16000, None, None)
+        recorder.cancel()
+        assert recorder.is_recording is False
+        assert recorder.sample_count() == 0
+        mock_stream.close.assert_called_once()
+
+    def test_sample_count_tracks_callback_audio(self):
+        recorder = StreamingRecorder()
+        recorder.start()
+        chunk = _ONES_1600_MONO
+        recorder._audio_callback(chunk, 1600, None, None)
+        recorder._audio_callback(chunk, 1600, None, None)
+        assert recorder.sample_count() == 3200
+        recorder.start()
+        assert recorder.sample_count() == 3200  # already recording
+        recorder.stop()
+        recorder.start()
+        assert recorder.sample_count() == 0
+
+    def test_audio_callback_does_not_take_recorder_lock(self):
+        recorder = StreamingRecorder()
+        recorder.start()
+        with recorder._lock:
+            recorder._audio_callback(_ONES_1600_MONO, 1600, None, None)
+        assert recorder.sample_count() == 1600
+
+    def test_wait_for_audio_signalled_by_callback(self):
+        recorder = StreamingRecorder()
+        recorder.start()
+        assert recorder.wait_for_audio(timeout=0.01) is False
+        recorder._audio_callback(_ONES_1600_MONO, 1600, None, None)
+        assert recorder.wait_for_audio(timeout=0.01) is True
+        assert recorder.wait_for_audio(timeout=0.01) is False
+
+    def test_wake_releases_waiter(self):
+        recorder = StreamingRecorder()
+        recorder.wake()
+        assert recorder.wait_for_audio(timeout=0.01) is True
+
+    def test_default_blocksize_lets_host_choose(self, mock_stream_cls):
+        recorder = StreamingRecorder()
+        recorder.start()
+        assert mock_stream_cls.call_args.kwargs["blocksize"] == 0
+
+    def test_fixed_blocksize_from_chunk_ms(self, mock_stream_cls):
+        recorder = StreamingRecorder(audio_chunk_ms=100)
+        recorder.start()
+        assert mock_stream_cls.call_args.kwargs["blocksize"] == 1600
+
+    def test_stream_captures_int16(self, mock_stream_cls):
+        recorder = StreamingRecorder()
+        recorder.start()
+        assert mock_stream_cls.call_args.kwargs["dtype"] == np.int16
+        assert recorder.ring_buffer._ring.dtype == np.int16
+
+    def test_get_audio_window_converts_to_float32(self):
+        recorder = StreamingRecorder()
+        recorder.ring_buffer.append(np.full(1600, -16384, dtype=np.int16))
+        out = np.empty(16000, dtype=np.float32)
+        audio = recorder.get_audio_window(out=out)
+        assert audio.dtype == np.float32
+        assert np.shares_memory(audio, out)
+        assert np.all(audio == -0.5)
+
+    def test_stop_as_wav_writes_captured_pcm(self):
+        recorder = StreamingRecorder()
+        recorder.start()
+        pcm = np.array([[0], [1234], [-32768], [32767]], dtype=np.int16)
+        recorder._audio_callback(pcm, 4, None, None)
+        wav_bytes = recorder.stop(as_numpy=False)
+        assert np.frombuffer(wav_bytes[44:], dtype=np.int16).tolist() == [0, 1234, -32768, 32767]
 
     def test_get_audio_window_returns_ring_buffer_audio(self):
-        with patch('sounddevice.InputStream'):
-            recorder = StreamingRecorder()
-            recorder.ring_buffer.append(np.ones(16000, dtype=np.float32))
-            audio = recorder.get_audio_window()
-            assert len(audio) == 16000
+        recorder = StreamingRecorder()
+        recorder.ring_buffer.append(_ONES_16K)
+        audio = recorder.get_audio_window()
+        assert len(audio) == 16000
 
     def test_get_audio_window_with_seconds(self):
-        with patch('sounddevice.InputStream'):
-            recorder = StreamingRecorder()
-            recorder.ring_buffer.append(np.ones(32000, dtype=np.float32))
-            audio = recorder.get_audio_window(last_seconds=1.0)
-            assert len(audio) == 16000
+        recorder = StreamingRecorder()
+        recorder.ring_buffer.append(_ONES_32K)
+        audio = recorder.get_audio_window(last_seconds=1.0)
+        assert len(audio) == 16000
 
     def test_consume_audio_prunes_buffer(self):
-        with patch('sounddevice.InputStream'):
-            recorder = StreamingRecorder()
-            recorder.ring_buffer.append(np.ones(32000, dtype=np.float32))
-            recorder.consume_audio(1.0)
-            assert recorder.ring_buffer.duration == 1.0
+        recorder = StreamingRecorder()
+        recorder.ring_buffer.append(_ONES_32K)
+        recorder.consume_audio(1.0)
+        assert recorder.ring_buffer.duration == 1.0
 
     def test_consume_audio_zero_does_nothing(self):
-        with patch('sounddevice.InputStream'):
-            recorder = StreamingRecorder()
-            recorder.ring_buffer.append(np.ones(16000, dtype=np.float32))
-            recorder.consume_audio(0)
-            assert recorder.ring_buffer.duration == 1.0
+        recorder = StreamingRecorder()
+        recorder.ring_buffer.append(_ONES_16K)
+        recorder.consume_audio(0)
+        assert recorder.ring_buffer.duration == 1.0
 
     def test_consume_audio_negative_does_nothing(self):
-        with patch('sounddevice.InputStream'):
-            recorder = StreamingRecorder()
-            recorder.ring_buffer.append(np.ones(16000, dtype=np.float32))
-            recorder.consume_audio(-1.0)
-            assert recorder.ring_buffer.duration == 1.0
-
-    def test_is_speech_active_delegates_to_vad(self):
-        with patch('sounddevice.InputStream'):
-            recorder = StreamingRecorder()
-            t = np.linspace(0, 1, 16000, dtype=np.float32)
-            loud = 0.5 * np.sin(2 * np.pi * 440 * t)
-            recorder.vad.process(loud)
-            assert recorder.is_speech_active() is True
+        recorder = StreamingRecorder()
+        recorder.ring_buffer.append(_ONES_16K)
+        recorder.consume_audio(-1.0)
+        assert recorder.ring_buffer.duration == 1.0
+
+    def test_is_speech_active_delegates_to_vad(self, loud_audio):
+        recorder = StreamingRecorder()
+        recorder.vad.process(loud_audio)
+        assert recorder.is_speech_active() is True
 
     def test_silence_duration_delegates_to_vad(self):
-        with patch('sounddevice.InputStream'):
-            recorder = StreamingRecorder()
-            assert recorder.silence_duration() >= 0.0
+        recorder = StreamingRecorder()
+        assert recorder.silence_duration() >= 0.0
 
     def test_buffer_duration_property(self):
-        with patch('sounddevice.InputStream'):
-            recorder = StreamingRecorder()
-            recorder.ring_buffer.append(np.ones(16000, dtype=np.float32))
-            assert recorder.buffer_duration == 1.0
+        recorder = StreamingRecorder()
+        recorder.ring_buffer.append(_ONES_16K)
+        assert recorder.buffer_duration == 1.0
 
     def test_audio_callback_appends_to_buffers(self):
-        with patch('sounddevice.InputStream'):
-            recorder = StreamingRecorder()
-            recorder._recording = True
-            chunk = np.ones((1600, 1), dtype=np.float32)
-            recorder._audio_callback(chunk, 1600, None, None)
-            assert recorder.ring_buffer.duration > 0
+        recorder = StreamingRecorder()
+        recorder._recording = True
+        chunk = _ONES_1600_MONO
+        recorder._audio_callback(chunk, 1600, None, None)
+        assert recorder.ring_buffer.duration > 0
+
+    def test_audio_callback_copies_input(self):
+        """PortAudio reuses indata, so the callback must not keep a view of it."""
+        recorder = StreamingRecorder()
+        recorder.start()
+        indata = np.full((1600, 1), 8192, dtype=np.int16)
+        recorder._audio_callback(indata, 1600, None, None)
+        indata[:] = 0
+        assert np.all(recorder.get_audio_window() == 0.25)
 
     def test_audio_callback_invokes_on_audio_chunk(self):
         callback_received = []
@@ -364,48 +522,68 @@ class TestStreamingRecorder:
         def on_chunk(chunk):
             callback_received.append(chunk)
 
-        with patch('sounddevice.InputStream'):
-            recorder = StreamingRecorder(on_audio_chunk=on_chunk)
-            recorder._recording = True
-            chunk = np.ones((1600, 1), dtype=np.float32)
-            recorder._audio_callback(chunk, 1600, None, None)
-            assert len(callback_received) == 1
+        recorder = StreamingRecorder(on_audio_chunk=on_chunk)
+        recorder._recording = True
+        chunk = _ONES_1600_MONO
+        recorder._audio_callback(chunk, 1600, None, None)
+        assert len(callback_received) == 1
 
     def test_audio_callback_ignores_when_not_recording(self):
-        with patch('sounddevice.InputStream'):
-            recorder = StreamingRecorder()
-            recorder._recording = False
-            chunk = np.ones((1600, 1), dtype=np.float32)
-            recorder._audio_callback(chunk, 1600, None, None)
-            assert recorder.ring_buffer.duration == 0
-
-    def test_to_wav_converts_to_bytes(self):
-        with patch('sounddevice.InputStream'):
-            recorder = StreamingRecorder()
-            audio = np.zeros(16000, dtype=np.float32)
-            wav_bytes = recorder._to_wav(audio)
-            assert isinstance(wav_bytes, bytes)
-            assert len(wav_bytes) > 0
-            assert wav_bytes[:4] == b'RIFF'
+        recorder = StreamingRecorder()
+        recorder._recording = False
+        chunk = _ONES_1600_MONO
+        recorder._audio_callback(chunk, 1600, None, None)
+        assert recorder.ring_buffer.duration == 0
 
     def test_stop_as_wav_bytes(self):
-        mock_stream = MagicMock()
-        with patch('sounddevice.InputStream', return_value=mock_stream):
-            recorder = StreamingRecorder()
-            recorder.start()
-            recorder._full_buffer.append(np.zeros(16000, dtype=np.float32))
-            wav_bytes = recorder.stop(as_numpy=False)
-            assert isinstance(wav_bytes, bytes)
-            assert wav_bytes[:4] == b'RIFF'
+        recorder = StreamingRecorder()
+        recorder.start()
+        recorder._audio_callback(_ZEROS_16K_MONO[:16], 16, None, None)
+        wav_bytes = recorder.stop(as_numpy=False)
+        assert isinstance(wav_bytes, bytes)
+        assert len(wav_bytes) == 44 + 2 * 16
+        assert wav_bytes[:4] == b'RIFF'
 
     def test_stop_returns_concatenated_audio(self):
-        mock_stream = MagicMock()
-        with patch('sounddevice.InputStream', return_value=mock_stream):
-            recorder = StreamingRecorder()
-            recorder.start()
-            recorder._full_buffer.append(np.ones(8000, dtype=np.float32))
-            recorder._full_buffer.append(np.ones(8000, dtype=np.float32) * 2)
-            audio = recorder.stop()
-            assert len(audio) == 16000
-            assert audio[0] == 1.0
-            assert audio[8000] == 2.0
+        recorder = StreamingRecorder()
+        recorder.start()
+        recorder._audio_callback(np.full((8000, 1), 8192, dtype=np.int16), 8000, None, None)
+        recorder._audio_callback(np.full((8000, 1), 16384, dtype=np.int16), 8000, None, None)
+        audio = recorder.stop()
+        assert len(audio) == 16000
+        assert audio[0] == 0.25
+        assert audio[8000] == 0.5
+
+    def test_full_buffer_grows_past_initial_capacity(self):
+        recorder = StreamingRecorder()
+        recorder.start()
+        initial = len(recorder.ring_buffer._ring)
+        chunk = np.full((initial // 2 + 1, 1), 8192, dtype=np.int16)
+        for i in range(3):
+            recorder._audio_callback(chunk * i, len(chunk), None, None)
+        audio = recorder.stop()
+        assert len(audio) == 3 * len(chunk)
+        assert audio[0] == 0.0
+        assert audio[len(chunk)] == 0.25
+        assert audio[-1] == 0.5
+        assert len(recorder.ring_buffer._blocks) == 2  # Kept for the next session
+
+    def test_stop_result_survives_next_session(self):
+        recorder = StreamingRecorder()
+        recorder.start()
+        recorder._audio_callback(np.full((1600, 1), 16384, dtype=np.int16), 1600, None, None)
+        audio = recorder.stop()
+        recorder.start()
+        recorder._audio_callback(np.zeros((1600, 1), dtype=np.int16), 1600, None, None)
+        assert np.all(audio == 0.5)
+
+    def test_stop_returns_contiguous_float32(self):
+        recorder = StreamingRecorder()
+        recorder.start()
+        chunk = _ONES_1600_MONO
+        recorder._audio_callback(chunk, 1600, None, None)
+        recorder._audio_callback(chunk, 1600, None, None)
+        audio = recorder.stop()
+        assert audio.ndim == 1
+        assert audio.dtype == np.float32
+        assert audio.flags['C_CONTIGUOUS']
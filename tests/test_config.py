@@ -7,141 +7,73 @@ from unittest.mock import patch, MagicMock
 
 import pytest
 
-import sys
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
-
 from murmur.config import Config
 
 
-class TestConfigDefaults:
-    """Test Config default values."""
-
-    def test_default_hotkey(self):
-        config = Config()
-        assert config.hotkey == "alt_r"
-
-    def test_default_model(self):
-        config = Config()
-        assert config.model == "small.en"
-
-    def test_default_sound(self):
-        config = Config()
-        assert config.sound is True
-
-    def test_default_toggle_debounce(self):
-        config = Config()
-        assert config.toggle_debounce_seconds == 0.2
-
-    def test_default_buffer_seconds(self):
-        config = Config()
-        assert config.buffer_seconds == 12.0
-
-    def test_default_audio_window_seconds(self):
-        config = Config()
-        assert config.audio_window_seconds == 10.0
-
-    def test_default_inference_interval_seconds(self):
-        config = Config()
-        assert config.inference_interval_seconds == 0.5
-
-    def test_default_audio_chunk_ms(self):
-        config = Config()
-        assert config.audio_chunk_ms == 100
-
-    def test_default_min_audio_seconds(self):
-        config = Config()
-        assert config.min_audio_seconds == 0.1
-
-    def test_default_vad_threshold(self):
-        config = Config()
-        assert config.vad_threshold == 0.01
-
-    def test_default_vad_speech_pad_ms(self):
-        config = Config()
-        assert config.vad_speech_pad_ms == 300
-
-    def test_default_stability_count(self):
-        config = Config()
-        assert config.stability_count == 2
-
-    def test_default_silence_commit_ms(self):
-        config = Config()
-        assert config.silence_commit_ms == 600
-
-    def test_default_prompt_max_words(self):
-        config = Config()
-        assert config.prompt_max_words == 50
-
-    def test_default_overlap_max_words(self):
-        config = Config()
-        assert config.overlap_max_words == 20
-
-    def test_default_use_initial_prompt(self):
-        config = Config()
-        assert config.use_initial_prompt is True
-
-    def test_default_consume_audio_on_commit(self):
-        config = Config()
-        assert config.consume_audio_on_commit is True
-
-    def test_default_batch_mode(self):
-        config = Config()
-        assert config.batch_mode is False
+@pytest.fixture(scope="class")
+def default_config():
+    """One Config() shared by the read-only default checks."""
+    return Config()
 
-    def test_default_batch_silence_threshold_ms(self):
-        config = Config()
-        assert config.batch_silence_threshold_ms == 500
-
-    def test_default_max_updates_per_sec(self):
-        config = Config()
-        assert config.max_updates_per_sec == 4
-
-    def test_default_max_backspace_chars(self):
-        config = Config()
-        assert config.max_backspace_chars == 30
 
-    def test_default_keystroke_delay_seconds(self):
-        config = Config()
-        assert config.keystroke_delay_seconds == 0.002
+class TestConfigDefaults:
+    """Test Config default values."""
 
-    def test_default_backspace_delay_seconds(self):
+    def test_uses_slots(self):
         config = Config()
-        assert config.backspace_delay_seconds == 0.001
+        assert not hasattr(config, "__dict__")
+        with pytest.raises(AttributeError):
+            config.not_a_field = 1
+
+    @pytest.mark.parametrize("attr,expected", [
+        ("hotkey", "alt_r"),
+        ("model", "small.en"),
+        ("prefer_quantized", True),
+        ("sound", True),
+        ("toggle_debounce_seconds", 0.2),
+        ("buffer_seconds", 12.0),
+        ("audio_window_seconds", 10.0),
+        ("inference_interval_seconds", 0.5),
+        ("audio_chunk_ms", 0),
+        ("min_audio_seconds", 0.1),
+        ("vad_threshold", 0.01),
+        ("vad_speech_pad_ms", 300),
+        ("stability_count", 2),
+        ("silence_commit_ms", 600),
+        ("prompt_max_words", 50),
+        ("overlap_max_words", 20),
+        ("use_initial_prompt", True),
+        ("consume_audio_on_commit", True),
+        ("batch_mode", False),
+        ("batch_silence_threshold_ms", 500),
+        ("max_updates_per_sec", 4),
+        ("keystroke_delay_seconds", 0.002),
+        ("backspace_delay_seconds", 0.001),
+    ])
+    def test_default_value(self, default_config, attr, expected):
+        value = getattr(default_config, attr)
+        assert value == expected
+        assert type(value) is type(expected)
 
 
 class TestConfigNormalizeHotkey:
     """Test _normalize_hotkey static method."""
 
-    def test_normalize_right_option(self):
-        assert Config._normalize_hotkey("right_option") == "alt_r"
-
-    def test_normalize_right_alt(self):
-        assert Config._normalize_hotkey("right_alt") == "alt_r"
-
-    def test_normalize_left_option(self):
-        assert Config._normalize_hotkey("left_option") == "alt_l"
-
-    def test_normalize_left_alt(self):
-        assert Config._normalize_hotkey("left_alt") == "alt_l"
-
-    def test_normalize_caps_lock(self):
-        assert Config._normalize_hotkey("caps_lock") == "caps_lock"
-
-    def test_normalize_f8(self):
-        assert Config._normalize_hotkey("f8") == "f8"
-
-    def test_normalize_f9(self):
-        assert Config._normalize_hotkey("f9") == "f9"
-
-    def test_normalize_f10(self):
-        assert Config._normalize_hotkey("f10") == "f10"
-
-    def test_normalize_unknown_key(self):
-        assert Config._normalize_hotkey("unknown_key") == "unknown_key"
-
-    def test_normalize_case_insensitive(self):
-        assert Config._normalize_hotkey("RIGHT_OPTION") == "alt_r"
-        assert Config._normalize_hotkey("Right_Option") == "alt_r"
+    @pytest.mark.parametrize("raw,expected", [
+        ("right_option", "alt_r"),
+        ("right_alt", "alt_r"),
+        ("left_option", "alt_l"),
+        ("left_alt", "alt_l"),
+        ("caps_lock", "caps_lock"),
+        ("f8", "f8"),
+        ("f9", "f9"),
+        ("f10", "f10"),
+        ("unknown_key", "unknown_key"),
+        ("RIGHT_OPTION", "alt_r"),
+        ("Right_Option", "alt_r"),
+    ])
+    def test_normalize(self, raw, expected):
+        assert Config._normalize_hotkey(raw) == expected
 
 
 class TestConfigMergeDicts:
@@ -185,6 +117,18 @@ class TestConfigMergeDicts:
         result = Config._merge_dicts(base, override)
         assert result == {"a": {"b": {"c": 1, "d": 2}}}
 
+    def test_merge_updates_base_in_place(self):
+        base = {"a": 1}
+        result = Config._merge_dicts(base, {"b": 2})
+        assert result is base
+        assert base == {"a": 1, "b": 2}
+
+    def test_merge_does_not_alias_override_tables(self):
+        first = {"a": {"x": 1}}
+        base = Config._merge_dicts({}, first)
+        Config._merge_dicts(base, {"a": {"y": 2}})
+        assert first == {"a": {"x": 1}}
+
 
 class TestConfigLoadToml:
     """Test _load_toml static method."""
@@ -193,6 +137,11 @@ class TestConfigLoadToml:
         result = Config._load_toml(temp_dir / "nonexistent.toml")
         assert result == {}
 
+    def test_load_path_under_a_file(self, temp_dir):
+        not_a_dir = temp_dir / "murmur"
+        not_a_dir.write_text("")
+        assert Config._load_toml(not_a_dir / "murmur.toml") == {}
+
     def test_load_valid_toml(self, temp_dir):
         toml_content = """
 [murmur]
@@ -210,6 +159,24 @@ model = "base.en"
         result = Config._load_toml(toml_file)
         assert result == {}
 
+    def test_load_caches_unchanged_file(self, temp_dir):
+        toml_file = temp_dir / "cached.toml"
+        toml_file.write_text('[murmur]\nmodel = "base.en"\n')
+        first = Config._load_toml(toml_file)
+        with patch('tomllib.load') as mock_load:
+            second = Config._load_toml(toml_file)
+            mock_load.assert_not_called()
+        assert second is first
+
+    def test_load_reparses_modified_file(self, temp_dir):
+        toml_file = temp_dir / "changed.toml"
+        toml_file.write_text('[murmur]\nmodel = "base.en"\n')
+        Config._load_toml(toml_file)
+        toml_file.write_text('[murmur]\nmodel = "small.en"\n')
+        st = toml_file.stat()
+        os.utime(toml_file, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+        assert Config._load_toml(toml_file) == {"murmur": {"model": "small.en"}}
+
 
 class TestConfigModelPath:
     """Test model_path property."""
@@ -231,58 +198,42 @@ class TestConfigModelPath:
         expected = temp_dir / "models" / "ggml-small.en.bin"
         assert config.model_path == expected
 
+    def test_model_path_prefers_quantized(self, temp_dir):
+        config = Config()
+        config.whisper_path = temp_dir
+        (temp_dir / "models").mkdir()
+        quantized = temp_dir / "models" / "ggml-small.en-q5_0.bin"
+        quantized.touch()
+        assert config.model_path == quantized
 
-class TestConfigLoad:
-    """Test Config.load() method."""
-
-    def test_load_returns_config_instance(self):
-        with patch.object(Config, '_config_paths', return_value=[]):
-            with patch.dict(os.environ, {}, clear=True):
-                config = Config.load()
-                assert isinstance(config, Config)
-
-    def test_load_env_hotkey_override(self):
-        with patch.object(Config, '_config_paths', return_value=[]):
-            with patch.dict(os.environ, {'MURMUR_HOTKEY': 'f10'}, clear=True):
-                config = Config.load()
-                assert config.hotkey == 'f10'
-
-    def test_load_env_model_override(self):
-        with patch.object(Config, '_config_paths', return_value=[]):
-            with patch.dict(os.environ, {'MURMUR_MODEL': 'medium.en'}, clear=True):
-                config = Config.load()
-                assert config.model == 'medium.en'
-
-    def test_load_env_sound_false(self):
-        with patch.object(Config, '_config_paths', return_value=[]):
-            with patch.dict(os.environ, {'MURMUR_SOUND': 'false'}, clear=True):
-                config = Config.load()
-                assert config.sound is False
-
-    def test_load_env_sound_zero(self):
-        with patch.object(Config, '_config_paths', return_value=[]):
-            with patch.dict(os.environ, {'MURMUR_SOUND': '0'}, clear=True):
-                config = Config.load()
-                assert config.sound is False
-
-    def test_load_env_sound_no(self):
-        with patch.object(Config, '_config_paths', return_value=[]):
-            with patch.dict(os.environ, {'MURMUR_SOUND': 'no'}, clear=True):
-                config = Config.load()
-                assert config.sound is False
-
-    def test_load_env_sound_true(self):
-        with patch.object(Config, '_config_paths', return_value=[]):
-            with patch.dict(os.environ, {'MURMUR_SOUND': 'true'}, clear=True):
-                config = Config.load()
-                assert config.sound is True
+    def test_model_path_quantized_opt_out(self, temp_dir):
+        config = Config()
+        config.whisper_path = temp_dir
+        config.prefer_quantized = False
+        (temp_dir / "models").mkdir()
+        (temp_dir / "models" / "ggml-small.en-q5_0.bin").touch()
+        assert config.model_path == temp_dir / "models" / "ggml-small.en.bin"
 
-    def test_load_from_toml_file(self, temp_dir):
-        toml_content = """
+    def test_model_path_skips_stale_quantized(self, temp_dir):
+        config = Config()
+        config.whisper_path = temp_dir
+        (temp_dir / "models").mkdir()
+        quantized = temp_dir / "models" / "ggml-small.en-q5_0.bin"
+        model = temp_dir / "models" / "ggml-small.en.bin"
+        quantized.touch()
+        model.touch()
+        os.utime(quantized, ns=(0, 0))
+        assert config.model_path == model
+
+
+# Config.load() inputs, written once per module by the toml_dir fixture
+_TOML_FILES = {
+    "full.toml": """
 [murmur]
 hotkey = "f8"
 model = "tiny.en"
 sound = false
+prefer_quantized = false
 toggle_debounce_seconds = 0.3
 
 [streaming]
@@ -292,78 +243,108 @@ stability_count = 3
 
 [injector]
 max_updates_per_sec = 5
-"""
-        toml_file = temp_dir / "murmur.toml"
-        toml_file.write_text(toml_content)
+""",
+    "base.toml": """
+[murmur]
+hotkey = "f8"
+model = "tiny.en"
+""",
+    "override.toml": """
+[murmur]
+model = "base.en"
+sound = false
+""",
+    "streaming.toml": """
+[streaming]
+inference_interval_seconds = 0.3
+audio_chunk_ms = 50
+min_audio_seconds = 0.2
+vad_threshold = 0.02
+vad_speech_pad_ms = 400
+silence_commit_ms = 800
+prompt_max_words = 60
+overlap_max_words = 25
+use_initial_prompt = false
+consume_audio_on_commit = false
+batch_mode = true
+batch_silence_threshold_ms = 600
+""",
+    "injector.toml": """
+[injector]
+max_backspace_chars = 40
+keystroke_delay_seconds = 0.003
+backspace_delay_seconds = 0.002
+""",
+}
+
+
+@pytest.fixture(scope="module")
+def toml_dir(tmp_path_factory):
+    """Directory holding every file in _TOML_FILES plus whisper.toml."""
+    root = tmp_path_factory.mktemp("config")
+    for name, content in _TOML_FILES.items():
+        (root / name).write_text(content)
+    (root / "whisper.toml").write_text(
+        f'[murmur]\nwhisper_path = "{root}/custom_whisper"\n'
+    )
+    return root
+
+
+class TestConfigLoad:
+    """Test Config.load() method."""
+
+    def test_load_returns_config_instance(self):
+        with patch.object(Config, '_config_paths', return_value=[]):
+            with patch.dict(os.environ, {}, clear=True):
+                config = Config.load()
+                assert isinstance(config, Config)
+
+    @pytest.mark.parametrize("env,attr,expected", [
+        ({'MURMUR_HOTKEY': 'f10'}, 'hotkey', 'f10'),
+        ({'MURMUR_MODEL': 'medium.en'}, 'model', 'medium.en'),
+        ({'MURMUR_SOUND': 'false'}, 'sound', False),
+        ({'MURMUR_SOUND': '0'}, 'sound', False),
+        ({'MURMUR_SOUND': 'no'}, 'sound', False),
+        ({'MURMUR_SOUND': 'true'}, 'sound', True),
+    ])
+    def test_load_env_override(self, env, attr, expected):
+        with patch.object(Config, '_config_paths', return_value=[]):
+            with patch.dict(os.environ, env, clear=True):
+                config = Config.load()
+                assert getattr(config, attr) == expected
+                assert type(getattr(config, attr)) is type(expected)
 
-        with patch.object(Config, '_config_paths', return_value=[toml_file]):
+    def test_load_from_toml_file(self, toml_dir):
+        with patch.object(Config, '_config_paths', return_value=[toml_dir / "full.toml"]):
             with patch.dict(os.environ, {}, clear=True):
                 config = Config.load()
                 assert config.hotkey == "f8"
                 assert config.model == "tiny.en"
                 assert config.sound is False
+                assert config.prefer_quantized is False
                 assert config.toggle_debounce_seconds == 0.3
                 assert config.buffer_seconds == 15.0
                 assert config.audio_window_seconds == 8.0
                 assert config.stability_count == 3
                 assert config.max_updates_per_sec == 5
 
-    def test_load_multiple_config_files_merged(self, temp_dir):
-        toml1_content = """
-[murmur]
-hotkey = "f8"
-model = "tiny.en"
-"""
-        toml2_content = """
-[murmur]
-model = "base.en"
-sound = false
-"""
-        toml1 = temp_dir / "config1.toml"
-        toml2 = temp_dir / "config2.toml"
-        toml1.write_text(toml1_content)
-        toml2.write_text(toml2_content)
-
-        with patch.object(Config, '_config_paths', return_value=[toml1, toml2]):
+    def test_load_multiple_config_files_merged(self, toml_dir):
+        paths = [toml_dir / "base.toml", toml_dir / "override.toml"]
+        with patch.object(Config, '_config_paths', return_value=paths):
             with patch.dict(os.environ, {}, clear=True):
                 config = Config.load()
                 assert config.hotkey == "f8"
                 assert config.model == "base.en"
                 assert config.sound is False
 
-    def test_load_whisper_path_from_config(self, temp_dir):
-        toml_content = f"""
-[murmur]
-whisper_path = "{temp_dir}/custom_whisper"
-"""
-        toml_file = temp_dir / "murmur.toml"
-        toml_file.write_text(toml_content)
-
-        with patch.object(Config, '_config_paths', return_value=[toml_file]):
+    def test_load_whisper_path_from_config(self, toml_dir):
+        with patch.object(Config, '_config_paths', return_value=[toml_dir / "whisper.toml"]):
             with patch.dict(os.environ, {}, clear=True):
                 config = Config.load()
-                assert config.whisper_path == temp_dir / "custom_whisper"
-
-    def test_load_streaming_config(self, temp_dir):
-        toml_content = """
-[streaming]
-inference_interval_seconds = 0.3
-audio_chunk_ms = 50
-min_audio_seconds = 0.2
-vad_threshold = 0.02
-vad_speech_pad_ms = 400
-silence_commit_ms = 800
-prompt_max_words = 60
-overlap_max_words = 25
-use_initial_prompt = false
-consume_audio_on_commit = false
-batch_mode = true
-batch_silence_threshold_ms = 600
-"""
-        toml_file = temp_dir / "murmur.toml"
-        toml_file.write_text(toml_content)
+                assert config.whisper_path == toml_dir / "custom_whisper"
 
-        with patch.object(Config, '_config_paths', return_value=[toml_file]):
+    def test_load_streaming_config(self, toml_dir):
+        with patch.object(Config, '_config_paths', return_value=[toml_dir / "streaming.toml"]):
             with patch.dict(os.environ, {}, clear=True):
                 config = Config.load()
                 assert config.inference_interval_seconds == 0.3
@@ -379,30 +360,27 @@ batch_silence_threshold_ms = 600
                 assert config.batch_mode is True
                 assert config.batch_silence_threshold_ms == 600
 
-    def test_load_injector_config(self, temp_dir):
-        toml_content = """
-[injector]
-max_backspace_chars = 40
-keystroke_delay_seconds = 0.003
-backspace_delay_seconds = 0.002
-"""
-        toml_file = temp_dir / "murmur.toml"
-        toml_file.write_text(toml_content)
-
-        with patch.object(Config, '_config_paths', return_value=[toml_file]):
+    def test_load_injector_config(self, toml_dir):
+        with patch.object(Config, '_config_paths', return_value=[toml_dir / "injector.toml"]):
             with patch.dict(os.environ, {}, clear=True):
                 config = Config.load()
-                assert config.max_backspace_chars == 40
                 assert config.keystroke_delay_seconds == 0.003
                 assert config.backspace_delay_seconds == 0.002
+                assert not hasattr(config, "max_backspace_chars")
+
+    def test_load_warns_on_deprecated_max_backspace(self, toml_dir):
+        with patch.object(Config, '_config_paths', return_value=[toml_dir / "injector.toml"]):
+            with patch('murmur.config.log') as mock_log:
+                Config.load()
+                mock_log.warning.assert_called_once()
 
 
 class TestConfigPaths:
     """Test _config_paths static method."""
 
-    def test_config_paths_returns_list(self):
+    def test_config_paths_returns_tuple(self):
         paths = Config._config_paths()
-        assert isinstance(paths, list)
+        assert isinstance(paths, tuple)  # Shared cached value, so immutable
         assert len(paths) > 0
 
     def test_config_paths_includes_home_config(self):
@@ -412,5 +390,4 @@ class TestConfigPaths:
 
     def test_config_paths_are_path_objects(self):
         paths = Config._config_paths()
-        for path in paths:
-            assert isinstance(path, Path)
+        assert paths and all(isinstance(path, Path) for path in paths)
@@ -2,78 +2,83 @@
 
 import threading
 import time
-from pathlib import Path
+from types import SimpleNamespace
 from unittest.mock import patch, MagicMock, call
 
 import pytest
 
-import sys
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+from murmur.inject import StreamingInjector, _common_prefix_len, _pace, _utf16_chunks
 
 
-# Mock Quartz before importing inject
-quartz_mock = MagicMock()
-sys.modules['Quartz'] = quartz_mock
-quartz_mock.CGEventCreateKeyboardEvent = MagicMock(return_value=MagicMock())
-quartz_mock.CGEventKeyboardSetUnicodeString = MagicMock()
-quartz_mock.CGEventPost = MagicMock()
-quartz_mock.CGEventSourceCreate = MagicMock(return_value=MagicMock())
-quartz_mock.kCGEventSourceStateHIDSystemState = 1
-quartz_mock.kCGHIDEventTap = 0
+# Quartz functions murmur.inject imports by name (the stand-in is in conftest.py)
+_QUARTZ_FUNCTIONS = (
+    "CGEventCreateKeyboardEvent",
+    "CGEventKeyboardSetUnicodeString",
+    "CGEventPost",
+    "CGEventSourceCreate",
+)
 
-from murmur.inject import StreamingInjector
 
+@pytest.fixture
+def quartz():
+    """Fresh mocks for the Quartz functions, swapped in where murmur.inject uses them."""
+    mocks = {name: MagicMock(return_value=MagicMock()) for name in _QUARTZ_FUNCTIONS}
+    with patch.multiple('murmur.inject', **mocks):
+        yield SimpleNamespace(**mocks)
 
-class TestStreamingInjectorInit:
-    """Test StreamingInjector initialization."""
-
-    def test_init_default_values(self):
-        injector = StreamingInjector()
-        assert injector._max_updates_per_sec == 4
-        assert injector._max_backspace_chars == 30
-        assert injector._keystroke_delay == 0.002
-        assert injector._backspace_delay == 0.001
 
-    def test_init_custom_max_updates(self):
-        injector = StreamingInjector(max_updates_per_sec=10)
-        assert injector._max_updates_per_sec == 10
+def _pace_without_sleep(deadline: float, delay: float) -> float:
+    return deadline + delay
 
-    def test_init_max_updates_minimum_one(self):
-        injector = StreamingInjector(max_updates_per_sec=0)
-        assert injector._max_updates_per_sec == 1
 
-    def test_init_max_updates_negative_becomes_one(self):
-        injector = StreamingInjector(max_updates_per_sec=-5)
-        assert injector._max_updates_per_sec == 1
+@pytest.fixture(autouse=True)
+def no_keystroke_sleep(request):
+    """Keep injector keystroke pacing from sleeping in real time.
 
-    def test_init_custom_max_backspace(self):
-        injector = StreamingInjector(max_backspace_chars=50)
-        assert injector._max_backspace_chars == 50
+    Mark a test with @pytest.mark.real_pace to run the real _pace.
+    """
+    if request.node.get_closest_marker("real_pace"):
+        yield
+        return
+    with patch('murmur.inject._pace', _pace_without_sleep):
+        yield
 
-    def test_init_max_backspace_negative_becomes_zero(self):
-        injector = StreamingInjector(max_backspace_chars=-10)
-        assert injector._max_backspace_chars == 0
 
-    def test_init_custom_keystroke_delay(self):
-        injector = StreamingInjector(keystroke_delay_seconds=0.005)
-        assert injector._keystroke_delay == 0.005
+@pytest.fixture(scope="class")
+def default_injector():
+    """One StreamingInjector() shared by the read-only default checks."""
+    return StreamingInjector()
 
-    def test_init_custom_backspace_delay(self):
-        injector = StreamingInjector(backspace_delay_seconds=0.003)
-        assert injector._backspace_delay == 0.003
 
-    def test_init_typed_text_empty(self):
-        injector = StreamingInjector()
-        assert injector._typed_text == ""
-
-    def test_init_last_update_time_zero(self):
-        injector = StreamingInjector()
-        assert injector._last_update_time == 0.0
+class TestStreamingInjectorInit:
+    """Test StreamingInjector initialization."""
 
-    def test_init_creates_event_source(self):
-        quartz_mock.CGEventSourceCreate.reset_mock()
+    def test_init_default_values(self, default_injector):
+        assert default_injector._max_updates_per_sec == 4
+        assert default_injector._keystroke_delay == 0.002
+        assert default_injector._backspace_delay == 0.001
+
+    @pytest.mark.parametrize("kwarg,value,attr,expected", [
+        ("max_updates_per_sec", 10, "_max_updates_per_sec", 10),
+        ("max_updates_per_sec", 10, "_min_interval", 0.1),
+        ("max_updates_per_sec", 0, "_max_updates_per_sec", 1),
+        ("max_updates_per_sec", -5, "_max_updates_per_sec", 1),
+        ("keystroke_delay_seconds", 0.005, "_keystroke_delay", 0.005),
+        ("backspace_delay_seconds", 0.003, "_backspace_delay", 0.003),
+    ])
+    def test_init_custom_value(self, kwarg, value, attr, expected):
+        injector = StreamingInjector(**{kwarg: value})
+        assert getattr(injector, attr) == expected
+
+    def test_init_typed_text_empty(self, default_injector):
+        assert default_injector._typed_text == ""
+
+    def test_init_last_update_time_zero(self, default_injector):
+        assert default_injector._last_update_time == 0.0
+
+    def test_init_creates_event_source(self, quartz):
         injector = StreamingInjector()
-        quartz_mock.CGEventSourceCreate.assert_called_once()
+        quartz.CGEventSourceCreate.assert_called_once()
 
 
 class TestStreamingInjectorReset:
@@ -107,7 +112,7 @@ class TestStreamingInjectorTypedText:
         results = []
 
         def read_text():
-            for _ in range(100):
+            for _ in range(5):
                 results.append(injector.typed_text)
 
         threads = [threading.Thread(target=read_text) for _ in range(5)]
@@ -116,7 +121,7 @@ class TestStreamingInjectorTypedText:
         for t in threads:
             t.join()
 
-        assert all(r == "test" for r in results)
+        assert results == ["test"] * 25
 
 
 class TestStreamingInjectorUpdate:
@@ -142,14 +147,14 @@ class TestStreamingInjectorUpdate:
     def test_update_throttled_returns_false(self):
         injector = StreamingInjector(max_updates_per_sec=1)
         injector._typed_text = ""
-        injector._last_update_time = time.time()  # just updated
+        injector._last_update_time = time.monotonic()  # just updated
         result = injector.update("hello")
         assert result is False
 
     def test_update_force_bypasses_throttle(self):
         injector = StreamingInjector(max_updates_per_sec=1)
         injector._typed_text = ""
-        injector._last_update_time = time.time()  # just updated
+        injector._last_update_time = time.monotonic()  # just updated
         result = injector.update("hello", force=True)
         assert result is True
 
@@ -171,7 +176,7 @@ class TestStreamingInjectorUpdate:
         injector = StreamingInjector()
         injector._typed_text = ""
         injector._last_update_time = 0
-        before = time.time()
+        before = time.monotonic()
         injector.update("hello")
         assert injector._last_update_time >= before
 
@@ -190,20 +195,75 @@ class TestStreamingInjectorUpdate:
         assert injector._typed_text == "hello"
 
 
+class TestStreamingInjectorSubmit:
+    """Test StreamingInjector background submit path."""
+
+    def test_submit_empty_text_is_ignored(self):
+        injector = StreamingInjector()
+        injector.submit("")
+        assert injector._worker is None
+
+    def test_submit_coalesces_to_latest_text(self):
+        injector = StreamingInjector()
+        injector._worker = MagicMock()  # Queue submissions before the worker runs
+        for text in ("a", "ab", "abc"):
+            injector.submit(text)
+        typed = []
+        with patch.object(injector, '_update_locked', side_effect=lambda t, force: typed.append(t)):
+            threading.Thread(target=injector._run, daemon=True).start()
+            deadline = time.time() + 2
+            while not typed and time.time() < deadline:
+                time.sleep(0.01)
+        assert typed == ["abc"]
+
+    def test_submit_types_text_in_background(self):
+        injector = StreamingInjector()
+        with patch('murmur.inject.CGEventPost'):
+            injector.submit("hello")
+            deadline = time.time() + 2
+            while injector.typed_text != "hello" and time.time() < deadline:
+                time.sleep(0.01)
+        assert injector.typed_text == "hello"
+
+    def test_update_discards_pending_submit(self):
+        injector = StreamingInjector()
+        injector._pending = "stale"
+        with patch('murmur.inject.CGEventPost'):
+            injector.update("final", force=True)
+        assert injector._pending is None
+
+    def test_reset_discards_pending_submit(self):
+        injector = StreamingInjector()
+        injector._pending = "stale"
+        injector.reset()
+        assert injector._pending is None
+
+
 class TestStreamingInjectorDiffLogic:
     """Test the diff computation in update method."""
 
-    def test_diff_appends_suffix_only(self):
+    def test_diff_appends_suffix_only(self, quartz):
         injector = StreamingInjector()
         injector._typed_text = "hello"
         injector._last_update_time = 0
 
-        quartz_mock.CGEventPost.reset_mock()
         injector.update("hello world")
 
-        calls = quartz_mock.CGEventPost.call_args_list
+        calls = quartz.CGEventPost.call_args_list
         assert len(calls) > 0
 
+    def test_diff_pure_append_skips_backspaces(self):
+        injector = StreamingInjector()
+        injector._typed_text = "hello"
+        injector._last_update_time = 0
+
+        with patch.object(injector, '_send_backspaces') as mock_bs, \
+                patch.object(injector, '_type_text') as mock_type:
+            injector.update("hello world")
+            mock_bs.assert_not_called()
+            mock_type.assert_called_once_with(" world")
+        assert injector._typed_text == "hello world"
+
     def test_diff_with_common_prefix(self):
         injector = StreamingInjector()
         injector._typed_text = "hello world"
@@ -216,7 +276,6 @@ class TestStreamingInjectorDiffLogic:
         injector = StreamingInjector()
         injector._typed_text = "abc"
         injector._last_update_time = 0
-        injector._max_backspace_chars = 100
 
         injector.update("xyz")
         assert injector._typed_text == "xyz"
@@ -225,76 +284,151 @@ class TestStreamingInjectorDiffLogic:
 class TestStreamingInjectorBackspaces:
     """Test _send_backspaces method."""
 
-    def test_send_backspaces_creates_key_events(self):
+    def test_send_backspaces_creates_key_events(self, quartz):
         injector = StreamingInjector()
-        quartz_mock.CGEventPost.reset_mock()
 
         injector._send_backspaces(3)
 
-        assert quartz_mock.CGEventPost.call_count == 6  # 2 per backspace (down+up)
+        assert quartz.CGEventPost.call_count == 6  # 2 per backspace (down+up)
 
-    def test_send_backspaces_uses_correct_keycode(self):
+    def test_send_backspaces_uses_correct_keycode(self, quartz):
         injector = StreamingInjector()
-        quartz_mock.CGEventCreateKeyboardEvent.reset_mock()
 
-        injector._send_backspaces(1)
-
-        calls = quartz_mock.CGEventCreateKeyboardEvent.call_args_list
+        calls = quartz.CGEventCreateKeyboardEvent.call_args_list
         assert any(call[0][1] == 51 for call in calls)  # keycode 51 = backspace
 
+    def test_send_backspaces_reuses_cached_events(self, quartz):
+        injector = StreamingInjector()
+        quartz.CGEventCreateKeyboardEvent.reset_mock()
+
+        injector._send_backspaces(2)
+
+        quartz.CGEventCreateKeyboardEvent.assert_not_called()
+        posted = [c[0][1] for c in quartz.CGEventPost.call_args_list]
+        assert posted == [injector._bs_down, injector._bs_up] * 2
+
 
 class TestStreamingInjectorTypeText:
     """Test _type_text method."""
 
-    def test_type_text_creates_key_events_per_char(self):
+    def test_type_text_batches_chars_into_one_event_pair(self, quartz):
         injector = StreamingInjector()
-        quartz_mock.CGEventPost.reset_mock()
 
         injector._type_text("hi")
 
-        assert quartz_mock.CGEventPost.call_count == 4  # 2 per char (down+up)
+        assert quartz.CGEventPost.call_count == 2  # down+up for the chunk
+
+    def test_type_text_splits_long_text(self, quartz):
+        injector = StreamingInjector()
+
+        injector._type_text("x" * 45)
+
+        assert quartz.CGEventPost.call_count == 6  # 3 chunks: 20 + 20 + 5
+        lengths = [c[0][1] for c in quartz.CGEventKeyboardSetUnicodeString.call_args_list]
+        assert lengths == [20, 20, 20, 20, 5, 5]
 
-    def test_type_text_sets_unicode_string(self):
+    def test_type_text_sets_unicode_string(self, quartz):
         injector = StreamingInjector()
-        quartz_mock.CGEventKeyboardSetUnicodeString.reset_mock()
 
         injector._type_text("a")
 
-        assert quartz_mock.CGEventKeyboardSetUnicodeString.call_count >= 2
+        assert quartz.CGEventKeyboardSetUnicodeString.call_count >= 2
 
 
-class TestStreamingInjectorMaxBackspace:
-    """Test max_backspace_chars behavior."""
 
-    def test_max_backspace_limits_deletion(self):
-        injector = StreamingInjector(max_backspace_chars=5)
-        injector._typed_text = "a" * 100
-        injector._last_update_time = 0
+class TestPace:
+    """Test _pace keystroke scheduling helper."""
 
-        result = injector.update("completely different")
-        assert result is True
+    def test_sleeps_until_deadline_when_ahead(self):
+        with patch('murmur.inject.time.perf_counter', return_value=10.0), \
+                patch('murmur.inject.time.sleep') as mock_sleep:
+            assert _pace(10.0, 0.5) == 10.5
+            mock_sleep.assert_called_once_with(0.5)
 
-    def test_max_backspace_zero_means_no_backspace(self):
-        injector = StreamingInjector(max_backspace_chars=0)
-        injector._typed_text = "old text"
-        injector._last_update_time = 0
+    def test_skips_sleep_when_behind(self):
+        with patch('murmur.inject.time.perf_counter', return_value=20.0), \
+                patch('murmur.inject.time.sleep') as mock_sleep:
+            assert _pace(10.0, 0.5) == 10.5
+            mock_sleep.assert_not_called()
 
-        result = injector.update("new text")
-        assert result is True
+    @pytest.mark.real_pace
+    def test_zero_delay_never_sleeps(self):
+        injector = StreamingInjector(keystroke_delay_seconds=0.0, backspace_delay_seconds=0.0)
+        with patch('murmur.inject.CGEventPost'), patch('murmur.inject.time.sleep') as mock_sleep:
+            injector._send_backspaces(5)
+            injector._type_text("x" * 50)
+        mock_sleep.assert_not_called()
+
+
+class TestCommonPrefixLen:
+    """Test _common_prefix_len helper."""
+
+    def test_identical(self):
+        assert _common_prefix_len("hello", "hello") == 5
+
+    def test_partial(self):
+        assert _common_prefix_len("hello world", "hello there") == 6
+
+    def test_no_common_prefix(self):
+        assert _common_prefix_len("abc", "xyz") == 0
+
+    def test_one_is_prefix_of_other(self):
+        assert _common_prefix_len("hell", "hello") == 4
+        assert _common_prefix_len("hello", "hell") == 4
+
+    def test_empty(self):
+        assert _common_prefix_len("", "abc") == 0
+
+
+class TestUtf16Chunks:
+    """Test _utf16_chunks helper."""
+
+    def test_empty_text(self):
+        assert list(_utf16_chunks("")) == []
+
+    def test_short_text_single_chunk(self):
+        assert list(_utf16_chunks("hello")) == [("hello", 5)]
+
+    def test_splits_at_max_units(self):
+        assert list(_utf16_chunks("abcde", max_units=2)) == [("ab", 2), ("cd", 2), ("e", 1)]
+
+    def test_keeps_surrogate_pairs_together(self):
+        text = "a\U0001F600b"  # emoji is two UTF-16 units
+        assert list(_utf16_chunks(text, max_units=2)) == [("a", 1), ("\U0001F600", 2), ("b", 1)]
+
+    def test_non_ascii_bmp_counts_one_unit_per_char(self):
+        assert list(_utf16_chunks("héllo", max_units=3)) == [("hél", 3), ("lo", 2)]
+
+
+class TestStreamingInjectorMaxBackspace:
+    """Test the deprecated max_backspace_chars argument."""
+
+    def test_max_backspace_warns(self):
+        with patch('murmur.inject.log') as mock_log:
+            StreamingInjector(max_backspace_chars=5)
+            mock_log.warning.assert_called_once()
+
+    def test_default_does_not_warn(self):
+        with patch('murmur.inject.log') as mock_log:
+            StreamingInjector()
+            mock_log.warning.assert_not_called()
 
 
 class TestStreamingInjectorThreadSafety:
     """Test thread safety of StreamingInjector."""
 
     def test_concurrent_updates(self):
-        injector = StreamingInjector(max_updates_per_sec=1000)
+        injector = StreamingInjector(
+            keystroke_delay_seconds=0, backspace_delay_seconds=0
+        )
         errors = []
+        barrier = threading.Barrier(3)
 
         def update_text(text):
             try:
+                barrier.wait()  # Start contended rather than one by one
                 for i in range(20):
                     injector.update(f"{text} {i}", force=True)
-                    time.sleep(0.001)
             except Exception as e:
                 errors.append(e)
 
@@ -309,13 +443,19 @@ class TestStreamingInjectorThreadSafety:
             t.join()
 
         assert len(errors) == 0
+        # Whole updates never interleave: the last one applied wins
+        assert injector.typed_text in {f"thread{i} 19" for i in range(3)}
 
     def test_concurrent_reset_and_update(self):
-        injector = StreamingInjector()
+        injector = StreamingInjector(
+            keystroke_delay_seconds=0, backspace_delay_seconds=0
+        )
         errors = []
+        barrier = threading.Barrier(2)
 
         def do_updates():
             try:
+                barrier.wait()
                 for i in range(50):
                     injector.update(f"text {i}", force=True)
             except Exception as e:
@@ -323,6 +463,7 @@ class TestStreamingInjectorThreadSafety:
 
         def do_resets():
             try:
+                barrier.wait()
                 for _ in range(50):
                     injector.reset()
             except Exception as e:
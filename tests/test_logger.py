@@ -1,185 +1,132 @@
 """Tests for src/murmur/logger.py"""
 
+import importlib
 import logging
-import tempfile
+import re
 from datetime import datetime
 from pathlib import Path
-from unittest.mock import patch, MagicMock
+from unittest.mock import patch
 
 import pytest
 
-import sys
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+from murmur import logger as logger_module
+
+
+def _close_handlers():
+    logger = logging.getLogger("murmur")
+    for handler in logger.handlers[:]:
+        logger.removeHandler(handler)
+        handler.close()
+
+
+def _reload():
+    """Re-run murmur.logger against the current Path.home().
+
+    setup_logger() keeps existing handlers, so close them first.
+    """
+    _close_handlers()
+    importlib.reload(logger_module)
+
+
+@pytest.fixture(scope="module")
+def logger_env(tmp_path_factory):
+    """(logger module, log dir), reloaded once and shared by the module."""
+    home = tmp_path_factory.mktemp("home")
+    with patch.object(Path, 'home', return_value=home):
+        _reload()
+        yield logger_module, home / "Library" / "Logs" / "Murmur"
+    _close_handlers()  # Leave no handlers pointing into the temp home
+
+
+@pytest.fixture
+def fresh_logger_env(logger_env, tmp_path):
+    """(logger module, log dir) for tests that need an untouched log dir."""
+    with patch.object(Path, 'home', return_value=tmp_path):
+        _reload()
+        yield logger_module, tmp_path / "Library" / "Logs" / "Murmur"
+    _reload()  # Back to the shared logger_env home
 
 
 class TestSetupLogger:
     """Test setup_logger function."""
 
-    def test_setup_logger_returns_logger(self, temp_dir):
-        with patch.object(Path, 'home', return_value=temp_dir):
-            from murmur import logger as logger_module
-            import importlib
-            importlib.reload(logger_module)
-
-            result = logger_module.setup_logger()
-            assert isinstance(result, logging.Logger)
-
-    def test_setup_logger_name_is_murmur(self, temp_dir):
-        with patch.object(Path, 'home', return_value=temp_dir):
-            from murmur import logger as logger_module
-            import importlib
-            importlib.reload(logger_module)
-
-            result = logger_module.setup_logger()
-            assert result.name == "murmur"
-
-    def test_setup_logger_level_is_debug(self, temp_dir):
-        with patch.object(Path, 'home', return_value=temp_dir):
-            from murmur import logger as logger_module
-            import importlib
-            importlib.reload(logger_module)
-
-            result = logger_module.setup_logger()
-            assert result.level == logging.DEBUG
-
-    def test_setup_logger_creates_log_directory(self, temp_dir):
-        with patch.object(Path, 'home', return_value=temp_dir):
-            from murmur import logger as logger_module
-            import importlib
-            importlib.reload(logger_module)
-
-            logger_module.setup_logger()
-            log_dir = temp_dir / "Library" / "Logs" / "Murmur"
-            assert log_dir.exists()
-
-    def test_setup_logger_has_file_handler(self, temp_dir):
-        with patch.object(Path, 'home', return_value=temp_dir):
-            from murmur import logger as logger_module
-            import importlib
-            importlib.reload(logger_module)
-
-            logger = logger_module.setup_logger()
-            file_handlers = [h for h in logger.handlers if isinstance(h, logging.FileHandler)]
-            assert len(file_handlers) >= 1
-
-    def test_setup_logger_has_console_handler(self, temp_dir):
-        with patch.object(Path, 'home', return_value=temp_dir):
-            from murmur import logger as logger_module
-            import importlib
-            importlib.reload(logger_module)
-
-            logger = logger_module.setup_logger()
-            stream_handlers = [h for h in logger.handlers if isinstance(h, logging.StreamHandler) and not isinstance(h, logging.FileHandler)]
-            assert len(stream_handlers) >= 1
-
-    def test_setup_logger_console_handler_error_level(self, temp_dir):
-        with patch.object(Path, 'home', return_value=temp_dir):
-            from murmur import logger as logger_module
-            import importlib
-            importlib.reload(logger_module)
-
-            logger = logger_module.setup_logger()
-            stream_handlers = [h for h in logger.handlers if isinstance(h, logging.StreamHandler) and not isinstance(h, logging.FileHandler)]
-            assert any(h.level == logging.ERROR for h in stream_handlers)
-
-    def test_setup_logger_idempotent(self, temp_dir):
-        with patch.object(Path, 'home', return_value=temp_dir):
-            from murmur import logger as logger_module
-            import importlib
-            importlib.reload(logger_module)
-
-            logger1 = logger_module.setup_logger()
-            handler_count = len(logger1.handlers)
-
-            logger2 = logger_module.setup_logger()
-            assert logger1 is logger2
-            assert len(logger2.handlers) == handler_count
-
-    def test_log_file_named_with_date(self, temp_dir):
-        with patch.object(Path, 'home', return_value=temp_dir):
-            from murmur import logger as logger_module
-            import importlib
-            importlib.reload(logger_module)
-
-            logger_module.setup_logger()
-            log_dir = temp_dir / "Library" / "Logs" / "Murmur"
-            today = datetime.now().strftime('%Y-%m-%d')
-            expected_file = log_dir / f"murmur-{today}.log"
-            assert expected_file.exists()
+    def test_setup_logger_returns_logger(self, logger_env):
+        logger_module, _ = logger_env
+        result = logger_module.setup_logger()
+        assert isinstance(result, logging.Logger)
+
+    def test_setup_logger_name_is_murmur(self, logger_env):
+        logger_module, _ = logger_env
+        result = logger_module.setup_logger()
+        assert result.name == "murmur"
+
+    def test_setup_logger_level_is_debug(self, logger_env):
+        logger_module, _ = logger_env
+        result = logger_module.setup_logger()
+        assert result.level == logging.DEBUG
+
+    def test_setup_logger_creates_log_directory(self, logger_env):
+        logger_module, log_dir = logger_env
+        logger_module.setup_logger()
+        assert log_dir.exists()
+
+    def test_setup_logger_has_file_handler(self, logger_env):
+        logger_module, _ = logger_env
+        logger = logger_module.setup_logger()
+        file_handlers = [h for h in logger.handlers if isinstance(h, logging.FileHandler)]
+        assert len(file_handlers) >= 1
+
+    def test_setup_logger_has_console_handler(self, logger_env):
+        logger_module, _ = logger_env
+        logger = logger_module.setup_logger()
+        stream_handlers = [h for h in logger.handlers if type(h) is logging.StreamHandler]
+        assert len(stream_handlers) >= 1
+
+    def test_setup_logger_console_handler_error_level(self, logger_env):
+        logger_module, _ = logger_env
+        logger = logger_module.setup_logger()
+        stream_handlers = [h for h in logger.handlers if type(h) is logging.StreamHandler]
+        assert any(h.level == logging.ERROR for h in stream_handlers)
+
+    def test_setup_logger_idempotent(self, logger_env):
+        logger_module, _ = logger_env
+        logger1 = logger_module.setup_logger()
+        handler_count = len(logger1.handlers)
+
+        logger2 = logger_module.setup_logger()
+        assert logger1 is logger2
+        assert len(logger2.handlers) == handler_count
+
+    def test_log_file_named_with_date(self, logger_env):
+        logger_module, log_dir = logger_env
+        logger = logger_module.setup_logger()
+        logger.info("first record")
+        today = datetime.now().strftime('%Y-%m-%d')
+        expected_file = log_dir / f"murmur-{today}.log"
+        assert expected_file.exists()
+
+    def test_log_file_opened_lazily(self, fresh_logger_env):
+        logger_module, log_dir = fresh_logger_env
+        logger_module.setup_logger()
+        assert list(log_dir.iterdir()) == []
 
 
 class TestLogModuleLevel:
     """Test module-level log object."""
 
-    def test_log_is_logger_instance(self, temp_dir):
-        with patch.object(Path, 'home', return_value=temp_dir):
-            from murmur import logger as logger_module
-            import importlib
-            importlib.reload(logger_module)
-
-            assert isinstance(logger_module.log, logging.Logger)
-
-    def test_log_can_write_debug(self, temp_dir):
-        with patch.object(Path, 'home', return_value=temp_dir):
-            from murmur import logger as logger_module
-            import importlib
-            importlib.reload(logger_module)
-
-            logger_module.log.debug("Test debug message")
-            log_dir = temp_dir / "Library" / "Logs" / "Murmur"
-            today = datetime.now().strftime('%Y-%m-%d')
-            log_file = log_dir / f"murmur-{today}.log"
-            content = log_file.read_text()
-            assert "Test debug message" in content
-
-    def test_log_can_write_info(self, temp_dir):
-        with patch.object(Path, 'home', return_value=temp_dir):
-            from murmur import logger as logger_module
-            import importlib
-            importlib.reload(logger_module)
-
-            logger_module.log.info("Test info message")
-            log_dir = temp_dir / "Library" / "Logs" / "Murmur"
-            today = datetime.now().strftime('%Y-%m-%d')
-            log_file = log_dir / f"murmur-{today}.log"
-            content = log_file.read_text()
-            assert "Test info message" in content
-
-    def test_log_can_write_error(self, temp_dir):
-        with patch.object(Path, 'home', return_value=temp_dir):
-            from murmur import logger as logger_module
-            import importlib
-            importlib.reload(logger_module)
-
-            logger_module.log.error("Test error message")
-            log_dir = temp_dir / "Library" / "Logs" / "Murmur"
-            today = datetime.now().strftime('%Y-%m-%d')
-            log_file = log_dir / f"murmur-{today}.log"
-            content = log_file.read_text()
-            assert "Test error message" in content
-
-    def test_log_format_includes_timestamp(self, temp_dir):
-        with patch.object(Path, 'home', return_value=temp_dir):
-            from murmur import logger as logger_module
-            import importlib
-            importlib.reload(logger_module)
-
-            logger_module.log.info("Timestamp test")
-            log_dir = temp_dir / "Library" / "Logs" / "Murmur"
-            today = datetime.now().strftime('%Y-%m-%d')
-            log_file = log_dir / f"murmur-{today}.log"
-            content = log_file.read_text()
-            assert "[INFO]" in content
-
-    def test_log_format_includes_level(self, temp_dir):
-        with patch.object(Path, 'home', return_value=temp_dir):
-            from murmur import logger as logger_module
-            import importlib
-            importlib.reload(logger_module)
-
-            logger_module.log.warning("Warning test")
-            log_dir = temp_dir / "Library" / "Logs" / "Murmur"
-            today = datetime.now().strftime('%Y-%m-%d')
-            log_file = log_dir / f"murmur-{today}.log"
-            content = log_file.read_text()
-            assert "[WARNING]" in content
+    def test_log_is_logger_instance(self, logger_env):
+        logger_module, _ = logger_env
+        assert isinstance(logger_module.log, logging.Logger)
+
+    @pytest.mark.parametrize("method,msg", [
+        ("debug", "Test debug message"),
+        ("info", "Test info message"),
+        ("warning", "Warning test"),
+        ("error", "Test error message"),
+    ])
+    def test_log_writes_formatted_record(self, logger_env, method, msg):
+        logger_module, log_dir = logger_env
+        getattr(logger_module.log, method)(msg)  # Written through, no flush
+        today = datetime.now().strftime('%Y-%m-%d')
+        content = (log_dir / f"murmur-{today}.log").read_text()
+        assert re.search(rf"^\d\d:\d\d:\d\d \[{method.upper()}\] {msg}$", content, re.M)
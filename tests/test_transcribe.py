@@ -1,23 +1,75 @@
 """Tests for src/murmur/transcribe.py"""
 
 import threading
-from pathlib import Path
-from unittest.mock import patch, MagicMock, PropertyMock
+from types import SimpleNamespace
+from unittest.mock import patch
 
 import pytest
 import numpy as np
 
-import sys
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+from murmur.transcribe import StreamingResult, StreamingTranscriber, _metal_enabled
+from tests.conftest import _frozen
 
 
-# Mock pywhispercpp before importing
-pywhispercpp_mock = MagicMock()
-sys.modules['pywhispercpp'] = pywhispercpp_mock
-sys.modules['pywhispercpp.model'] = pywhispercpp_mock.model
-pywhispercpp_mock.model.Model = MagicMock()
+# Read-only input windows shared across tests
+_ZEROS_100 = _frozen(np.zeros(100, dtype=np.float32))
+_ZEROS_16K = _frozen(np.zeros(16000, dtype=np.float32))
 
-from murmur.transcribe import StreamingResult, StreamingTranscriber
+
+class _FakeModel:
+    """Plain stand-in for the whisper model.
+
+    transcribe() answers `text` as a single segment (none if empty) and
+    records each call as an (audio, initial_prompt) pair.
+    """
+
+    def __init__(self, text: str = ""):
+        self.text = text
+        self.calls = []
+
+    def transcribe(self, audio, initial_prompt=None):
+        self.calls.append((audio, initial_prompt))
+        return [SimpleNamespace(text=self.text)] if self.text else []
+
+
+class _UnloadedModel(_FakeModel):
+    """Stand-in for the Model class: takes Model's arguments, loads nothing."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__()
+
+    @staticmethod
+    def system_info():
+        return "METAL = 1"
+
+
+@pytest.fixture(scope="module", autouse=True)
+def _no_model_load():
+    """Construct transcribers around _UnloadedModel instead of the mock Model."""
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr("murmur.transcribe.Model", _UnloadedModel)
+        yield
+
+
+@pytest.fixture(scope="module")
+def model_path(tmp_path_factory):
+    """Model file path for every transcriber; nothing is ever loaded from it."""
+    return tmp_path_factory.mktemp("whisper") / "model.bin"
+
+
+@pytest.fixture(scope="class")
+def shared_transcriber(model_path):
+    """One default StreamingTranscriber per test class."""
+    return StreamingTranscriber(model_path=model_path)
+
+
+@pytest.fixture
+def transcriber(shared_transcriber):
+    """The class's shared transcriber with fresh session state and model."""
+    shared_transcriber.reset()
+    shared_transcriber._prompt_cache = ("", None)
+    shared_transcriber._model = _FakeModel()
+    return shared_transcriber
 
 
 class TestStreamingResult:
@@ -59,114 +111,108 @@ class TestStreamingResult:
 class TestStreamingTranscriberInit:
     """Test StreamingTranscriber initialization."""
 
-    def test_init_stores_model_path(self, temp_dir):
-        model_path = temp_dir / "model.bin"
+    def test_init_stores_model_path(self, model_path):
         transcriber = StreamingTranscriber(model_path=model_path)
         assert transcriber.model_path == model_path
 
-    def test_init_default_stability_count(self, temp_dir):
-        model_path = temp_dir / "model.bin"
-        transcriber = StreamingTranscriber(model_path=model_path)
-        assert transcriber._stability_count_required == 2
-
-    def test_init_custom_stability_count(self, temp_dir):
-        model_path = temp_dir / "model.bin"
-        transcriber = StreamingTranscriber(model_path=model_path, stability_count=5)
-        assert transcriber._stability_count_required == 5
-
-    def test_init_default_silence_commit(self, temp_dir):
-        model_path = temp_dir / "model.bin"
-        transcriber = StreamingTranscriber(model_path=model_path)
-        assert transcriber._silence_commit_seconds == 0.6
+    @pytest.mark.parametrize("attr,expected", [
+        ("_stability_count_required", 2),
+        ("_silence_commit_seconds", 0.6),
+        ("_prompt_max_words", 50),
+        ("_overlap_max_words", 20),
+        ("_use_initial_prompt", True),
+        ("_min_audio_samples", 1600),
+    ])
+    def test_init_default(self, transcriber, attr, expected):
+        assert getattr(transcriber, attr) == expected
+
+    @pytest.mark.parametrize("kwargs,attr,expected", [
+        ({"stability_count": 5}, "_stability_count_required", 5),
+        ({"silence_commit_ms": 1000}, "_silence_commit_seconds", 1.0),
+        ({"prompt_max_words": 100}, "_prompt_max_words", 100),
+        ({"overlap_max_words": 30}, "_overlap_max_words", 30),
+        ({"use_initial_prompt": False}, "_use_initial_prompt", False),
+        ({"min_audio_seconds": 0.5}, "_min_audio_samples", 8000),
+    ])
+    def test_init_custom(self, model_path, kwargs, attr, expected):
+        transcriber = StreamingTranscriber(model_path=model_path, **kwargs)
+        assert getattr(transcriber, attr) == expected
+
+    def test_init_on_update_callback(self, model_path):
+        callback = object()
+        transcriber = StreamingTranscriber(model_path=model_path, on_update=callback)
+        assert transcriber._on_update is callback
 
-    def test_init_custom_silence_commit(self, temp_dir):
-        model_path = temp_dir / "model.bin"
-        transcriber = StreamingTranscriber(model_path=model_path, silence_commit_ms=1000)
-        assert transcriber._silence_commit_seconds == 1.0
+    def test_init_loads_model(self, model_path):
+        with patch('murmur.transcribe.Model') as mock_model:
+            transcriber = StreamingTranscriber(model_path=model_path)
+        mock_model.assert_called_once()
+        assert transcriber._model is mock_model.return_value
 
-    def test_init_default_prompt_max_words(self, temp_dir):
-        model_path = temp_dir / "model.bin"
-        transcriber = StreamingTranscriber(model_path=model_path)
-        assert transcriber._prompt_max_words == 50
+    def test_init_uses_given_model(self, model_path):
+        model = _FakeModel()
+        with patch('murmur.transcribe.Model') as mock_model:
+            transcriber = StreamingTranscriber(model_path=model_path, model=model)
+        mock_model.assert_not_called()
+        assert transcriber._model is model
 
-    def test_init_custom_prompt_max_words(self, temp_dir):
-        model_path = temp_dir / "model.bin"
-        transcriber = StreamingTranscriber(model_path=model_path, prompt_max_words=100)
-        assert transcriber._prompt_max_words == 100
+    def test_init_warns_without_metal(self, model_path):
+        with patch('murmur.transcribe._metal_enabled', return_value=False):
+            with patch('murmur.transcribe.log') as mock_log:
+                StreamingTranscriber(model_path=model_path)
+        mock_log.warning.assert_called_once()
 
-    def test_init_default_overlap_max_words(self, temp_dir):
-        model_path = temp_dir / "model.bin"
+    def test_init_empty_state(self, model_path):
         transcriber = StreamingTranscriber(model_path=model_path)
-        assert transcriber._overlap_max_words == 20
+        assert transcriber._committed_text == ""
+        assert transcriber._pending_text == ""
+        assert transcriber._last_full_text == ""
+        assert transcriber._stability_count == 0
 
-    def test_init_custom_overlap_max_words(self, temp_dir):
-        model_path = temp_dir / "model.bin"
-        transcriber = StreamingTranscriber(model_path=model_path, overlap_max_words=30)
-        assert transcriber._overlap_max_words == 30
 
-    def test_init_default_use_initial_prompt(self, temp_dir):
-        model_path = temp_dir / "model.bin"
-        transcriber = StreamingTranscriber(model_path=model_path)
-        assert transcriber._use_initial_prompt is True
+class TestMetalEnabled:
+    """Test _metal_enabled backend probe."""
 
-    def test_init_custom_use_initial_prompt(self, temp_dir):
-        model_path = temp_dir / "model.bin"
-        transcriber = StreamingTranscriber(model_path=model_path, use_initial_prompt=False)
-        assert transcriber._use_initial_prompt is False
+    def test_legacy_format_enabled(self):
+        with patch('murmur.transcribe.Model') as mock_model:
+            mock_model.system_info.return_value = "AVX = 0 | METAL = 1 | NEON = 1 |"
+            assert _metal_enabled() is True
 
-    def test_init_min_audio_samples(self, temp_dir):
-        model_path = temp_dir / "model.bin"
-        transcriber = StreamingTranscriber(model_path=model_path, min_audio_seconds=0.5)
-        assert transcriber._min_audio_samples == 8000
+    def test_legacy_format_disabled(self):
+        with patch('murmur.transcribe.Model') as mock_model:
+            mock_model.system_info.return_value = "AVX = 0 | METAL = 0 | NEON = 1 |"
+            assert _metal_enabled() is False
 
-    def test_init_on_update_callback(self, temp_dir):
-        model_path = temp_dir / "model.bin"
-        callback = MagicMock()
-        transcriber = StreamingTranscriber(model_path=model_path, on_update=callback)
-        assert transcriber._on_update is callback
+    def test_backend_format_enabled(self):
+        with patch('murmur.transcribe.Model') as mock_model:
+            mock_model.system_info.return_value = "WHISPER : COREML = 0 | Metal : EMBED_LIBRARY = 1 | CPU : NEON = 1 |"
+            assert _metal_enabled() is True
 
-    def test_init_loads_model(self, temp_dir):
-        model_path = temp_dir / "model.bin"
-        pywhispercpp_mock.model.Model.reset_mock()
-        transcriber = StreamingTranscriber(model_path=model_path)
-        pywhispercpp_mock.model.Model.assert_called_once()
-
-    def test_init_empty_state(self, temp_dir):
-        model_path = temp_dir / "model.bin"
-        transcriber = StreamingTranscriber(model_path=model_path)
-        assert transcriber._committed_text == ""
-        assert transcriber._pending_text == ""
-        assert transcriber._last_full_text == ""
-        assert transcriber._stability_count == 0
+    def test_probe_error_reports_disabled(self):
+        with patch('murmur.transcribe.Model') as mock_model:
+            mock_model.system_info.side_effect = RuntimeError
+            assert _metal_enabled() is False
 
 
 class TestStreamingTranscriberReset:
     """Test StreamingTranscriber reset method."""
 
-    def test_reset_clears_committed_text(self, temp_dir):
-        model_path = temp_dir / "model.bin"
-        transcriber = StreamingTranscriber(model_path=model_path)
+    def test_reset_clears_committed_text(self, transcriber):
         transcriber._committed_text = "some text"
         transcriber.reset()
         assert transcriber._committed_text == ""
 
-    def test_reset_clears_pending_text(self, temp_dir):
-        model_path = temp_dir / "model.bin"
-        transcriber = StreamingTranscriber(model_path=model_path)
+    def test_reset_clears_pending_text(self, transcriber):
         transcriber._pending_text = "pending"
         transcriber.reset()
         assert transcriber._pending_text == ""
 
-    def test_reset_clears_last_full_text(self, temp_dir):
-        model_path = temp_dir / "model.bin"
-        transcriber = StreamingTranscriber(model_path=model_path)
+    def test_reset_clears_last_full_text(self, transcriber):
         transcriber._last_full_text = "last"
         transcriber.reset()
         assert transcriber._last_full_text == ""
 
-    def test_reset_clears_stability_count(self, temp_dir):
-        model_path = temp_dir / "model.bin"
-        transcriber = StreamingTranscriber(model_path=model_path)
+    def test_reset_clears_stability_count(self, transcriber):
         transcriber._stability_count = 5
         transcriber.reset()
         assert transcriber._stability_count == 0
@@ -175,28 +221,24 @@ class TestStreamingTranscriberReset:
 class TestStreamingTranscriberProperties:
     """Test StreamingTranscriber properties."""
 
-    def test_committed_text_property(self, temp_dir):
-        model_path = temp_dir / "model.bin"
-        transcriber = StreamingTranscriber(model_path=model_path)
+    def test_committed_text_property(self, transcriber):
         transcriber._committed_text = "committed"
         assert transcriber.committed_text == "committed"
 
-    def test_pending_text_property(self, temp_dir):
-        model_path = temp_dir / "model.bin"
-        transcriber = StreamingTranscriber(model_path=model_path)
+    def test_pending_text_property(self, transcriber):
         transcriber._pending_text = "pending"
         assert transcriber.pending_text == "pending"
 
-    def test_properties_thread_safe(self, temp_dir):
-        model_path = temp_dir / "model.bin"
-        transcriber = StreamingTranscriber(model_path=model_path)
+    def test_properties_concurrent_reads(self, transcriber):
         transcriber._committed_text = "test"
         transcriber._pending_text = "pending"
 
+        barrier = threading.Barrier(3)
         results = []
 
         def read_props():
-            for _ in range(100):
+            barrier.wait()
+            for _ in range(8):
                 results.append((transcriber.committed_text, transcriber.pending_text))
 
         threads = [threading.Thread(target=read_props) for _ in range(3)]
@@ -205,190 +247,177 @@ class TestStreamingTranscriberProperties:
         for t in threads:
             t.join()
 
-        assert len(results) == 300
+        assert results == [("test", "pending")] * 24
 
 
 class TestStreamingTranscriberProcessAudio:
     """Test process_audio method."""
 
-    def test_process_audio_none_returns_none(self, temp_dir):
-        model_path = temp_dir / "model.bin"
-        transcriber = StreamingTranscriber(model_path=model_path)
+    def test_process_audio_none_returns_none(self, transcriber):
         result = transcriber.process_audio(None)
         assert result is None
 
-    def test_process_audio_too_short_returns_none(self, temp_dir):
-        model_path = temp_dir / "model.bin"
+    def test_process_audio_too_short_returns_none(self, model_path):
         transcriber = StreamingTranscriber(model_path=model_path, min_audio_seconds=1.0)
-        short_audio = np.zeros(100, dtype=np.float32)
+        short_audio = _ZEROS_100
         result = transcriber.process_audio(short_audio)
         assert result is None
 
-    def test_process_audio_returns_streaming_result(self, temp_dir):
-        model_path = temp_dir / "model.bin"
-        transcriber = StreamingTranscriber(model_path=model_path)
-
-        mock_model = MagicMock()
-
-        def mock_transcribe(audio, new_segment_callback=None, initial_prompt=None):
-            if new_segment_callback:
-                seg = MagicMock()
-                seg.text = "hello world"
-                new_segment_callback(seg)
-
-        mock_model.transcribe = mock_transcribe
-        transcriber._model = mock_model
-
-        audio = np.zeros(16000, dtype=np.float32)
+    def test_process_audio_returns_streaming_result(self, transcriber):
+        transcriber._model.text = "hello world"
+        audio = _ZEROS_16K
         result = transcriber.process_audio(audio)
         assert isinstance(result, StreamingResult)
 
-    def test_process_audio_is_final_commits_all(self, temp_dir):
-        model_path = temp_dir / "model.bin"
-        transcriber = StreamingTranscriber(model_path=model_path)
-
-        mock_model = MagicMock()
-
-        def mock_transcribe(audio, new_segment_callback=None, initial_prompt=None):
-            if new_segment_callback:
-                seg = MagicMock()
-                seg.text = "final text"
-                new_segment_callback(seg)
-
-        mock_model.transcribe = mock_transcribe
-        transcriber._model = mock_model
+    def test_process_audio_passes_float32_without_copy(self, transcriber):
+        audio = _ZEROS_16K
+        transcriber.process_audio(audio)
+        assert transcriber._model.calls[0][0] is audio
 
-        audio = np.zeros(16000, dtype=np.float32)
+    def test_process_audio_is_final_commits_all(self, transcriber):
+        transcriber._model.text = "final text"
+        audio = _ZEROS_16K
         result = transcriber.process_audio(audio, is_final=True)
         assert result.is_final is True
         assert result.committed_text == "final text"
         assert result.pending_text == ""
 
 
-class TestStreamingTranscriberCleanOutput:
-    """Test _clean_output method."""
+class TestStreamingTranscriberSilentTail:
+    """Test skipping inference when nothing new was said."""
 
-    def test_clean_output_none_returns_none(self, temp_dir):
-        model_path = temp_dir / "model.bin"
-        transcriber = StreamingTranscriber(model_path=model_path)
-        assert transcriber._clean_output(None) is None
-
-    def test_clean_output_empty_returns_none(self, temp_dir):
-        model_path = temp_dir / "model.bin"
-        transcriber = StreamingTranscriber(model_path=model_path)
-        assert transcriber._clean_output("") is None
+    def test_tail_is_silent_for_zeros(self):
+        assert StreamingTranscriber._tail_is_silent(_ZEROS_16K)
 
-    def test_clean_output_whitespace_only_returns_none(self, temp_dir):
-        model_path = temp_dir / "model.bin"
-        transcriber = StreamingTranscriber(model_path=model_path)
-        assert transcriber._clean_output("   ") is None
+    def test_tail_is_not_silent_for_speech_level(self):
+        audio = np.zeros(16000, dtype=np.float32)
+        audio[-4800:] = 0.1
+        assert not StreamingTranscriber._tail_is_silent(audio)
+
+    @staticmethod
+    def _committed(transcriber, text="hello"):
+        """Run one inference that commits `text` at sample count 16000."""
+        transcriber._model.text = text
+        transcriber.process_audio(_ZEROS_16K, silence_duration=1.0, sample_count=16000)
+        assert transcriber.committed_text == text
+
+    def test_no_new_speech_skips_model(self, transcriber):
+        self._committed(transcriber)
+        result = transcriber.process_audio(
+            _ZEROS_16K, silence_duration=1.5, sample_count=24000
+        )
+        assert result is None
+        assert len(transcriber._model.calls) == 1
+        assert transcriber.committed_text == "hello"
+
+    def test_new_speech_before_silent_tail_runs_model(self, transcriber):
+        self._committed(transcriber)
+        # "world" was spoken after the last inference, then 0.5s of silence
+        transcriber._model.text = "hello world"
+        result = transcriber.process_audio(
+            _ZEROS_16K, silence_duration=0.5, sample_count=32000
+        )
+        assert len(transcriber._model.calls) == 2
+        assert result.full_text == "hello world"
 
-    def test_clean_output_removes_brackets(self, temp_dir):
-        model_path = temp_dir / "model.bin"
-        transcriber = StreamingTranscriber(model_path=model_path)
-        result = transcriber._clean_output("hello [noise] world")
-        assert "[noise]" not in result
-        assert "hello" in result
-        assert "world" in result
+    def test_pending_text_is_not_skipped(self, transcriber):
+        transcriber._model.text = "hello"
+        transcriber.process_audio(_ZEROS_16K, sample_count=16000)
+        assert transcriber.pending_text == "hello"
+        result = transcriber.process_audio(
+            _ZEROS_16K, silence_duration=1.0, sample_count=16000
+        )
+        assert result.committed_text == "hello"
 
-    def test_clean_output_removes_music_hallucination(self, temp_dir):
-        model_path = temp_dir / "model.bin"
-        transcriber = StreamingTranscriber(model_path=model_path)
-        result = transcriber._clean_output("(music) hello world")
-        assert "(music)" not in result
-        assert "hello world" in result
+    def test_without_sample_count_runs_model(self, transcriber):
+        self._committed(transcriber)
+        transcriber.process_audio(_ZEROS_16K, silence_duration=1.5)
+        assert len(transcriber._model.calls) == 2
 
-    def test_clean_output_removes_silence_hallucination(self, temp_dir):
-        model_path = temp_dir / "model.bin"
-        transcriber = StreamingTranscriber(model_path=model_path)
-        result = transcriber._clean_output("(silence) test")
-        assert "(silence)" not in result
+    def test_final_pass_always_runs_model(self, transcriber):
+        self._committed(transcriber)
+        transcriber.process_audio(
+            _ZEROS_16K, silence_duration=1.5, is_final=True, sample_count=16000
+        )
+        assert len(transcriber._model.calls) == 2
 
-    def test_clean_output_removes_thank_you(self, temp_dir):
-        model_path = temp_dir / "model.bin"
-        transcriber = StreamingTranscriber(model_path=model_path)
-        result = transcriber._clean_output("Thank you. actual text")
-        assert "Thank you." not in result
 
-    def test_clean_output_removes_blank_audio(self, temp_dir):
-        model_path = temp_dir / "model.bin"
-        transcriber = StreamingTranscriber(model_path=model_path)
-        result = transcriber._clean_output("[BLANK_AUDIO] text")
-        assert "[BLANK_AUDIO]" not in result
+class TestStreamingTranscriberCleanOutput:
+    """Test _clean_output method."""
 
-    def test_clean_output_normalizes_whitespace(self, temp_dir):
-        model_path = temp_dir / "model.bin"
-        transcriber = StreamingTranscriber(model_path=model_path)
-        result = transcriber._clean_output("hello    world")
-        assert result == "hello world"
+    @pytest.mark.parametrize("raw,expected", [
+        (None, None),
+        ("", None),
+        ("   ", None),
+        ("hello [noise] world", "hello world"),
+        ("(music) hello world", "hello world"),
+        ("(silence) test", "test"),
+        ("Thank you. actual text", "actual text"),
+        ("[BLANK_AUDIO] text", "text"),
+        ("hello    world", "hello world"),
+    ])
+    def test_clean_output(self, transcriber, raw, expected):
+        assert transcriber._clean_output(raw) == expected
 
 
 class TestStreamingTranscriberMergeWithCommitted:
     """Test _merge_with_committed method."""
 
-    def test_merge_empty_committed_returns_new(self, temp_dir):
-        model_path = temp_dir / "model.bin"
-        transcriber = StreamingTranscriber(model_path=model_path)
-        result = transcriber._merge_with_committed("", "new text")
-        assert result == "new text"
-
-    def test_merge_empty_new_returns_committed(self, temp_dir):
-        model_path = temp_dir / "model.bin"
-        transcriber = StreamingTranscriber(model_path=model_path)
-        result = transcriber._merge_with_committed("committed", "")
-        assert result == "committed"
-
-    def test_merge_new_starts_with_committed(self, temp_dir):
-        model_path = temp_dir / "model.bin"
-        transcriber = StreamingTranscriber(model_path=model_path)
-        result = transcriber._merge_with_committed("hello", "hello world")
-        assert result == "hello world"
-
-    def test_merge_finds_word_overlap(self, temp_dir):
-        model_path = temp_dir / "model.bin"
-        transcriber = StreamingTranscriber(model_path=model_path)
-        result = transcriber._merge_with_committed("hello world", "world how are you")
-        assert "hello world how are you" in result
-
-    def test_merge_no_overlap_appends(self, temp_dir):
-        model_path = temp_dir / "model.bin"
-        transcriber = StreamingTranscriber(model_path=model_path)
-        result = transcriber._merge_with_committed("abc", "xyz")
-        assert result == "abc xyz"
+    @pytest.mark.parametrize("committed,new_text,expected", [
+        ("", "new text", "new text"),
+        ("committed", "", "committed"),
+        ("hello", "hello world", "hello world"),
+        ("hello world", "world how are you", "hello world how are you"),
+        ("abc", "xyz", "abc xyz"),
+    ])
+    def test_merge(self, transcriber, committed, new_text, expected):
+        assert transcriber._merge_with_committed(committed, new_text) == expected
+
+    def test_merge_overlap_limited_to_tail_words(self, model_path):
+        transcriber = StreamingTranscriber(model_path=model_path, overlap_max_words=2)
+        committed = " ".join(f"w{i}" for i in range(100))
+        result = transcriber._merge_with_committed(committed, "w98 w99 next")
+        assert result == committed + " next"
+
+    def test_prompt_uses_last_committed_words(self, model_path):
+        transcriber = StreamingTranscriber(model_path=model_path, prompt_max_words=3)
+        transcriber._committed_text = " ".join(f"w{i}" for i in range(100))
+        transcriber._model = _FakeModel()
+        transcriber._transcribe(_ZEROS_16K)
+        assert [prompt for _, prompt in transcriber._model.calls] == ["w97 w98 w99"]
+
+    def test_prompt_cached_per_committed_text(self, transcriber):
+        committed = "hello world"
+        assert transcriber._prompt_for(committed) == "hello world"
+        assert transcriber._prompt_cache[0] is committed
+        assert transcriber._prompt_for("") is None
 
 
 class TestStreamingTranscriberUpdateStability:
     """Test _update_stability method."""
 
-    def test_update_stability_increments_on_same_text(self, temp_dir):
-        model_path = temp_dir / "model.bin"
-        transcriber = StreamingTranscriber(model_path=model_path)
+    def test_update_stability_increments_on_same_text(self, transcriber):
         transcriber._last_full_text = "same text"
         transcriber._stability_count = 0
 
         transcriber._update_stability("same text", silence_duration=0.0, is_final=False)
         assert transcriber._stability_count == 1
 
-    def test_update_stability_resets_on_different_text(self, temp_dir):
-        model_path = temp_dir / "model.bin"
-        transcriber = StreamingTranscriber(model_path=model_path)
+    def test_update_stability_resets_on_different_text(self, transcriber):
         transcriber._last_full_text = "old text"
         transcriber._stability_count = 5
 
         transcriber._update_stability("new text", silence_duration=0.0, is_final=False)
         assert transcriber._stability_count == 0
 
-    def test_update_stability_commits_on_threshold(self, temp_dir):
-        model_path = temp_dir / "model.bin"
-        transcriber = StreamingTranscriber(model_path=model_path, stability_count=2)
+    def test_update_stability_commits_on_threshold(self, transcriber):
         transcriber._last_full_text = "stable text"
         transcriber._stability_count = 1
 
         result = transcriber._update_stability("stable text", silence_duration=0.0, is_final=False)
         assert transcriber._committed_text == "stable text"
 
-    def test_update_stability_commits_on_silence(self, temp_dir):
-        model_path = temp_dir / "model.bin"
+    def test_update_stability_commits_on_silence(self, model_path):
         transcriber = StreamingTranscriber(model_path=model_path, silence_commit_ms=500)
         transcriber._last_full_text = ""
         transcriber._stability_count = 0
@@ -396,25 +425,22 @@ class TestStreamingTranscriberUpdateStability:
         result = transcriber._update_stability("silent commit", silence_duration=0.6, is_final=False)
         assert transcriber._committed_text == "silent commit"
 
-    def test_update_stability_final_commits_all(self, temp_dir):
-        model_path = temp_dir / "model.bin"
-        transcriber = StreamingTranscriber(model_path=model_path)
+    def test_update_stability_final_commits_all(self, transcriber):
 
         result = transcriber._update_stability("final text", silence_duration=0.0, is_final=True)
         assert result.is_final is True
         assert result.committed_text == "final text"
         assert result.pending_text == ""
 
-    def test_update_stability_calls_on_update(self, temp_dir):
-        model_path = temp_dir / "model.bin"
-        callback = MagicMock()
-        transcriber = StreamingTranscriber(model_path=model_path, on_update=callback)
+    def test_update_stability_calls_on_update(self, model_path):
+        updates = []
+        transcriber = StreamingTranscriber(model_path=model_path, on_update=updates.append)
 
         transcriber._update_stability("some text", silence_duration=0.0, is_final=False)
-        callback.assert_called_once()
+        assert len(updates) == 1
+        assert updates[0].full_text == "some text"
 
-    def test_update_stability_sets_pending_text(self, temp_dir):
-        model_path = temp_dir / "model.bin"
+    def test_update_stability_sets_pending_text(self, model_path):
         transcriber = StreamingTranscriber(model_path=model_path, stability_count=10)
         transcriber._committed_text = "hello"
         transcriber._last_full_text = ""